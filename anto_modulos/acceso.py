@@ -1,19 +1,54 @@
 # anto_modulos/acceso.py
 # Control de acceso al módulo Proveedores.
 #
-# Usa dbo.Perfil_usuario_new (sin parámetros — toma suser_sname() internamente).
-# Columna "area": 720002 → el usuario cumple ambas condiciones (grupo + área activa).
+# evaluar_permisos() corre las condiciones configuradas en CONDICIONES en un
+# solo lote (un EXEC por condición, varios conjuntos de resultados) sobre una
+# conexión del pool y devuelve una DecisionAcceso:
+#
+#   "grupo"   dbo.Tiene_permiso @GrupoNT  → columna "puede" (miembro del grupo NT)
+#   "area"    dbo.TieneNomen              → AREA_REQUERIDA entre las áreas activas
+#   "perfil"  dbo.Perfil_usuario_new      → columna "area" == AREA_REQUERIDA
+#             (720002 → cumple grupo + área activa + imprime)
+#
+# Los tres SP no reciben el usuario: usan suser_sname() de la sesión
+# Trusted_Connection.
+#
+# Una decisión positiva deja un ticket local firmado y con vencimiento (ver
+# anto_modulos/ticket_acceso.py). Mientras esté vigente, verificar_acceso
+# responde sin esperar al SP y lo vuelve a consultar en segundo plano; si ese
+# refresco deniega, se borra el ticket y se avisa vía refresco_pendiente().
 #
 # Para probar la ventana de acceso denegado con tu usuario,
 # descomentá la línea FORZAR_DENEGADO = True más abajo.
 
 from __future__ import annotations
 import getpass
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from anto_modulos.anto_conexion import obtener_conexion
+from anto_modulos import ticket_acceso
+from anto_modulos.anto_conexion import conexion
+from anto_modulos.registro import obtener_logger
+from anto_modulos.tiempos import fase, marcar_error, medido
+
+log = obtener_logger(__name__)
 
 # ─── Configuración ────────────────────────────────────────────────────────────
 AREA_REQUERIDA = 720002   # valor numérico esperado en columna "area"
+GRUPO_REQUERIDO = "Gestion"   # Ajustar si requiere prefijo: "DOMINIO\\Gestion"
+
+# Condiciones que deben cumplirse TODAS. Perfil_usuario_new ya resume grupo +
+# área, así que en producción alcanza con "perfil"; test_permisos.py evalúa las tres.
+CONDICIONES: Tuple[str, ...] = ("perfil",)
+
+CONDICIONES_SQL = {
+    "grupo": "EXEC dbo.Tiene_permiso @GrupoNT = ?;",
+    "area": "EXEC dbo.TieneNomen;",
+    "perfil": "EXEC dbo.Perfil_usuario_new;",
+}
 
 # ─── Override de prueba ───────────────────────────────────────────────────────
 # Descomentá para forzar acceso DENEGADO independientemente del usuario real:
@@ -21,42 +56,194 @@ AREA_REQUERIDA = 720002   # valor numérico esperado en columna "area"
 FORZAR_DENEGADO = False
 # ─────────────────────────────────────────────────────────────────────────────
 
+_refresco: Optional[Future] = None
+
+
+class ErrorAcceso(Exception):
+    """No se pudo evaluar el acceso (no es una denegación)."""
+
+
+@dataclass(frozen=True)
+class DecisionAcceso:
+    usuario: str
+    permitido: bool
+    grupo: Optional[bool] = None        # None: no evaluado o sin dato
+    area: Optional[bool] = None
+    perfil_ok: Optional[bool] = None
+    perfil: Dict[str, Any] = field(default_factory=dict)
+    areas: Tuple[Dict[str, Any], ...] = ()
+    ms: float = 0.0
+    error: Optional[str] = None
 
-def verificar_acceso() -> tuple[bool, str, dict]:
+    @property
+    def detalle(self) -> str:
+        marca = {True: "sí", False: "no", None: "—"}
+        return f"grupo {marca[self.grupo]}, área {marca[self.area]}, perfil {marca[self.perfil_ok]}"
+
+    def como_tupla(self) -> tuple[bool, str, dict]:
+        return self.permitido, self.usuario, dict(self.perfil)
+
+    def __str__(self) -> str:
+        estado = "PERMITIDO" if self.permitido else "DENEGADO"
+        if self.error:
+            estado += f" (error: {self.error})"
+        return f"{self.usuario}: {estado} — {self.detalle} — {self.ms:.0f} ms"
+
+
+def verificar_acceso(usar_ticket: bool = True) -> tuple[bool, str, dict]:
     """
-    Llama a dbo.Perfil_usuario_new y verifica si la columna "area" == 720002.
+    Decide si el usuario tiene acceso: con un ticket vigente responde al
+    instante y refresca en segundo plano; si no, evalúa los permisos.
 
     Retorna:
         (tiene_acceso: bool, usuario: str, perfil: dict)
         perfil contiene los datos devueltos por el SP (vacío si no hay registro).
     """
+    global _refresco
     usuario = getpass.getuser()
 
     if FORZAR_DENEGADO:
-        print(f"[acceso] FORZAR_DENEGADO activo — acceso denegado para {usuario}")
+        log.warning("FORZAR_DENEGADO activo — acceso denegado para %s", usuario)
         return False, usuario, {}
 
+    if usar_ticket:
+        perfil = ticket_acceso.vigente(usuario)
+        if perfil is not None:
+            log.info("Usuario %s → PERMITIDO (ticket vigente; se refresca en segundo plano)", usuario)
+            _refresco = Future()
+            threading.Thread(
+                target=_refrescar, args=(_refresco,), name="acceso-refresco", daemon=True
+            ).start()
+            return True, usuario, perfil
+
+    return evaluar_permisos(registrar_ticket=True).como_tupla()
+
+
+def refresco_pendiente() -> Optional[Future]:
+    """
+    Future del refresco en segundo plano de la última decisión tomada con ticket
+    (None si se consultó el SP directamente). Su resultado es la misma tupla que
+    verificar_acceso: si dice DENEGADO, el acceso fue revocado. Si el servidor no
+    respondió termina con ErrorAcceso.
+    """
+    return _refresco
+
+
+def _refrescar(futuro: Future) -> None:
+    if not futuro.set_running_or_notify_cancel():
+        return
     try:
-        conn = obtener_conexion()
-        cursor = conn.cursor()
-        cursor.execute("EXEC dbo.Perfil_usuario_new")
-        row = cursor.fetchone()
-        cols = [col[0] for col in cursor.description] if cursor.description else []
-        cursor.close()
-        conn.close()
-    except Exception as e:
-        print(f"[acceso] Error al ejecutar Perfil_usuario_new: {e}")
-        return False, usuario, {}
+        futuro.set_result(consultar_acceso())
+    except Exception as e:  # ErrorAcceso: sin respuesta no hay revocación, el ticket sigue valiendo
+        futuro.set_exception(e)
 
-    if row is None:
-        print(f"[acceso] Sin registro de perfil para {usuario} → DENEGADO")
-        return False, usuario, {}
 
-    perfil = dict(zip(cols, row))
-    area_valor = perfil.get("area", 0)
+def consultar_acceso() -> tuple[bool, str, dict]:
+    """
+    evaluar_permisos() en el formato (tiene_acceso, usuario, perfil) de
+    verificar_acceso. Si el servidor no respondió lanza ErrorAcceso en lugar
+    de devolver una denegación.
+    """
+    decision = evaluar_permisos(registrar_ticket=True)
+    if decision.error is not None:
+        raise ErrorAcceso(decision.error)
+    return decision.como_tupla()
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Evaluación de condiciones en un solo lote
+# ─────────────────────────────────────────────────────────────────────
+def sql_permisos(condiciones: Sequence[str] = CONDICIONES) -> Tuple[str, List[Any]]:
+    """Lote con un EXEC por condición (en el orden de CONDICIONES_SQL) y sus parámetros."""
+    if not condiciones:
+        raise ValueError("Se requiere al menos una condición de acceso")
+    desconocidas = set(condiciones) - set(CONDICIONES_SQL)
+    if desconocidas:
+        raise ValueError(f"Condiciones desconocidas: {sorted(desconocidas)}")
+    sentencias, parametros = ["SET NOCOUNT ON;"], []
+    for nombre, sql in CONDICIONES_SQL.items():
+        if nombre in condiciones:
+            sentencias.append(sql)
+            parametros += [GRUPO_REQUERIDO] * sql.count("?")
+    return "\n".join(sentencias), parametros
+
+
+def _siguiente_resultado(cursor, primero: bool) -> Tuple[List[str], list]:
+    """Columnas y filas del próximo conjunto de resultados (salta los que no traen filas)."""
+    if not primero and not cursor.nextset():
+        raise ErrorAcceso("El lote de permisos devolvió menos resultados que condiciones")
+    while cursor.description is None:
+        if not cursor.nextset():
+            raise ErrorAcceso("El lote de permisos devolvió menos resultados que condiciones")
+    return [col[0] for col in cursor.description], cursor.fetchall()
+
+
+@medido()
+def evaluar_permisos(
+    condiciones: Sequence[str] = CONDICIONES, registrar_ticket: bool = False
+) -> DecisionAcceso:
+    """
+    Evalúa ``condiciones`` (de "grupo", "area", "perfil") en un único lote sobre
+    una conexión del pool. Permitido solo si se cumplen todas.
+
+    Con ``registrar_ticket`` (solo el control de acceso de la aplicación) emite
+    el ticket si el acceso se permite y lo borra si se deniega; un error de
+    conexión no toca el ticket (no es una revocación). Los diagnósticos lo
+    dejan en False para no modificar el ticket.
+    """
+    usuario = getpass.getuser()
+    t0 = time.perf_counter()
+    valores: Dict[str, Any] = {}
+    try:
+        sql, parametros = sql_permisos(condiciones)
+        with conexion() as conn:
+            cursor = conn.cursor()
+            try:
+                with fase("execute"):
+                    cursor.execute(sql, parametros)
+                with fase("fetch"):
+                    for i, nombre in enumerate(c for c in CONDICIONES_SQL if c in condiciones):
+                        valores[nombre] = _siguiente_resultado(cursor, primero=(i == 0))
+            finally:
+                cursor.close()
+    except Exception as e:
+        marcar_error(e)
+        log.error("Error al evaluar permisos (%s): %s", ", ".join(condiciones), e)
+        return DecisionAcceso(
+            usuario=usuario, permitido=False, ms=(time.perf_counter() - t0) * 1000, error=str(e)
+        )
+
+    grupo = area = perfil_ok = None
+    areas: Tuple[Dict[str, Any], ...] = ()
+    perfil: Dict[str, Any] = {}
+    if "grupo" in valores:
+        _, filas = valores["grupo"]
+        puede = filas[0][0] if filas else None  # columna "puede"
+        grupo = None if puede is None else bool(puede)
+    if "area" in valores:
+        cols, filas = valores["area"]
+        areas = tuple(dict(zip(cols, fila)) for fila in filas)
+        area = any(str(a.get("cod_nomen", "")).strip() == str(AREA_REQUERIDA) for a in areas)
+    if "perfil" in valores:
+        cols, filas = valores["perfil"]
+        perfil = dict(zip(cols, filas[0])) if filas else {}
+        perfil_ok = perfil.get("area", 0) == AREA_REQUERIDA
 
-    acceso = (area_valor == AREA_REQUERIDA)
-    print(f"[acceso] Usuario : {usuario}")
-    print(f"[acceso] Perfil  : {perfil}")
-    print(f"[acceso] area    : {area_valor}  →  {'PERMITIDO' if acceso else 'DENEGADO'}")
-    return acceso, usuario, perfil
+    resultados = {"grupo": grupo, "area": area, "perfil": perfil_ok}
+    decision = DecisionAcceso(
+        usuario=usuario,
+        permitido=all(resultados[c] for c in condiciones),
+        grupo=grupo, area=area, perfil_ok=perfil_ok,
+        perfil=perfil, areas=areas,
+        ms=(time.perf_counter() - t0) * 1000,
+    )
+    log.info("Usuario %s, %s → %s (%.0f ms)", usuario, decision.detalle,
+             "PERMITIDO" if decision.permitido else "DENEGADO", decision.ms)
+    log.debug("Perfil: %r", perfil)
+    if not registrar_ticket:
+        return decision
+    if decision.permitido:
+        ticket_acceso.emitir(usuario, perfil)
+    else:
+        ticket_acceso.revocar()
+    return decision
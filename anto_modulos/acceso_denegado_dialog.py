@@ -1,15 +1,24 @@
 # anto_modulos/acceso_denegado_dialog.py
 # Ventana de acceso denegado con tema coherente con la aplicación.
+#
+# El GIF no se decodifica al construir el diálogo: el lugar se reserva con el
+# tamaño leído del encabezado y la animación (compartida, ver
+# resources.animacion) arranca después del primer pintado y se detiene al cerrar.
 
 from __future__ import annotations
 import os
-from PyQt5.QtCore import Qt, QSize
-from PyQt5.QtGui import QFont, QMovie, QIcon, QPixmap
+from typing import Optional
+
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QFont, QMovie
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QPushButton, QHBoxLayout,
 )
 
-from anto_modulos.resources import GIF_DENEGADO, ICON_MAIN
+from anto_modulos.resources import GIF_DENEGADO, ICON_MAIN, animacion, icono, pixmap, tamano_imagen
+
+ALTO_GIF = 150
+ALTO_ICONO = 36
 
 _NO_HELP      = Qt.WindowType.WindowContextHelpButtonHint  # type: ignore[attr-defined]
 _ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter               # type: ignore[attr-defined]
@@ -28,27 +37,21 @@ class AccesoDenegadoDialog(QDialog):
 
         # Ícono de la barra de título
         if os.path.isfile(ICON_MAIN):
-            self.setWindowIcon(QIcon(ICON_MAIN))
+            self.setWindowIcon(icono(ICON_MAIN))
 
         layout = QVBoxLayout(self)
         layout.setSpacing(12)
         layout.setContentsMargins(28, 20, 28, 24)
 
-        # ── GIF animado ──
-        gif_label = QLabel(self)
-        gif_label.setAlignment(_ALIGN_CENTER)
+        # ── GIF animado (se carga en showEvent) ──
+        self._movie: Optional[QMovie] = None
+        self._gif_label = QLabel(self)
+        self._gif_label.setAlignment(_ALIGN_CENTER)
         if os.path.isfile(GIF_DENEGADO):
-            self._movie = QMovie(GIF_DENEGADO)
-            # Escalar a altura fija (150px) manteniendo proporción
-            self._movie.jumpToFrame(0)
-            orig = self._movie.currentPixmap().size()
-            if orig.height() > 0:
-                target_h = 150
-                target_w = int(orig.width() * target_h / orig.height())
-                self._movie.setScaledSize(QSize(target_w, target_h))
-            gif_label.setMovie(self._movie)
-            self._movie.start()
-        layout.addWidget(gif_label)
+            tamano = tamano_imagen(GIF_DENEGADO, ALTO_GIF)
+            if tamano.isValid():
+                self._gif_label.setFixedHeight(tamano.height())
+        layout.addWidget(self._gif_label)
 
         # ── Título con ícono ──
         titulo_row = QHBoxLayout()
@@ -56,12 +59,7 @@ class AccesoDenegadoDialog(QDialog):
 
         if os.path.isfile(ICON_MAIN):
             icono_label = QLabel(self)
-            pix = QPixmap(ICON_MAIN).scaled(
-                36, 36,
-                Qt.AspectRatioMode.KeepAspectRatio,          # type: ignore[attr-defined]
-                Qt.TransformationMode.SmoothTransformation,  # type: ignore[attr-defined]
-            )
-            icono_label.setPixmap(pix)
+            icono_label.setPixmap(pixmap(ICON_MAIN, ALTO_ICONO))
             titulo_row.addStretch()
             titulo_row.addWidget(icono_label)
 
@@ -91,7 +89,7 @@ class AccesoDenegadoDialog(QDialog):
         # ── Datos del perfil (si los hay) ──
         if perfil:
             sep = QLabel("Datos de perfil del usuario:", self)
-            sep.setStyleSheet("color: #8d99ae; font-size: 12px;")
+            sep.setProperty("secundario", True)
             layout.addWidget(sep)
 
             campos = [
@@ -104,13 +102,13 @@ class AccesoDenegadoDialog(QDialog):
             for etiqueta, valor in campos:
                 item = QLabel(f"  <b>{etiqueta}:</b>  {valor}", self)
                 item.setTextFormat(_RICH_TEXT)
-                item.setStyleSheet("font-size: 12px;")
+                item.setProperty("chico", True)
                 layout.addWidget(item)
         else:
             sin_perfil = QLabel(
                 "No se encontró perfil de usuario en el sistema.", self
             )
-            sin_perfil.setStyleSheet("color: #8d99ae; font-size: 12px;")
+            sin_perfil.setProperty("secundario", True)
             layout.addWidget(sin_perfil)
 
         layout.addSpacing(8)
@@ -123,3 +121,24 @@ class AccesoDenegadoDialog(QDialog):
         btn_row.addStretch()
         btn_row.addWidget(btn_cerrar)
         layout.addLayout(btn_row)
+
+    # ── Animación ──
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if self._movie is None and os.path.isfile(GIF_DENEGADO):
+            QTimer.singleShot(0, self._iniciar_animacion)  # después del primer pintado
+
+    def _iniciar_animacion(self) -> None:
+        if not self.isVisible():
+            return
+        self._movie = animacion(GIF_DENEGADO, ALTO_GIF)
+        self._gif_label.setMovie(self._movie)
+        self._movie.start()
+
+    def hideEvent(self, event) -> None:
+        if self._movie is not None:
+            self._movie.stop()
+            self._gif_label.setMovie(None)
+            self._movie = None
+        super().hideEvent(event)
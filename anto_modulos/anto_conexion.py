@@ -1,167 +1,380 @@
 # anto_conexion.py
 
 
-import pyodbc
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 
-drivers = [
-        'SQL Server Native Client 11.0',  # Native Client version 11
-        'SQL Server Native Client 10.0',  # Native Client version 10
-        'SQL Server',  # Generic ODBC driver name (legacy)
-    ]
+from anto_modulos.cache_lru import CacheLRU
+from anto_modulos.diferido import ModuloDiferido
+from anto_modulos.odbc_drivers import conectar
+from anto_modulos.pool_conexiones import PoolConexiones
+from anto_modulos.registro import obtener_logger
+from anto_modulos.tiempos import fase, marcar_error, medido
+
+log = obtener_logger(__name__)
+pyodbc = ModuloDiferido("pyodbc")  # se importa en la primera conexión (ver diferido.py)
+
+# ─── Pool de conexiones ───────────────────────────────────────────────────────
+POOL_MIN = 1              # conexiones que se mantienen abiertas aunque estén ociosas
+POOL_MAX = 4              # tope de conexiones simultáneas
+POOL_MAX_OCIOSO_S = 300   # se cierran las que sobren del mínimo tras 5 min sin uso
+POOL_VERIFICAR_TRAS_S = 30  # "SELECT 1" en checkout si la conexión estuvo ociosa más que esto
+# Procedimientos que solo leen: su EXEC no obliga a un rollback al devolver la conexión
+PROCEDIMIENTOS_SOLO_LECTURA = (
+    "AntoSync_Proveedores", "AntoPage_Proveedores", "AntoCatalogos_Proveedores",
+    "Tiene_permiso", "TieneNomen", "Perfil_usuario_new",
+)
+
+# ─── Cache de proveedores (lecturas por CUIL) ─────────────────────────────────
+CACHE_MAX_ENTRADAS = 256  # proveedores recientes en memoria (LRU)
+CACHE_TTL_S = 300         # vencimiento de cada entrada (segundos)
+
+_pool = None
+_pool_lock = threading.Lock()
+_cache_proveedores = CacheLRU(CACHE_MAX_ENTRADAS, CACHE_TTL_S)
+_replica = None  # ReplicaProveedores opcional (ver replica_local.py)
+
+
+def _obtener_pool() -> PoolConexiones:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = PoolConexiones(
+                    _abrir_conexion,
+                    min_size=POOL_MIN,
+                    max_size=POOL_MAX,
+                    max_ocioso_s=POOL_MAX_OCIOSO_S,
+                    verificar_tras_s=POOL_VERIFICAR_TRAS_S,
+                    procedimientos_lectura=PROCEDIMIENTOS_SOLO_LECTURA,
+                )
+    return _pool
+
 
 def obtener_conexion():
-    # Configura la conexión a la base de datos SQL Server.
-    server = 'SQL01'
-    database = 'Gestion'
+    """
+    Presta una conexión del pool. ``close()`` la devuelve al pool en lugar de
+    cerrarla, por lo que el patrón ``conn = obtener_conexion() ... conn.close()``
+    sigue siendo válido.
+    """
+    with fase("connect"):
+        return _obtener_pool().obtener()
+
+
+@contextmanager
+def conexion():
+    """``with conexion() as conn:`` — presta una conexión y la devuelve al salir."""
+    with fase("connect"):
+        conn = _obtener_pool().obtener()
+    try:
+        yield conn
+    finally:
+        conn.close()  # _devolver() hace rollback si hubo escrituras sin confirmar
+
+
+@medido()
+def calentar_pool() -> int:
+    """Abre por adelantado las conexiones mínimas del pool."""
+    return _obtener_pool().calentar()
+
+
+def estadisticas_pool() -> dict:
+    """Hits/misses y ocupación del pool (ver PoolConexiones.estadisticas)."""
+    return _obtener_pool().estadisticas()
+
+
+def cerrar_pool() -> None:
+    """Cierra el pool; las conexiones prestadas se cierran al devolverse."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.cerrar()
+
 
-    for driver in drivers:
-        conexion_str = (
-            f"DRIVER={{{driver}}};"
-            f"SERVER={server};"
-            f"DATABASE={database};"
-            "Trusted_Connection=yes;"
-        )
+def configurar_replica(replica) -> None:
+    """Registra una réplica local que buscar_proveedor() consulta antes que SQL01."""
+    global _replica
+    _replica = replica
+
+
+def invalidar_lecturas(cuil) -> None:
+    """Tras escribir un CUIL: sacarlo del cache y de la réplica local."""
+    _cache_proveedores.invalidar(cuil)
+    if _replica is not None:
         try:
-            print(f"Intentando conectar con el driver: {driver}")
-            conexion = pyodbc.connect(conexion_str)
-            print(f"Conexión exitosa con el driver: {driver}")
-            return conexion
-        except pyodbc.Error as error:
-            print(f"Error al intentar conectar con el driver: {driver}")
-            print(error)
-    
-    raise Exception("No se pudo conectar a la base de datos con ninguno de los drivers disponibles.")
+            _replica.invalidar(cuil)
+        except Exception as e:
+            log.warning("No se pudo invalidar %s en la réplica: %s", cuil, e)
+
+
+def estadisticas_cache() -> dict:
+    """Hits, misses, ratio y desalojos del cache de proveedores."""
+    return _cache_proveedores.estadisticas()
 
 
+def invalidar_cache(cuil=None) -> None:
+    """Descarta del cache un CUIL (o todo el cache si no se indica)."""
+    if cuil is None:
+        _cache_proveedores.limpiar()
+    else:
+        _cache_proveedores.invalidar(cuil)
+
+
+def _abrir_conexion():
+    # Configura la conexión a la base de datos SQL Server.
+    # El driver se resuelve una sola vez y queda cacheado (ver odbc_drivers.py).
+    server = 'SQL01'
+    database = 'Gestion'
+    with fase("login"):  # conexión nueva: resolución de driver + autenticación
+        return conectar(server, database)
 
 
+@medido()
 def actualizar_registro(cuil, razon_social, provincia, localidad, calle, calle_nro, dpto, piso, email,
                         condicion_cta, condicion_afip, condicion_dgr, condicion_gcia,
                         condicion_empleador, forma_juridica, fecha_ult_lib_deuda):
     try:
-        # Obtiene la conexión usando tu método
-        conn = obtener_conexion()
-        cursor = conn.cursor()
-        
         # Conversión de fecha (None si no se informó libre de deuda)
         fecha_ult_lib_deuda_dt = datetime.strptime(fecha_ult_lib_deuda, "%Y-%m-%d") if fecha_ult_lib_deuda else None
-        
-        # Llama al procedimiento almacenado
-        cursor.execute("""
-            EXEC dbo.AntoUpdate_Proveedores
-                @RAZON_SOCIAL = ?, 
-                @CUIL = ?, 
-                @PROVINCIA = ?, 
-                @LOCALIDAD = ?, 
-                @CALLE = ?, 
-                @CALLE_NRO = ?, 
-                @DPTO = ?, 
-                @PISO = ?, 
-                @EMAIL = ?, 
-                @CONDICION_CTA = ?, 
-                @CONDICION_EN_AFIP = ?, 
-                @CONDICION_DGR = ?, 
-                @CONDICION_GCIA = ?, 
-                @CONDICION_EMPLEADOR = ?, 
-                @FORMA_JURIDICA = ?, 
-                @FECHA_ULT_LIB_DEUDA = ?, 
-                @DNI_DESDE_CUIT = NULL
-        """, (
-            razon_social, cuil, provincia, localidad, calle, calle_nro, dpto, piso, email,
-            condicion_cta, condicion_afip, condicion_dgr, condicion_gcia,
-            condicion_empleador, forma_juridica, fecha_ult_lib_deuda_dt
-        ))
-        
-        # Guarda los cambios
-        conn.commit()
-        
+
+        with conexion() as conn:
+            cursor = conn.cursor()
+            # Llama al procedimiento almacenado
+            with fase("execute"):
+                cursor.execute("""
+                EXEC dbo.AntoUpdate_Proveedores
+                    @RAZON_SOCIAL = ?, 
+                    @CUIL = ?, 
+                    @PROVINCIA = ?, 
+                    @LOCALIDAD = ?, 
+                    @CALLE = ?, 
+                    @CALLE_NRO = ?, 
+                    @DPTO = ?, 
+                    @PISO = ?, 
+                    @EMAIL = ?, 
+                    @CONDICION_CTA = ?, 
+                    @CONDICION_EN_AFIP = ?, 
+                    @CONDICION_DGR = ?, 
+                    @CONDICION_GCIA = ?, 
+                    @CONDICION_EMPLEADOR = ?, 
+                    @FORMA_JURIDICA = ?, 
+                    @FECHA_ULT_LIB_DEUDA = ?, 
+                    @DNI_DESDE_CUIT = NULL
+                """, (
+                    razon_social, cuil, provincia, localidad, calle, calle_nro, dpto, piso, email,
+                    condicion_cta, condicion_afip, condicion_dgr, condicion_gcia,
+                    condicion_empleador, forma_juridica, fecha_ult_lib_deuda_dt
+                ))
+
+                # Guarda los cambios
+                conn.commit()
+            cursor.close()
+
+        invalidar_lecturas(cuil)
         return True  # Devuelve True si la operación fue exitosa
     except pyodbc.Error as e:
-        print("Error al ejecutar el procedimiento:", e)
+        marcar_error(e)
+        log.error("Error al ejecutar AntoUpdate_Proveedores: %s", e)
         return False  # Devuelve False si hubo un error
-    finally:
-        cursor.close()
-        conn.close()
 
 
+@medido()
+def actualizar_campos(cuil, cambios: dict) -> bool:
+    """
+    Actualiza solo las columnas de ``cambios`` (clave del formulario → valor) con
+    dbo.AntoUpdateParcial_Proveedores. Las claves deben estar en COLUMNAS_PROVEEDOR.
+    """
+    columna_de = dict(COLUMNAS_PROVEEDOR)
+    desconocidas = set(cambios) - set(columna_de)
+    if desconocidas:
+        raise ValueError(f"Campos no actualizables: {sorted(desconocidas)}")
+    if not cambios:
+        return True
 
+    columnas, valores = [], []
+    for clave, valor in cambios.items():
+        if clave == "fecha_ult_lib_deuda" and valor:
+            valor = datetime.strptime(valor, "%Y-%m-%d")
+        columnas.append(columna_de[clave])
+        valores.append(valor)
+    sql = (
+        "EXEC dbo.AntoUpdateParcial_Proveedores @CUIL = ?, @COLUMNAS = ?, "
+        + ", ".join(f"@{col} = ?" for col in columnas)
+    )
+    try:
+        with conexion() as conn:
+            cursor = conn.cursor()
+            with fase("execute"):
+                cursor.execute(sql, [cuil, "|" + "|".join(columnas) + "|"] + valores)
+                conn.commit()
+            cursor.close()
+        invalidar_lecturas(cuil)
+        return True
+    except pyodbc.Error as e:
+        marcar_error(e)
+        log.error("Error al ejecutar AntoUpdateParcial_Proveedores: %s", e)
+        return False
 
 
-# anto_conexion.py
+# Columnas de Proveedores leídas por la app → clave usada en los diccionarios del formulario
+COLUMNAS_PROVEEDOR = (
+    ("razon_social", "RAZON_SOCIAL"),
+    ("provincia", "PROVINCIA"),
+    ("localidad", "LOCALIDAD"),
+    ("calle", "CALLE"),
+    ("calle_nro", "CALLE_NRO"),
+    ("dpto", "DPTO"),
+    ("piso", "PISO"),
+    ("email", "EMAIL"),
+    ("condicion_cta", "CONDICION_CTA"),
+    ("condicion_afip", "CONDICION_EN_AFIP"),
+    ("condicion_dgr", "CONDICION_DGR"),
+    ("condicion_gcia", "CONDICION_GCIA"),
+    ("condicion_empleador", "CONDICION_EMPLEADOR"),
+    ("forma_juridica", "FORMA_JURIDICA"),
+    ("fecha_ult_lib_deuda", "FECHA_ULT_LIB_DEUDA"),
+)
+
+_SQL_PROVEEDOR_POR_CUIL = (
+    "SELECT " + ", ".join(col for _, col in COLUMNAS_PROVEEDOR)
+    + " FROM Proveedores WHERE CUIL = ?"
+)
+
+
+def fila_a_proveedor(fila) -> dict:
+    """Convierte una fila en el orden de COLUMNAS_PROVEEDOR al diccionario del formulario."""
+    return {clave: fila[i] for i, (clave, _) in enumerate(COLUMNAS_PROVEEDOR)}
+
+
+@medido()
+def buscar_proveedor(cuil, refrescar=False):
+    """
+    Búsqueda de un proveedor en una sola consulta sobre una sola conexión.
 
-def obtener_datos_por_cuil(cuil):
-    conexion = obtener_conexion()
-    if conexion is None:
-        print("Error: No se pudo conectar a la base de datos.")
+    Devuelve el diccionario completo si el CUIL existe y ``None`` si no existe.
+    A diferencia de obtener_datos_por_cuil(), los errores de base de datos se
+    propagan: ``None`` siempre significa "no encontrado".
+
+    Los registros encontrados se sirven desde un cache LRU (ver CACHE_*) y, si
+    hay réplica local configurada, desde la réplica antes de ir a SQL01; con
+    ``refrescar=True`` se consulta siempre SQL01. Los "no encontrado" no se
+    cachean y nunca se dan por buenos desde la réplica. Si un guardado invalida
+    el CUIL mientras se lee, el resultado se devuelve pero no se cachea.
+    """
+    version = _cache_proveedores.version(cuil)
+    if not refrescar:
+        datos = _cache_proveedores.obtener(cuil)
+        if datos is not None:
+            return dict(datos)
+        if _replica is not None:
+            try:
+                with fase("replica"):
+                    datos = _replica.buscar(cuil)
+            except Exception as e:
+                log.warning("Error al leer réplica local: %s", e)
+                datos = None
+            if datos is not None:
+                _cache_proveedores.guardar(cuil, datos, version=version)
+                return dict(datos)
+
+    with conexion() as conn:
+        cursor = conn.cursor()
+        with fase("execute"):
+            cursor.execute(_SQL_PROVEEDOR_POR_CUIL, (cuil,))
+        with fase("fetch"):
+            resultado = cursor.fetchone()
+        cursor.close()
+    if not resultado:
+        _cache_proveedores.invalidar(cuil)
+        return None
+    with fase("convert"):
+        datos = fila_a_proveedor(resultado)
+    _cache_proveedores.guardar(cuil, datos, version=version)
+    return dict(datos)
+
+
+# Filtros de la grilla (clave del panel de facetas → parámetro de AntoPage_Proveedores)
+FILTROS_PAGINA = (
+    ("provincia", "@FILTRO_PROVINCIA"),
+    ("condicion_cta", "@FILTRO_CONDICION_CTA"),
+    ("condicion_afip", "@FILTRO_CONDICION_EN_AFIP"),
+    ("condicion_dgr", "@FILTRO_CONDICION_DGR"),
+    ("condicion_gcia", "@FILTRO_CONDICION_GCIA"),
+    ("condicion_empleador", "@FILTRO_CONDICION_EMPLEADOR"),
+    ("forma_juridica", "@FILTRO_FORMA_JURIDICA"),
+)
+
+_SQL_PAGINA = (
+    "EXEC dbo.AntoPage_Proveedores @DESDE_CUIL = ?, @LOTE = ?, "
+    + ", ".join(f"{param} = ?" for _, param in FILTROS_PAGINA)
+)
+
+
+def lista_con_pipes(valores):
+    """['Chaco', 'Corrientes'] → '|Chaco|Corrientes|' (None si no hay filtro)."""
+    if not valores:
         return None
+    return "|" + "|".join(v.strip() for v in valores) + "|"
 
-    try:
-        cursor = conexion.cursor()
-        query = """
-        SELECT RAZON_SOCIAL, PROVINCIA, LOCALIDAD, CALLE, CALLE_NRO, DPTO, PISO, EMAIL,
-               CONDICION_CTA, CONDICION_EN_AFIP, CONDICION_DGR, CONDICION_GCIA,
-               CONDICION_EMPLEADOR, FORMA_JURIDICA, FECHA_ULT_LIB_DEUDA
-        FROM Proveedores
-        WHERE CUIL = ?
-        """
-        cursor.execute(query, (cuil,))
-        resultado = cursor.fetchone()
+
+@medido()
+def pagina_proveedores(desde_cuil, lote, filtros=None):
+    """
+    Página de la grilla del padrón: hasta ``lote`` filas con CUIL > ``desde_cuil``
+    (None = desde el principio), como tuplas (CUIL, RAZON_SOCIAL, LOCALIDAD,
+    PROVINCIA, CONDICION_CTA, CONDICION_EN_AFIP). ``filtros`` mapea cada clave
+    de FILTROS_PAGINA a los valores aceptados. Ver sql/AntoPage_Proveedores.sql.
+    """
+    filtros = filtros or {}
+    parametros = [desde_cuil, lote] + [lista_con_pipes(filtros.get(clave)) for clave, _ in FILTROS_PAGINA]
+    with conexion() as conn:
+        cursor = conn.cursor()
+        with fase("execute"):
+            cursor.execute(_SQL_PAGINA, parametros)
+        with fase("fetch"):
+            filas = cursor.fetchall()
         cursor.close()
-        conexion.close()
-        
-        if resultado:
-            # Convertimos el resultado a un diccionario
-            return {
-                "razon_social": resultado[0],
-                "provincia": resultado[1],
-                "localidad": resultado[2],
-                "calle": resultado[3],
-                "calle_nro": resultado[4],
-                "dpto": resultado[5],
-                "piso": resultado[6],
-                "email": resultado[7],
-                "condicion_cta": resultado[8],
-                "condicion_afip": resultado[9],
-                "condicion_dgr": resultado[10],
-                "condicion_gcia": resultado[11],
-                "condicion_empleador": resultado[12],
-                "forma_juridica": resultado[13],
-                "fecha_ult_lib_deuda": resultado[14]
-            }
-        else:
-            return None
+    with fase("convert"):
+        filas = [tuple(fila) for fila in filas]
+    return filas
 
+
+@medido()
+def obtener_datos_por_cuil(cuil):
+    try:
+        return buscar_proveedor(cuil)
     except pyodbc.Error as error:
-        print(f"Error al obtener datos por CUIL: {error}")
+        marcar_error(error)
+        log.error("Error al obtener datos por CUIL: %s", error)
         return None
 
 
+@medido()
 def ejecutar_procedimiento_almacenado(cuil):
-    conexion = obtener_conexion()
-    if conexion is None:
-        print("Error: No se pudo conectar a la base de datos.")
-        return None
-
     try:
-        cursor = conexion.cursor()
-        cursor.execute("SELECT COUNT(1) FROM Proveedores WHERE CUIL = ?", (cuil,))
-        resultado = cursor.fetchone()
-        cursor.close()
-        conexion.close()
-        
+        with conexion() as conn:
+            cursor = conn.cursor()
+            with fase("execute"):
+                cursor.execute("SELECT COUNT(1) FROM Proveedores WHERE CUIL = ?", (cuil,))
+            with fase("fetch"):
+                resultado = cursor.fetchone()
+            cursor.close()
+
         if resultado and resultado[0] > 0:
             return 1  # CUIL encontrado
         else:
             return 0  # CUIL no encontrado
 
     except pyodbc.Error as error:
-        print(f"Error al insertar el registro: {error}")
-        print(error.args)
+        marcar_error(error)
+        log.error("Error al buscar el CUIL: %s (%r)", error, error.args)
         return False
 
 
 
+@medido()
 def insertar_nuevo_registro(
     cuil, razon_social, provincia, localidad, calle, calle_nro, dpto, piso, email, 
     condicion_cta, condicion_afip, condicion_dgr, condicion_gcia, 
@@ -172,26 +385,28 @@ def insertar_nuevo_registro(
 
     # Validaciones previas
     if not cuil or len(cuil) != 11 or not cuil.isdigit():
-        print(f"Error: El CUIL '{cuil}' no es válido. Debe tener 11 dígitos numéricos.")
+        log.error("El CUIL %r no es válido. Debe tener 11 dígitos numéricos.", cuil)
         return False
     if not razon_social:
-        print("Error: La Razón Social no puede estar vacía.")
+        log.error("La Razón Social no puede estar vacía.")
         return False
     if not provincia:
-        print("Error: La Provincia no puede estar vacía.")
+        log.error("La Provincia no puede estar vacía.")
         return False
     if not localidad:
-        print("Error: La Localidad no puede estar vacía.")
+        log.error("La Localidad no puede estar vacía.")
         return False
     # Más validaciones según tus reglas de negocio...
 
-    # Imprimir los valores a insertar para depuración
-    print("Valores a insertar en la base de datos:")
-    print(f"CUIL: {cuil}, Razón Social: {razon_social}, Provincia: {provincia}, Localidad: {localidad}")
-    print(f"Calle: {calle}, Calle Nro: {calle_nro}, Dpto: {dpto}, Piso: {piso}, Email: {email}")
-    print(f"Condición CTA: {condicion_cta}, Condición AFIP: {condicion_afip}, Condición DGR: {condicion_dgr}")
-    print(f"Condición GCIA: {condicion_gcia}, Condición Empleador: {condicion_empleador}, Forma Jurídica: {forma_juridica}")
-    print(f"Fecha Últ. Libre Deuda: {fecha_ult_lib_deuda}, DNI desde CUIT: {dni_desde_cuit}")
+    # Valores a insertar (solo con nivel DEBUG; el formato es diferido)
+    log.debug(
+        "Insertar CUIL %s: razon_social=%r provincia=%r localidad=%r calle=%r calle_nro=%r dpto=%r "
+        "piso=%r email=%r cta=%r afip=%r dgr=%r gcia=%r empleador=%r forma_juridica=%r "
+        "fecha_ult_lib_deuda=%r dni_desde_cuit=%r",
+        cuil, razon_social, provincia, localidad, calle, calle_nro, dpto, piso, email,
+        condicion_cta, condicion_afip, condicion_dgr, condicion_gcia, condicion_empleador,
+        forma_juridica, fecha_ult_lib_deuda, dni_desde_cuit,
+    )
     # Conversión de fecha (None si no se informó libre de deuda)
     fecha_ult_lib_deuda_dt = datetime.strptime(fecha_ult_lib_deuda, "%Y-%m-%d") if fecha_ult_lib_deuda else None
     query = """
@@ -215,45 +430,35 @@ def insertar_nuevo_registro(
         @DNI_DESDE_CUIT = ?
     """
 
-    conexion = obtener_conexion()
-    if conexion is None:
-        print("Error: No se pudo conectar a la base de datos.")
-        return False
-
     try:
-        cursor = conexion.cursor()
-
-        # Ejecutar la consulta de inserción
-        print("Ejecutando el procedimiento almacenado...")
-        cursor.execute(query, (razon_social, cuil, provincia, localidad, calle, calle_nro, dpto, piso, email,
-                               condicion_cta, condicion_afip, condicion_dgr, condicion_gcia, 
-                               condicion_empleador, forma_juridica, fecha_ult_lib_deuda_dt, dni_desde_cuit))
-        
-        # Confirmar los cambios en la base de datos
-        conexion.commit()
-
-        # Confirmar si realmente se insertó la fila
-        if cursor.rowcount > 0:
-            print("Registro insertado correctamente.")
-        else:
-            print("No se insertaron registros. Verifica los datos proporcionados.")
-
+        with conexion() as conn:
+            cursor = conn.cursor()
+
+            # Ejecutar la consulta de inserción
+            with fase("execute"):
+                cursor.execute(query, (razon_social, cuil, provincia, localidad, calle, calle_nro, dpto, piso, email,
+                                       condicion_cta, condicion_afip, condicion_dgr, condicion_gcia,
+                                       condicion_empleador, forma_juridica, fecha_ult_lib_deuda_dt, dni_desde_cuit))
+
+                # Confirmar los cambios en la base de datos
+                conn.commit()
+
+            # Confirmar si realmente se insertó la fila
+            if cursor.rowcount > 0:
+                log.info("Registro insertado: %s", cuil)
+            else:
+                log.warning("No se insertaron registros para %s. Verifica los datos proporcionados.", cuil)
+            cursor.close()
+
+        invalidar_lecturas(cuil)
         return True
 
     except pyodbc.Error as error:
-        print("Error al insertar el registro:")
-        print(f"Mensaje de error: {error}")
-        print(f"Detalles del error: {error.args}")
+        marcar_error(error)
+        log.error("Error al insertar el registro %s: %s (%r)", cuil, error, error.args)
         return False
 
     except Exception as general_error:
-        print("Error inesperado al intentar insertar el registro:")
-        print(f"Mensaje: {general_error}")
+        marcar_error(general_error)
+        log.exception("Error inesperado al intentar insertar el registro %s: %s", cuil, general_error)
         return False
-
-    finally:
-        # Asegurarse de cerrar la conexión en caso de que haya quedado abierta
-        if conexion:
-            conexion.close()
-            print("Conexión cerrada.")
-
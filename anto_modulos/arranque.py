@@ -0,0 +1,175 @@
+# anto_modulos/arranque.py
+# Orquestador de arranque: splash inmediato, control de acceso y calentamiento
+# del pool en paralelo con la construcción de la ventana.
+#
+# Solo la presentación final espera la decisión de acceso. Cada fase se mide
+# y se registra para seguir el tiempo hasta que la ventana es usable.
+#
+# Si la decisión salió de un ticket local (ver anto_modulos/acceso.py), la
+# ventana se muestra enseguida y el refresco en segundo plano puede revocarla.
+
+from __future__ import annotations
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+from PyQt5.QtCore import QObject, Qt, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QApplication, QSplashScreen, QWidget
+
+from anto_modulos.resources import ICON_MAIN, pixmap
+from anto_modulos.registro import obtener_logger
+
+log = obtener_logger(__name__)
+
+_ALIGN_SPLASH = Qt.AlignBottom | Qt.AlignHCenter  # type: ignore[attr-defined]
+ALTO_SPLASH = 160
+
+
+class Arranque(QObject):
+    """
+    Uso::
+
+        arranque = Arranque(app, construir_ventana, verificar_acceso, calentar_pool)
+        arranque.iniciar()
+        sys.exit(app.exec_())
+
+    ``construir_ventana`` corre en el hilo de la GUI; ``verificar_acceso`` y
+    ``calentar`` en hilos aparte. Si el acceso se deniega se llama a
+    ``al_denegar(usuario, perfil)`` y la aplicación termina; si se permite, se
+    muestra la ventana y se llama a ``al_permitir(ventana)``.
+
+    ``refresco()`` (opcional) devuelve el Future de una verificación en curso en
+    segundo plano; si termina en DENEGADO se cierra la ventana y se procede como
+    una denegación.
+    """
+
+    _acceso_resuelto = pyqtSignal()  # emitida desde el hilo del control de acceso
+    _refresco_resuelto = pyqtSignal(object)  # Future del refresco del acceso
+
+    def __init__(
+        self,
+        app: QApplication,
+        construir_ventana: Callable[[], QWidget],
+        verificar_acceso: Callable[[], Tuple[bool, str, dict]],
+        calentar: Optional[Callable[[], object]] = None,
+        al_denegar: Optional[Callable[[str, dict], None]] = None,
+        al_permitir: Optional[Callable[[QWidget], None]] = None,
+        inicio: Optional[float] = None,
+        refresco: Optional[Callable[[], Optional[Future]]] = None,
+    ) -> None:
+        super().__init__()
+        self.app = app
+        self._construir_ventana = construir_ventana
+        self._verificar_acceso = verificar_acceso
+        self._calentar = calentar
+        self._al_denegar = al_denegar
+        self._al_permitir = al_permitir
+        self._refresco = refresco
+        self.inicio = inicio if inicio is not None else time.perf_counter()
+        self.fases: Dict[str, float] = {}
+        self.ventana: Optional[QWidget] = None
+        self._splash: Optional[QSplashScreen] = None
+        self._hilos = ThreadPoolExecutor(max_workers=2, thread_name_prefix="arranque")
+        self._acceso: Optional[Future] = None
+        self._revelar_pendiente = False
+        self._acceso_resuelto.connect(self._revelar, Qt.QueuedConnection)
+        self._refresco_resuelto.connect(self._revalidar, Qt.QueuedConnection)
+
+    # ── Medición ──
+
+    def _medir(self, fase: str, desde: float) -> None:
+        self.fases[fase] = time.perf_counter() - desde
+        log.info("%s: %.0f ms", fase, self.fases[fase] * 1000)
+
+    def _en_hilo(self, fase: str, fn: Callable) -> Callable:
+        def envoltura():
+            t0 = time.perf_counter()
+            try:
+                return fn()
+            finally:
+                self._medir(fase, t0)
+        return envoltura
+
+    # ── Secuencia ──
+
+    def iniciar(self) -> None:
+        t0 = time.perf_counter()
+        self._splash = QSplashScreen(pixmap(ICON_MAIN, ALTO_SPLASH))
+        self._splash.showMessage("Iniciando…", _ALIGN_SPLASH)
+        self._splash.show()
+        self.app.processEvents()  # pintar el splash antes de seguir
+        self._medir("splash", t0)
+
+        self._acceso = self._hilos.submit(self._en_hilo("acceso", self._verificar_acceso))
+        self._acceso.add_done_callback(lambda _f: self._acceso_resuelto.emit())
+        if self._calentar is not None:
+            calentamiento = self._hilos.submit(self._en_hilo("pool", self._calentar))
+            calentamiento.add_done_callback(self._informar_calentamiento)
+
+        t0 = time.perf_counter()
+        self._splash.showMessage("Preparando la ventana…", _ALIGN_SPLASH)
+        self.ventana = self._construir_ventana()
+        self._medir("ventana", t0)
+        if self._revelar_pendiente:
+            QTimer.singleShot(0, self._revelar)  # ya dentro del event loop
+        elif self._acceso.running():
+            self._splash.showMessage("Verificando acceso…", _ALIGN_SPLASH)
+        self._hilos.shutdown(wait=False)
+
+    @staticmethod
+    def _informar_calentamiento(futuro: Future) -> None:
+        error = futuro.exception()
+        if error is not None:
+            # No bloquea el arranque: la primera consulta reintentará abrir la conexión
+            log.warning("No se pudo calentar el pool: %s", error)
+
+    def _revelar(self) -> None:
+        if self.ventana is None:
+            # La decisión llegó mientras se construía la ventana (p. ej. un processEvents)
+            self._revelar_pendiente = True
+            return
+        try:
+            acceso, usuario, perfil = self._acceso.result()
+        except Exception as e:
+            log.error("Error en el control de acceso: %s", e)
+            acceso, usuario, perfil = False, "", {}
+
+        if not acceso:
+            self._splash.close()
+            self._denegar(usuario, perfil)
+            return
+
+        self.ventana.show()
+        self._splash.finish(self.ventana)
+        self._medir("hasta_interactivo", self.inicio)
+        if self._al_permitir is not None:
+            self._al_permitir(self.ventana)
+
+        futuro = self._refresco() if self._refresco is not None else None
+        if futuro is not None:
+            t0 = time.perf_counter()
+
+            def resuelto(f: Future) -> None:
+                self._medir("acceso_refresco", t0)
+                self._refresco_resuelto.emit(f)
+            futuro.add_done_callback(resuelto)
+
+    def _revalidar(self, futuro: Future) -> None:
+        try:
+            acceso, usuario, perfil = futuro.result()
+        except Exception as e:
+            # Sin respuesta no hay revocación: se mantiene el acceso del ticket
+            log.warning("No se pudo refrescar el control de acceso: %s", e)
+            return
+        if not acceso:
+            log.warning("Acceso revocado para %s en el refresco", usuario)
+            self._denegar(usuario, perfil)
+
+    def _denegar(self, usuario: str, perfil: dict) -> None:
+        if self.ventana is not None:
+            self.ventana.hide()
+            self.ventana.deleteLater()
+            self.ventana = None
+        if self._al_denegar is not None:
+            self._al_denegar(usuario, perfil)
+        self.app.exit(0)
@@ -0,0 +1,106 @@
+# anto_modulos/cache_lru.py
+# Cache en memoria thread-safe con tope de entradas, TTL y desalojo LRU.
+#
+# Cada clave tiene una versión que invalidar() incrementa (limpiar() las
+# incrementa todas). Quien lee de la base toma version() antes de consultar y
+# la pasa a guardar(): si hubo una invalidación en el medio, el valor leído ya
+# es viejo y no se guarda.
+
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class CacheLRU:
+    """
+    Cache clave → valor con política LRU.
+
+    - ``max_entradas``: al superarlo se desaloja la entrada usada hace más tiempo.
+    - ``ttl_s``: las entradas más viejas que esto se consideran ausentes
+      (``None`` = sin vencimiento).
+    """
+
+    def __init__(self, max_entradas: int = 256, ttl_s: Optional[float] = 300.0) -> None:
+        if max_entradas < 1:
+            raise ValueError("max_entradas debe ser >= 1")
+        self.max_entradas = max_entradas
+        self.ttl_s = ttl_s
+        self._datos: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._versiones: Dict[Hashable, int] = {}  # claves invalidadas alguna vez
+        self._epoca = 0                              # se incrementa en limpiar()
+        self._stats: Dict[str, int] = {
+            "hits": 0, "misses": 0, "expiradas": 0, "desalojadas": 0, "invalidadas": 0,
+            "descartadas": 0,
+        }
+
+    def version(self, clave: Hashable) -> Tuple[int, int]:
+        """Versión actual de ``clave`` (para pasarla a guardar())."""
+        with self._lock:
+            return self._epoca, self._versiones.get(clave, 0)
+
+    def obtener(self, clave: Hashable, defecto: Any = None) -> Any:
+        ahora = time.monotonic()
+        with self._lock:
+            item = self._datos.get(clave)
+            if item is None:
+                self._stats["misses"] += 1
+                return defecto
+            guardado, valor = item
+            if self.ttl_s is not None and ahora - guardado > self.ttl_s:
+                del self._datos[clave]
+                self._stats["expiradas"] += 1
+                self._stats["misses"] += 1
+                return defecto
+            self._datos.move_to_end(clave)
+            self._stats["hits"] += 1
+            return valor
+
+    def guardar(self, clave: Hashable, valor: Any, version: Optional[Tuple[int, int]] = None) -> bool:
+        """
+        Guarda ``valor``. Con ``version`` (tomada con version() antes de leerlo)
+        no lo guarda si ``clave`` se invalidó desde entonces; devuelve False.
+        """
+        with self._lock:
+            if version is not None and version != (self._epoca, self._versiones.get(clave, 0)):
+                self._stats["descartadas"] += 1
+                return False
+            self._datos[clave] = (time.monotonic(), valor)
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.max_entradas:
+                self._datos.popitem(last=False)
+                self._stats["desalojadas"] += 1
+            return True
+
+    def invalidar(self, clave: Hashable) -> bool:
+        with self._lock:
+            self._versiones[clave] = self._versiones.get(clave, 0) + 1
+            if len(self._versiones) > 4 * self.max_entradas:
+                # Acotar la memoria: otra época invalida las lecturas en curso de todas las claves
+                self._versiones.clear()
+                self._epoca += 1
+            if self._datos.pop(clave, None) is None:
+                return False
+            self._stats["invalidadas"] += 1
+            return True
+
+    def limpiar(self) -> None:
+        with self._lock:
+            self._stats["invalidadas"] += len(self._datos)
+            self._datos.clear()
+            self._versiones.clear()
+            self._epoca += 1
+
+    def __len__(self) -> int:
+        return len(self._datos)
+
+    def estadisticas(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["entradas"] = len(self._datos)
+        stats["max_entradas"] = self.max_entradas
+        consultas = stats["hits"] + stats["misses"]
+        stats["ratio_hits"] = (stats["hits"] / consultas) if consultas else 0.0
+        return stats
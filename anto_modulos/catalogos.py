@@ -0,0 +1,203 @@
+# anto_modulos/catalogos.py
+# Catálogos de los combos (provincia y condiciones) servidos desde la tabla de
+# referencia dbo.PROVEEDORES_CATALOGOS (ver sql/AntoCatalogos_Proveedores.sql).
+#
+# Al arrancar se leen del cache local (%LOCALAPPDATA%\Proveedores\catalogos.json)
+# o, si no hay, de CATALOGOS_PREDETERMINADOS; no se consulta la base. Luego
+# actualizar() le manda al SP la versión cacheada y solo descarga las filas si
+# la versión del servidor cambió (una ida y vuelta en ambos casos).
+#
+# Cada Catalogo trae armado su mapa valor normalizado → posición, así ubicar el
+# valor guardado en el combo es O(1).
+
+from __future__ import annotations
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, Optional, Sequence
+
+from anto_modulos.registro import obtener_logger
+from anto_modulos.resources import user_data_path
+from anto_modulos.tiempos import fase, medido
+
+log = obtener_logger(__name__)
+
+# ─── Configuración ────────────────────────────────────────────────────────────
+CACHE_ARCHIVO = "catalogos.json"
+FORMATO_CACHE = 1   # subir si cambia la estructura del JSON
+
+SQL_CATALOGOS = "EXEC dbo.AntoCatalogos_Proveedores @VERSION = ?"
+
+# Valores usados si no hay cache ni servidor (y para catálogos que el servidor no trae)
+CATALOGOS_PREDETERMINADOS: Dict[str, Sequence[str]] = {
+    "provincia": (
+        "Buenos Aires", "Catamarca", "Chaco", "Chubut", "Córdoba", "Corrientes", "Entre Ríos", "Formosa", "Jujuy",
+        "La Pampa", "La Rioja", "Mendoza", "Misiones", "Neuquén", "Río Negro", "Salta", "San Juan", "San Luis",
+        "Santa Cruz", "Santa Fe", "Santiago del Estero", "Tierra del Fuego", "Tucumán", "Ciudad Autónoma de Buenos Aires",
+    ),
+    "condicion_cta": ("Activo", "Baja"),
+    "condicion_afip": (
+        "Monotributista", "No Informado", "Condición B", "Exento",
+        "Responsable Inscripto", "Responsable No Inscripto", "Código Invalido", "Null",
+    ),
+    "condicion_dgr": (
+        "Inscripto", "No Inscripto", "No Informado", "Exento",
+        "No Sujeto a Retención", "Convenio Multilateral", "Condición C", "Null",
+    ),
+    "condicion_gcia": (
+        "Inscripto", "No Inscripto", "No Informado", "Exento",
+        "Monotributista", "No Sujeto a Retención", "Convenio Multilateral",
+        "Condición D", "Código Inválido", "Null",
+    ),
+    "condicion_empleador": ("Empleador", "No Empleador", "No Informado"),
+    "forma_juridica": (
+        "Persona Jurídica", "Colectiva", "Responsabilidad Limitada", "Sociedad Anónima", "Mutual",
+        "Asociación", "No Informado", "Asociación Civil", "Cooperativa", "En Formación",
+        "Empresa del Estado", "Sociedad de Derecho", "No Empleador", "Organismo Público",
+        "Agrupación de Colaboración Empresaria", "Fundación", "Unipersonal", "Otros",
+    ),
+}
+
+
+def normalizar(valor: Any) -> str:
+    """Clave de comparación: mismo criterio que usaba set_combobox_value (trim + minúsculas)."""
+    return str(valor or "").strip().lower()
+
+
+class Catalogo:
+    """Lista ordenada de valores con índice normalizado → posición (inmutable)."""
+
+    __slots__ = ("nombre", "valores", "_posicion")
+
+    def __init__(self, nombre: str, valores: Iterable[str]) -> None:
+        posicion: Dict[str, int] = {}
+        unicos = []
+        for valor in valores:
+            clave = normalizar(valor)
+            if clave and clave not in posicion:
+                posicion[clave] = len(unicos)
+                unicos.append(str(valor).strip())
+        self.nombre = nombre
+        self.valores = tuple(unicos)
+        self._posicion = posicion
+
+    def indice(self, valor: Any) -> Optional[int]:
+        """Posición de ``valor`` (sin distinguir mayúsculas ni espacios) o None."""
+        return self._posicion.get(normalizar(valor))
+
+    def __contains__(self, valor: Any) -> bool:
+        return normalizar(valor) in self._posicion
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.valores)
+
+    def __len__(self) -> int:
+        return len(self.valores)
+
+    def __repr__(self) -> str:
+        return f"<Catalogo {self.nombre!r} ({len(self.valores)} valores)>"
+
+
+_lock = threading.Lock()
+_catalogos: Optional[Dict[str, Catalogo]] = None
+_version: Optional[str] = None
+
+
+def _armar(valores: Dict[str, Sequence[str]]) -> Dict[str, Catalogo]:
+    combinados = dict(CATALOGOS_PREDETERMINADOS)
+    combinados.update({nombre: lista for nombre, lista in valores.items() if lista})
+    return {nombre: Catalogo(nombre, lista) for nombre, lista in combinados.items()}
+
+
+def _ruta_cache() -> str:
+    return user_data_path(CACHE_ARCHIVO)
+
+
+def _leer_cache() -> tuple[Optional[str], Dict[str, Sequence[str]]]:
+    try:
+        with open(_ruta_cache(), encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None, {}
+    except (OSError, ValueError) as e:
+        log.warning("Cache de catálogos ilegible: %s", e)
+        return None, {}
+    if not isinstance(data, dict) or data.get("formato") != FORMATO_CACHE:
+        return None, {}
+    return data.get("version"), data.get("catalogos") or {}
+
+
+def _escribir_cache(version: str, valores: Dict[str, Sequence[str]]) -> None:
+    ruta = _ruta_cache()
+    tmp = ruta + ".tmp"
+    data = {
+        "formato": FORMATO_CACHE,
+        "version": version,
+        "guardado": datetime.now().isoformat(timespec="seconds"),
+        "catalogos": {nombre: list(lista) for nombre, lista in valores.items()},
+    }
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, ruta)
+    except OSError as e:
+        log.warning("No se pudo guardar el cache de catálogos: %s", e)
+
+
+def _cargados() -> Dict[str, Catalogo]:
+    global _catalogos, _version
+    if _catalogos is None:
+        with _lock:
+            if _catalogos is None:
+                _version, valores = _leer_cache()
+                _catalogos = _armar(valores)
+                log.debug("Catálogos desde %s (versión %s)", "cache" if _version else "valores por defecto", _version)
+    return _catalogos
+
+
+# ─────────────────────────────────────────────────────────────────────
+# API
+# ─────────────────────────────────────────────────────────────────────
+def obtener(nombre: str) -> Catalogo:
+    """Catálogo ``nombre`` (clave de CATALOGOS_PREDETERMINADOS, p. ej. "provincia")."""
+    return _cargados()[nombre]
+
+
+def version() -> Optional[str]:
+    """Versión del servidor de la que salen los catálogos (None: valores por defecto)."""
+    _cargados()
+    return _version
+
+
+@medido("actualizar_catalogos")
+def actualizar(conexion: Callable[[], ContextManager[Any]]) -> bool:
+    """
+    Pide los catálogos al servidor si su versión difiere de la cacheada.
+    Devuelve True si cambiaron (los combos deben volver a llenarse).
+    """
+    global _catalogos, _version
+    actual = version()
+    with conexion() as conn:
+        cursor = conn.cursor()
+        with fase("execute"):
+            cursor.execute(SQL_CATALOGOS, (actual,))
+        with fase("fetch"):
+            fila = cursor.fetchone()
+            nueva = str(fila[0]) if fila and fila[0] is not None else None
+            filas = cursor.fetchall() if nueva != actual and cursor.nextset() else []
+        cursor.close()
+
+    if nueva is None or nueva == actual:
+        log.debug("Catálogos al día (versión %s)", actual)
+        return False
+
+    valores: Dict[str, list] = {}
+    for catalogo, valor in filas:  # ordenadas por CATALOGO, ORDEN
+        valores.setdefault(str(catalogo).strip().lower(), []).append(valor)
+    with _lock:
+        _catalogos = _armar(valores)
+        _version = nueva
+    _escribir_cache(nueva, valores)
+    log.info("Catálogos actualizados a la versión %s (%d valores)", nueva, len(filas))
+    return True
@@ -0,0 +1,105 @@
+# anto_modulos/diagnostico_dialog.py
+# Diálogo oculto de diagnóstico (Ctrl+Shift+D en la ventana principal):
+# tiempos por operación de acceso a datos, estado del pool y del cache.
+
+from __future__ import annotations
+from typing import Callable, Dict, Optional
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import (
+    QAbstractItemView, QDialog, QHBoxLayout, QHeaderView, QLabel, QPushButton,
+    QTableWidget, QTableWidgetItem, QVBoxLayout,
+)
+
+from anto_modulos import tiempos
+
+_NO_HELP     = Qt.WindowType.WindowContextHelpButtonHint  # type: ignore[attr-defined]
+_ALIGN_RIGHT = Qt.AlignRight | Qt.AlignVCenter             # type: ignore[attr-defined]
+
+_COLUMNAS = ("Operación", "N", "Errores", "p50 ms", "p95 ms", "p99 ms", "Máx ms", "Fases (p50 ms)")
+
+
+class DiagnosticoDialog(QDialog):
+    """
+    ``estadisticas`` son funciones sin argumentos que devuelven un dict
+    (p. ej. {"Pool": estadisticas_pool, "Cache": estadisticas_cache}).
+    """
+
+    def __init__(self, estadisticas: Optional[Dict[str, Callable[[], dict]]] = None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Diagnóstico")
+        self.setWindowFlags(self.windowFlags() & ~_NO_HELP)  # type: ignore[arg-type]
+        self.resize(820, 420)
+        self._estadisticas = estadisticas or {}
+
+        layout = QVBoxLayout(self)
+        self.tabla = QTableWidget(0, len(_COLUMNAS), self)
+        self.tabla.setHorizontalHeaderLabels(_COLUMNAS)
+        self.tabla.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tabla.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.tabla.verticalHeader().setVisible(False)
+        self.tabla.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.tabla.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.tabla, 1)
+
+        self.estado_label = QLabel("", self)
+        self.estado_label.setWordWrap(True)
+        self.estado_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        layout.addWidget(self.estado_label)
+
+        botones = QHBoxLayout()
+        for texto, accion in (
+            ("Actualizar", self.actualizar),
+            ("Limpiar", self._limpiar),
+            ("Exportar", self._exportar),
+        ):
+            boton = QPushButton(texto, self)
+            boton.clicked.connect(accion)
+            botones.addWidget(boton)
+        botones.addStretch()
+        cerrar = QPushButton("Cerrar", self)
+        cerrar.clicked.connect(self.close)
+        botones.addWidget(cerrar)
+        layout.addLayout(botones)
+
+        self.actualizar()
+
+    def actualizar(self) -> None:
+        agregados = tiempos.agregados()
+        self.tabla.setRowCount(len(agregados))
+        for fila, (nombre, datos) in enumerate(agregados.items()):
+            fases = ", ".join(f"{f} {r['p50']:.2f}" for f, r in datos["fases"].items())
+            valores = (
+                nombre, datos["n"], datos["errores"],
+                datos["p50"], datos["p95"], datos["p99"], datos["max"], fases,
+            )
+            for col, valor in enumerate(valores):
+                texto = f"{valor:.2f}" if isinstance(valor, float) else str(valor)
+                item = QTableWidgetItem(texto)
+                if col and col < len(valores) - 1:
+                    item.setTextAlignment(_ALIGN_RIGHT)
+                self.tabla.setItem(fila, col, item)
+
+        lineas = [f"{len(tiempos.spans())} mediciones en memoria (máx. {tiempos.TAM_BUFFER})."]
+        for titulo, fn in self._estadisticas.items():
+            try:
+                datos = fn()
+            except Exception as e:
+                datos = {"error": str(e)}
+            lineas.append(f"{titulo}: " + ", ".join(
+                f"{k}={v:.2f}" if isinstance(v, float) else f"{k}={v}" for k, v in datos.items()
+            ))
+        self.estado_label.setText("\n".join(lineas))
+
+    def _limpiar(self) -> None:
+        tiempos.limpiar()
+        self.actualizar()
+
+    def _exportar(self) -> None:
+        try:
+            ruta = tiempos.exportar()
+        except OSError as e:
+            self.estado_label.setText(f"No se pudo exportar: {e}")
+            return
+        self.actualizar()
+        self.estado_label.setText(self.estado_label.text() + f"\nExportado a {ruta}")
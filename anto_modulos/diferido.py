@@ -0,0 +1,48 @@
+# anto_modulos/diferido.py
+# Importación diferida de módulos pesados que no hacen falta para mostrar la ventana.
+#
+#   pyodbc = ModuloDiferido("pyodbc")
+#
+# El módulo real se importa en el primer acceso a un atributo (p. ej. la primera
+# conexión, que corre en el hilo de calentamiento del pool). ``except pyodbc.Error``
+# solo evalúa el atributo si hay una excepción, así que no fuerza la importación.
+#
+# PyInstaller no detecta estas importaciones: declararlas con --hidden-import
+# (ver build.bat).
+
+from __future__ import annotations
+import importlib
+import threading
+from types import ModuleType
+from typing import Any, Optional
+
+
+class ModuloDiferido:
+    def __init__(self, nombre: str) -> None:
+        self.__dict__["_nombre"] = nombre
+        self.__dict__["_modulo"] = None
+        self.__dict__["_lock"] = threading.Lock()
+
+    def _cargar(self) -> ModuleType:
+        modulo: Optional[ModuleType] = self.__dict__["_modulo"]
+        if modulo is None:
+            with self.__dict__["_lock"]:
+                modulo = self.__dict__["_modulo"]
+                if modulo is None:
+                    modulo = importlib.import_module(self.__dict__["_nombre"])
+                    self.__dict__["_modulo"] = modulo
+        return modulo
+
+    @property
+    def cargado(self) -> bool:
+        return self.__dict__["_modulo"] is not None
+
+    def __getattr__(self, nombre: str) -> Any:
+        return getattr(self._cargar(), nombre)
+
+    def __setattr__(self, nombre: str, valor: Any) -> None:
+        setattr(self._cargar(), nombre, valor)
+
+    def __repr__(self) -> str:
+        estado = "cargado" if self.cargado else "sin cargar"
+        return f"<módulo diferido {self.__dict__['_nombre']!r} ({estado})>"
@@ -0,0 +1,217 @@
+# anto_modulos/exportacion.py
+# Exportación del padrón de proveedores a CSV o XLSX en memoria constante.
+#
+# Las filas se leen con fetchmany sobre un único SELECT (el driver las va
+# trayendo del servidor a medida que se piden) y se escriben enseguida: a CSV
+# con csv.writer y a XLSX con un libro write_only de openpyxl, que vuelca cada
+# fila al disco en lugar de armar la hoja en memoria. El archivo se escribe con
+# extensión .parcial y se renombra al terminar; si se cancela, se borra.
+#
+# Los filtros son los mismos de la grilla del padrón (claves de FILTROS_PAGINA).
+#
+# Uso headless:
+#   python -m anto_modulos.exportacion padron.xlsx
+#   python -m anto_modulos.exportacion chaco_baja.csv --provincia Chaco --condicion_cta Baja
+
+from __future__ import annotations
+import argparse
+import csv
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from anto_modulos.anto_conexion import COLUMNAS_PROVEEDOR, FILTROS_PAGINA, conexion, lista_con_pipes
+from anto_modulos.registro import configurar_registro
+
+LOTE_EXPORTACION = 5000
+FORMATOS = ("csv", "xlsx")
+
+CAMPOS = (("cuil", "CUIL"),) + tuple(COLUMNAS_PROVEEDOR)
+_COLUMNA_DE = dict(CAMPOS)
+
+
+class ErrorExportacion(Exception):
+    pass
+
+
+@dataclass
+class ResumenExportacion:
+    ruta: str
+    filas: int = 0
+    total: Optional[int] = None
+    segundos: float = 0.0
+    cancelada: bool = False
+
+    @property
+    def filas_por_s(self) -> float:
+        return self.filas / self.segundos if self.segundos > 0 else 0.0
+
+    def __str__(self) -> str:
+        estado = "Cancelada" if self.cancelada else "Exportadas"
+        return f"{estado}: {self.filas} filas en {self.segundos:.1f}s ({self.filas_por_s:,.0f} filas/s) → {self.ruta}"
+
+
+def sql_exportacion(filtros: Optional[Dict[str, Sequence[str]]] = None) -> Tuple[str, str, List[Any]]:
+    """(SELECT, COUNT, parámetros) con los filtros de la grilla, mismo criterio que AntoPage_Proveedores."""
+    condiciones, parametros = [], []
+    for clave, _ in FILTROS_PAGINA:
+        lista = lista_con_pipes((filtros or {}).get(clave))
+        if lista is not None:
+            columna = _COLUMNA_DE[clave]
+            condiciones.append(f"CHARINDEX('|' + LTRIM(RTRIM(ISNULL({columna}, ''))) + '|', ?) > 0")
+            parametros.append(lista)
+    where = (" WHERE " + " AND ".join(condiciones)) if condiciones else ""
+    columnas = ", ".join(col for _, col in CAMPOS)
+    return (
+        f"SELECT {columnas} FROM PROVEEDORES{where} ORDER BY CUIL",
+        f"SELECT COUNT(*) FROM PROVEEDORES{where}",
+        parametros,
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Escritores
+# ─────────────────────────────────────────────────────────────────────
+class _EscritorCSV:
+    def __init__(self, ruta: str) -> None:
+        # utf-8-sig y ';' para que Excel en español lo abra directo
+        self._archivo = open(ruta, "w", newline="", encoding="utf-8-sig")
+        self._csv = csv.writer(self._archivo, delimiter=";")
+
+    def escribir(self, fila: Sequence[Any]) -> None:
+        self._csv.writerow(
+            [v.strftime("%Y-%m-%d") if isinstance(v, datetime) else ("" if v is None else str(v).strip()) for v in fila]
+        )
+
+    def cerrar(self) -> None:
+        self._archivo.close()
+
+    def abortar(self) -> None:
+        self._archivo.close()
+
+
+class _EscritorXLSX:
+    def __init__(self, ruta: str) -> None:
+        try:
+            from openpyxl import Workbook
+        except ImportError as e:
+            raise ErrorExportacion("Para exportar .xlsx se necesita el paquete openpyxl.") from e
+        self._ruta = ruta
+        self._libro = Workbook(write_only=True)
+        self._hoja = self._libro.create_sheet("Proveedores")
+
+    def escribir(self, fila: Sequence[Any]) -> None:
+        self._hoja.append([v.strip() if isinstance(v, str) else v for v in fila])
+
+    def cerrar(self) -> None:
+        self._libro.save(self._ruta)
+
+    def abortar(self) -> None:
+        pass  # en modo write_only no se escribe nada a disco hasta save()
+
+
+def _formato(ruta: str, formato: Optional[str]) -> str:
+    formato = (formato or os.path.splitext(ruta)[1].lstrip(".")).lower()
+    if formato not in FORMATOS:
+        raise ErrorExportacion(f"Formato no soportado: {formato!r} (usar .csv o .xlsx)")
+    return formato
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Exportación
+# ─────────────────────────────────────────────────────────────────────
+def exportar(
+    ruta: str,
+    *,
+    filtros: Optional[Dict[str, Sequence[str]]] = None,
+    formato: Optional[str] = None,
+    lote: int = LOTE_EXPORTACION,
+    progreso: Optional[Callable[[int, Optional[int]], None]] = None,
+    cancelar: Optional[threading.Event] = None,
+) -> ResumenExportacion:
+    """
+    Exporta Proveedores a ``ruta`` (CSV o XLSX según la extensión o ``formato``).
+    ``progreso(filas, total)`` se llama tras cada lote; si ``cancelar`` se activa
+    la exportación se corta y no queda archivo.
+    """
+    formato = _formato(ruta, formato)
+    resumen = ResumenExportacion(ruta=ruta)
+    sql, sql_total, parametros = sql_exportacion(filtros)
+    parcial = ruta + ".parcial"
+    inicio = time.perf_counter()
+
+    escritor = _EscritorXLSX(parcial) if formato == "xlsx" else _EscritorCSV(parcial)
+    try:
+        escritor.escribir([col for _, col in CAMPOS])
+        with conexion() as conn:
+            cursor = conn.cursor()
+            resumen.total = cursor.execute(sql_total, parametros).fetchone()[0]
+            if progreso:
+                progreso(0, resumen.total)
+            cursor.execute(sql, parametros)
+            while True:
+                if cancelar is not None and cancelar.is_set():
+                    resumen.cancelada = True
+                    break
+                filas = cursor.fetchmany(lote)
+                if not filas:
+                    break
+                for fila in filas:
+                    escritor.escribir(fila)
+                resumen.filas += len(filas)
+                if progreso:
+                    progreso(resumen.filas, resumen.total)
+            cursor.close()
+        escritor.cerrar()
+    except BaseException:
+        escritor.abortar()  # en Windows no se puede borrar un archivo abierto
+        _borrar(parcial)
+        raise
+
+    if resumen.cancelada:
+        _borrar(parcial)
+    else:
+        os.replace(parcial, ruta)
+    resumen.segundos = time.perf_counter() - inicio
+    return resumen
+
+
+def _borrar(ruta: str) -> None:
+    try:
+        os.remove(ruta)
+    except OSError:
+        pass
+
+
+# ─────────────────────────────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────────────────────────────
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Exporta el padrón de proveedores a CSV o XLSX.")
+    parser.add_argument("archivo", help="destino (.csv o .xlsx)")
+    parser.add_argument("--formato", choices=FORMATOS, help="por defecto, según la extensión")
+    parser.add_argument("--lote", type=int, default=LOTE_EXPORTACION, help="filas por fetchmany")
+    for clave, _ in FILTROS_PAGINA:
+        parser.add_argument(f"--{clave}", action="append", metavar="VALOR",
+                            help=f"filtrar por {_COLUMNA_DE[clave]} (repetible)")
+    args = parser.parse_args(argv)
+    configurar_registro()
+    filtros = {clave: getattr(args, clave) for clave, _ in FILTROS_PAGINA if getattr(args, clave)}
+
+    def mostrar(filas: int, total: Optional[int]) -> None:
+        print(f"[exportacion] {filas}/{total if total is not None else '?'} filas")
+
+    try:
+        resumen = exportar(args.archivo, filtros=filtros, formato=args.formato, lote=args.lote, progreso=mostrar)
+    except ErrorExportacion as e:
+        print(f"[exportacion] {e}")
+        return 2
+    print(f"[exportacion] {resumen}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
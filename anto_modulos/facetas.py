@@ -0,0 +1,266 @@
+# anto_modulos/facetas.py
+# Filtros por facetas (provincia y condiciones) con índices de bitmaps en memoria.
+#
+# Cada proveedor es un número de documento (posición en orden de CUIL) y cada
+# valor de cada faceta un bitmap: un int de Python con un bit por documento.
+# Filtrar es OR dentro de una faceta y AND entre facetas; los conteos de cada
+# valor son popcount(bitmap & filtro de las demás facetas), así que tildar o
+# destildar un valor se resuelve en memoria, sin consultar la base.
+# La grilla del padrón aplica los mismos filtros en SQL (AntoPage_Proveedores).
+
+from __future__ import annotations
+import time
+from array import array
+from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtWidgets import (
+    QGroupBox, QLabel, QListWidget, QListWidgetItem, QPushButton, QScrollArea, QVBoxLayout, QWidget,
+)
+
+from anto_modulos.registro import obtener_logger
+
+log = obtener_logger(__name__)
+
+# ─── Configuración ────────────────────────────────────────────────────────────
+# (clave de filtro, columna SQL, título en pantalla)
+FACETAS = (
+    ("provincia", "PROVINCIA", "Provincia"),
+    ("condicion_cta", "CONDICION_CTA", "Condición CTA"),
+    ("condicion_afip", "CONDICION_EN_AFIP", "Condición en AFIP"),
+    ("condicion_dgr", "CONDICION_DGR", "Condición DGR"),
+    ("condicion_gcia", "CONDICION_GCIA", "Condición GCIA"),
+    ("condicion_empleador", "CONDICION_EMPLEADOR", "Condición Empleador"),
+    ("forma_juridica", "FORMA_JURIDICA", "Forma Jurídica"),
+)
+SIN_DATO = ""                 # valor NULL o vacío en la base
+ETIQUETA_SIN_DATO = "(sin dato)"
+LOTE_LECTURA = 20000
+ESPERA_FILTRO_MS = 300        # antirrebote antes de recargar la grilla
+
+_SQL_CARGA = (
+    "SELECT CUIL, " + ", ".join(col for _, col, _ in FACETAS) + " FROM PROVEEDORES ORDER BY CUIL"
+)
+
+Filtros = Dict[str, Sequence[str]]
+
+
+def _popcount(x: int) -> int:
+    return x.bit_count() if hasattr(x, "bit_count") else bin(x).count("1")
+
+
+class IndiceFacetas:
+    """Bitmaps por valor de faceta sobre todo el padrón."""
+
+    def __init__(self) -> None:
+        self._cuils = array("Q")
+        self._bitmaps: Dict[str, Dict[str, int]] = {clave: {} for clave, _, _ in FACETAS}
+        self._todos = 0
+        self.listo = False
+
+    def __len__(self) -> int:
+        return len(self._cuils)
+
+    # ── Construcción ──
+
+    def construir(self, filas: Iterable[Sequence[Any]]) -> None:
+        """``filas``: (CUIL, PROVINCIA, CONDICION_CTA, …) en el orden de FACETAS."""
+        inicio = time.perf_counter()
+        cuils = array("Q")
+        bits: List[Dict[str, bytearray]] = [{} for _ in FACETAS]
+        for fila in filas:
+            texto = str(fila[0] or "").strip()
+            if len(texto) != 11 or not texto.isdigit():
+                continue
+            doc = len(cuils)
+            cuils.append(int(texto))
+            byte, bit = doc >> 3, 1 << (doc & 7)
+            for i, valor in enumerate(fila[1:1 + len(FACETAS)]):
+                valor = str(valor).strip() if valor is not None else SIN_DATO
+                buffer = bits[i].get(valor)
+                if buffer is None:
+                    buffer = bits[i][valor] = bytearray()
+                if len(buffer) <= byte:
+                    buffer.extend(bytes(byte + 1 - len(buffer)))
+                buffer[byte] |= bit
+        self._bitmaps = {
+            clave: {valor: int.from_bytes(buffer, "little") for valor, buffer in bits[i].items()}
+            for i, (clave, _, _) in enumerate(FACETAS)
+        }
+        self._cuils = cuils
+        self._todos = (1 << len(cuils)) - 1
+        self.listo = True
+        log.info(
+            "%d proveedores, %d valores en %.2fs",
+            len(cuils), sum(len(v) for v in self._bitmaps.values()), time.perf_counter() - inicio,
+        )
+
+    # ── Consultas ──
+
+    def valores(self, clave: str) -> List[str]:
+        return sorted(self._bitmaps[clave])
+
+    def _mascara(self, clave: str, seleccion: Sequence[str]) -> int:
+        if not seleccion:
+            return self._todos
+        mascara = 0
+        for valor in seleccion:
+            mascara |= self._bitmaps[clave].get(valor, 0)
+        return mascara
+
+    def filtrar(self, filtros: Filtros) -> int:
+        """Bitmap de los proveedores que cumplen todos los filtros."""
+        resultado = self._todos
+        for clave, seleccion in filtros.items():
+            resultado &= self._mascara(clave, seleccion)
+        return resultado
+
+    def contar(self, filtros: Filtros) -> Tuple[int, Dict[str, Dict[str, int]]]:
+        """
+        Total filtrado y, por faceta, cuántos proveedores tendría cada valor
+        aplicando los filtros de las *demás* facetas (facetado disyuntivo).
+        """
+        mascaras = {clave: self._mascara(clave, filtros.get(clave, ())) for clave, _, _ in FACETAS}
+        total = self._todos
+        for mascara in mascaras.values():
+            total &= mascara
+        conteos: Dict[str, Dict[str, int]] = {}
+        for clave, _, _ in FACETAS:
+            otras = self._todos
+            for otra, mascara in mascaras.items():
+                if otra != clave:
+                    otras &= mascara
+            conteos[clave] = {valor: _popcount(bm & otras) for valor, bm in self._bitmaps[clave].items()}
+        return _popcount(total), conteos
+
+    def cuils(self, filtros: Filtros) -> Iterator[str]:
+        """CUIL que cumplen los filtros, en orden."""
+        bitmap = self.filtrar(filtros)
+        datos = bitmap.to_bytes((len(self._cuils) + 7) // 8, "little")
+        for byte_idx, byte in enumerate(datos):
+            while byte:
+                bajo = byte & -byte
+                yield f"{self._cuils[(byte_idx << 3) + bajo.bit_length() - 1]:011d}"
+                byte ^= bajo
+
+    def estadisticas(self) -> Dict[str, Any]:
+        bytes_bitmaps = sum((bm.bit_length() + 7) // 8 for v in self._bitmaps.values() for bm in v.values())
+        return {
+            "proveedores": len(self._cuils),
+            "valores": {clave: len(v) for clave, v in self._bitmaps.items()},
+            "bytes_bitmaps": bytes_bitmaps,
+        }
+
+
+def filas_facetas(conexion: Callable[[], ContextManager[Any]], replica=None) -> Iterator[Sequence[Any]]:
+    """Filas para IndiceFacetas.construir(): desde la réplica local si está completa, si no SQL01."""
+    if replica is not None and replica.estado()["carga_inicial_completa"]:
+        yield from replica.leer_columnas(*(col for _, col, _ in FACETAS))
+        return
+    with conexion() as conn:
+        cursor = conn.cursor()
+        cursor.execute(_SQL_CARGA)
+        while True:
+            filas = cursor.fetchmany(LOTE_LECTURA)
+            if not filas:
+                break
+            yield from filas
+        cursor.close()
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Panel de filtros
+# ─────────────────────────────────────────────────────────────────────
+class PanelFacetas(QWidget):
+    """
+    Una lista tildable por faceta con conteos en vivo. Emite ``filtros_cambiados``
+    (con antirrebote) para que la grilla recargue con los filtros.
+    """
+
+    filtros_cambiados = pyqtSignal(dict)
+
+    def __init__(self, indice: IndiceFacetas, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.indice = indice
+        self._listas: Dict[str, QListWidget] = {}
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.total_label = QLabel("Cargando filtros…", self)
+        layout.addWidget(self.total_label)
+
+        contenido = QWidget(self)
+        grupos = QVBoxLayout(contenido)
+        grupos.setContentsMargins(0, 0, 0, 0)
+        for clave, _, titulo in FACETAS:
+            grupo = QGroupBox(titulo, contenido)
+            caja = QVBoxLayout(grupo)
+            lista = QListWidget(grupo)
+            lista.setMaximumHeight(140)
+            lista.itemChanged.connect(self._al_tildar)
+            caja.addWidget(lista)
+            grupos.addWidget(grupo)
+            self._listas[clave] = lista
+        grupos.addStretch(1)
+        scroll = QScrollArea(self)
+        scroll.setWidget(contenido)
+        scroll.setWidgetResizable(True)
+        layout.addWidget(scroll, 1)
+
+        self.btn_limpiar = QPushButton("Limpiar filtros", self)
+        self.btn_limpiar.clicked.connect(self.limpiar)
+        layout.addWidget(self.btn_limpiar)
+
+        self._emitir = QTimer(self)
+        self._emitir.setSingleShot(True)
+        self._emitir.setInterval(ESPERA_FILTRO_MS)
+        self._emitir.timeout.connect(lambda: self.filtros_cambiados.emit(self.filtros()))
+
+    def poblar(self) -> None:
+        """Crea los ítems de cada faceta (llamar cuando el índice está listo)."""
+        for clave, lista in self._listas.items():
+            lista.blockSignals(True)
+            lista.clear()
+            for valor in self.indice.valores(clave):
+                item = QListWidgetItem(lista)
+                item.setData(Qt.UserRole, valor)
+                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+                item.setCheckState(Qt.Unchecked)
+            lista.blockSignals(False)
+        self._refrescar_conteos()
+
+    def filtros(self) -> Dict[str, List[str]]:
+        seleccion: Dict[str, List[str]] = {}
+        for clave, lista in self._listas.items():
+            valores = [
+                lista.item(i).data(Qt.UserRole)
+                for i in range(lista.count()) if lista.item(i).checkState() == Qt.Checked
+            ]
+            if valores:
+                seleccion[clave] = valores
+        return seleccion
+
+    def limpiar(self) -> None:
+        for lista in self._listas.values():
+            lista.blockSignals(True)
+            for i in range(lista.count()):
+                lista.item(i).setCheckState(Qt.Unchecked)
+            lista.blockSignals(False)
+        self._al_tildar()
+
+    def _al_tildar(self, *_args) -> None:
+        self._refrescar_conteos()
+        self._emitir.start()
+
+    def _refrescar_conteos(self) -> None:
+        if not self.indice.listo:
+            return
+        total, conteos = self.indice.contar(self.filtros())
+        self.total_label.setText(f"{total:,} proveedores coinciden".replace(",", "."))
+        for clave, lista in self._listas.items():
+            lista.blockSignals(True)
+            for i in range(lista.count()):
+                item = lista.item(i)
+                valor = item.data(Qt.UserRole)
+                item.setText(f"{valor or ETIQUETA_SIN_DATO} ({conteos[clave].get(valor, 0):,})".replace(",", "."))
+            lista.blockSignals(False)
@@ -0,0 +1,288 @@
+# anto_modulos/grilla_proveedores.py
+# Grilla virtualizada del padrón: QAbstractTableModel con carga diferida
+# (canFetchMore/fetchMore) y paginado por clave sobre CUIL.
+#
+# Cada página se pide con el último CUIL de la anterior (AntoPage_Proveedores),
+# nunca con OFFSET. Del padrón solo quedan en memoria:
+#   - el CUIL con que empieza cada página (≈2.500 claves para 500.000 filas), y
+#   - las últimas PAGINAS_EN_MEMORIA páginas usadas (CacheLRU).
+# Si la vista pide una fila de una página desalojada, se vuelve a traer en
+# segundo plano a partir de su clave y la celda muestra "…" mientras tanto.
+
+from __future__ import annotations
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt, pyqtSignal
+from PyQt5.QtWidgets import (
+    QAbstractItemView, QFileDialog, QHBoxLayout, QHeaderView, QLabel, QMessageBox, QProgressDialog,
+    QPushButton, QSplitter, QTableView, QVBoxLayout, QWidget,
+)
+
+from anto_modulos.anto_conexion import conexion, pagina_proveedores
+from anto_modulos.cache_lru import CacheLRU
+from anto_modulos.facetas import IndiceFacetas, PanelFacetas, filas_facetas
+from anto_modulos.tareas_db import EjecutorDB
+
+# ─── Configuración ────────────────────────────────────────────────────────────
+TAM_PAGINA = 200
+PAGINAS_EN_MEMORIA = 20       # ≈4.000 filas: la ventana visible más un margen
+ALTO_FILA = 22
+
+COLUMNAS = ("CUIL", "Razón Social", "Localidad", "Provincia", "Condición CTA", "Condición AFIP")
+_PENDIENTE = "…"
+
+
+class ModeloProveedores(QAbstractTableModel):
+    """Modelo de solo lectura sobre Proveedores, paginado por CUIL."""
+
+    error = pyqtSignal(str)
+
+    def __init__(
+        self,
+        ejecutor: EjecutorDB,
+        cargar: Callable[..., List[Sequence[Any]]] = pagina_proveedores,
+        tam_pagina: int = TAM_PAGINA,
+        paginas_en_memoria: int = PAGINAS_EN_MEMORIA,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self._ejecutor = ejecutor
+        self._cargar = cargar
+        self.tam_pagina = tam_pagina
+        self._paginas = CacheLRU(paginas_en_memoria, ttl_s=None)
+        self._generacion = 0      # descarta respuestas llegadas después de reiniciar()
+        self.filtros: Dict[str, List[str]] = {}
+        self._vaciar()
+
+    def _vaciar(self) -> None:
+        self._paginas.limpiar()
+        self._inicios: List[Optional[str]] = [None]  # clave (exclusiva) de cada página conocida
+        self._conocidas = 0       # páginas cuya cantidad de filas ya se sabe
+        self._filas = 0
+        self._fin = False
+        self._pedidas: Set[int] = set()
+
+    # ── API de Qt ──
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._filas
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNAS)
+
+    def headerData(self, seccion: int, orientacion, rol=Qt.DisplayRole):
+        if rol == Qt.DisplayRole and orientacion == Qt.Horizontal:
+            return COLUMNAS[seccion]
+        return None
+
+    def data(self, index: QModelIndex, rol=Qt.DisplayRole):
+        if not index.isValid() or rol not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        fila = self._fila(index.row())
+        if fila is None:
+            return _PENDIENTE if index.column() == 0 else None
+        valor = fila[index.column()]
+        return "" if valor is None else str(valor).strip()
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and not self._fin and self._conocidas not in self._pedidas
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if self.canFetchMore(parent):
+            self._pedir(self._conocidas)
+
+    # ── Páginas ──
+
+    def _fila(self, fila: int) -> Optional[Sequence[Any]]:
+        pagina, desplazamiento = divmod(fila, self.tam_pagina)
+        filas = self._paginas.obtener(pagina)
+        if filas is None:
+            self._pedir(pagina)  # desalojada: volver a traerla desde su clave
+            return None
+        return filas[desplazamiento] if desplazamiento < len(filas) else None
+
+    def _pedir(self, pagina: int) -> None:
+        if pagina in self._pedidas or pagina >= len(self._inicios):
+            return
+        self._pedidas.add(pagina)
+        generacion = self._generacion
+        self._ejecutor.ejecutar(
+            self._cargar, self._inicios[pagina], self.tam_pagina, self.filtros,
+            al_terminar=lambda filas: self._recibida(generacion, pagina, filas),
+            al_fallar=lambda e: self._fallida(generacion, pagina, e),
+        )
+
+    def _recibida(self, generacion: int, pagina: int, filas: List[Sequence[Any]]) -> None:
+        if generacion != self._generacion:
+            return
+        self._pedidas.discard(pagina)
+        self._paginas.guardar(pagina, filas)
+        primera = pagina * self.tam_pagina
+        if pagina == self._conocidas:
+            # Página nueva al final: agrega filas y anota la clave de la siguiente
+            if len(filas) < self.tam_pagina:
+                self._fin = True
+            else:
+                self._inicios.append(str(filas[-1][0]).strip())
+            self._conocidas += 1
+            if filas:
+                self.beginInsertRows(QModelIndex(), primera, primera + len(filas) - 1)
+                self._filas += len(filas)
+                self.endInsertRows()
+        elif filas:
+            self.dataChanged.emit(
+                self.index(primera, 0),
+                self.index(primera + len(filas) - 1, len(COLUMNAS) - 1),
+            )
+
+    def _fallida(self, generacion: int, pagina: int, error: Exception) -> None:
+        if generacion == self._generacion:
+            self._pedidas.discard(pagina)
+            self.error.emit(str(error))
+
+    # ── Uso desde la ventana ──
+
+    def cuil_en(self, fila: int) -> Optional[str]:
+        datos = self._fila(fila)
+        return str(datos[0]).strip() if datos else None
+
+    def reiniciar(self) -> None:
+        """Vuelve a la primera página (p. ej. tras cambios en la base)."""
+        self.beginResetModel()
+        self._generacion += 1
+        self._vaciar()
+        self.endResetModel()
+
+    def aplicar_filtros(self, filtros: Dict[str, List[str]]) -> None:
+        """Reinicia el paginado con nuevos filtros de facetas."""
+        self.filtros = dict(filtros)
+        self.reiniciar()
+
+    def estadisticas(self) -> dict:
+        return {
+            "filas": self._filas,
+            "paginas_conocidas": self._conocidas,
+            "paginas_en_memoria": len(self._paginas),
+            "completo": self._fin,
+        }
+
+
+class _AvanceExportacion(QObject):
+    """Lleva el progreso de la exportación (hilo del pool) al hilo de la GUI."""
+    avance = pyqtSignal(int, object)
+
+
+class GrillaProveedores(QWidget):
+    """Pestaña de navegación del padrón con panel de facetas. Doble clic → ``cuil_elegido``."""
+
+    cuil_elegido = pyqtSignal(str)
+
+    def __init__(self, ejecutor: EjecutorDB, replica=None, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._ejecutor = ejecutor
+        self._replica = replica
+        self.modelo = ModeloProveedores(ejecutor, parent=self)
+        self.facetas = IndiceFacetas()
+        self._facetas_pedidas = False
+
+        layout = QVBoxLayout(self)
+        divisor = QSplitter(Qt.Horizontal, self)
+        self.panel_facetas = PanelFacetas(self.facetas, divisor)
+        self.panel_facetas.filtros_cambiados.connect(self.modelo.aplicar_filtros)
+        divisor.addWidget(self.panel_facetas)
+
+        self.tabla = QTableView(divisor)
+        self.tabla.setModel(self.modelo)
+        self.tabla.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.tabla.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.tabla.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tabla.setAlternatingRowColors(True)
+        # Alto fijo: la vista no mide filas, solo pide las visibles
+        self.tabla.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.tabla.verticalHeader().setDefaultSectionSize(ALTO_FILA)
+        self.tabla.verticalHeader().setVisible(False)
+        self.tabla.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        self.tabla.doubleClicked.connect(self._doble_clic)
+        divisor.addWidget(self.tabla)
+        divisor.setStretchFactor(1, 1)
+        layout.addWidget(divisor)
+
+        pie = QHBoxLayout()
+        self.estado = QLabel("", self)
+        self.estado.setProperty("secundario", True)
+        pie.addWidget(self.estado, 1)
+        self.btn_recargar = QPushButton("Recargar", self)
+        self.btn_recargar.clicked.connect(self.modelo.reiniciar)
+        pie.addWidget(self.btn_recargar)
+        self.btn_exportar = QPushButton("Exportar…", self)
+        self.btn_exportar.setToolTip("Exporta a CSV o Excel los proveedores que cumplen los filtros")
+        self.btn_exportar.clicked.connect(self._exportar)
+        pie.addWidget(self.btn_exportar)
+        layout.addLayout(pie)
+
+        self.modelo.rowsInserted.connect(self._actualizar_estado)
+        self.modelo.modelReset.connect(self._actualizar_estado)
+        self.modelo.error.connect(lambda e: self.estado.setText(f"Error al cargar: {e}"))
+
+    def showEvent(self, e) -> None:
+        super().showEvent(e)
+        if not self._facetas_pedidas:
+            # Índice de facetas: se arma una sola vez, al abrir la pestaña por primera vez
+            self._facetas_pedidas = True
+            self._ejecutor.ejecutar(
+                lambda: self.facetas.construir(filas_facetas(conexion, self._replica)),
+                al_terminar=lambda _r: self.panel_facetas.poblar(),
+                al_fallar=lambda e: self.panel_facetas.total_label.setText(f"Filtros no disponibles: {e}"),
+            )
+
+    def _actualizar_estado(self, *_args) -> None:
+        stats = self.modelo.estadisticas()
+        sufijo = "" if stats["completo"] else " (desplazá para ver más)"
+        self.estado.setText(f"{stats['filas']:,} proveedores cargados".replace(",", ".") + sufijo)
+
+    def _exportar(self) -> None:
+        ruta, _ = QFileDialog.getSaveFileName(
+            self, "Exportar padrón", "proveedores.xlsx", "Excel (*.xlsx);;CSV (*.csv)"
+        )
+        if not ruta:
+            return
+        from anto_modulos.exportacion import exportar  # diferido: solo hace falta al exportar
+        cancelar = threading.Event()
+        dialogo = QProgressDialog("Exportando proveedores…", "Cancelar", 0, 0, self)
+        dialogo.setWindowTitle("Exportar")
+        dialogo.setWindowModality(Qt.WindowModal)
+        dialogo.setMinimumDuration(0)
+        dialogo.canceled.connect(cancelar.set)
+        avance = _AvanceExportacion(dialogo)
+
+        def mostrar_avance(filas: int, total: Optional[int]) -> None:
+            if total:
+                dialogo.setMaximum(total)
+                dialogo.setValue(min(filas, total))
+            texto = f"Exportando proveedores… {filas:,}" + (f" de {total:,}" if total else "")
+            dialogo.setLabelText(texto.replace(",", "."))
+
+        def terminado(resumen) -> None:
+            dialogo.close()
+            self.btn_exportar.setEnabled(True)
+            if not resumen.cancelada:
+                QMessageBox.information(self, "Exportar", f"Se exportaron {resumen.filas} proveedores a:\n{resumen.ruta}")
+
+        def fallido(error: Exception) -> None:
+            dialogo.close()
+            self.btn_exportar.setEnabled(True)
+            QMessageBox.critical(self, "Exportar", f"No se pudo exportar: {error}")
+
+        avance.avance.connect(mostrar_avance)
+        self.btn_exportar.setEnabled(False)
+        self._ejecutor.ejecutar(
+            exportar, ruta, filtros=self.modelo.filtros, progreso=avance.avance.emit, cancelar=cancelar,
+            al_terminar=terminado, al_fallar=fallido,
+        )
+        dialogo.show()
+
+    def _doble_clic(self, index: QModelIndex) -> None:
+        cuil = self.modelo.cuil_en(index.row())
+        if cuil:
+            self.cuil_elegido.emit(cuil)
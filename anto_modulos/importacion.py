@@ -0,0 +1,566 @@
+# anto_modulos/importacion.py
+# Importación masiva del padrón de proveedores desde CSV o XLSX.
+#
+# El archivo se lee en streaming y se procesa en lotes de tamaño fijo (memoria
+# constante). Cada fila se valida con las mismas reglas que el formulario; las
+# válidas se cargan con fast_executemany en una tabla temporal y se insertan en
+# PROVEEDORES con un único INSERT ... SELECT por lote, salteando los CUIL que ya
+# existen (misma semántica que AntoInsert_Proveedores_By_CUIL). Las filas
+# rechazadas se escriben en un CSV con el motivo.
+#
+# Modo fusión (--modo fusion): aplica datos corregidos sobre CUIL existentes.
+# Solo se comparan las columnas presentes en el archivo (una celda vacía = sin
+# cambio); cada fila modificada se actualiza una sola vez y solo en las columnas
+# que difieren, agrupando por patrón de cambios en UPDATEs set-based.
+#
+# Uso headless:
+#   python -m anto_modulos.importacion padron.csv [--lote 1000] [--rechazos rechazos.csv]
+#   python -m anto_modulos.importacion correcciones.csv --modo fusion
+
+from __future__ import annotations
+import argparse
+import csv
+import os
+import time
+from dataclasses import dataclass, field
+from itertools import chain
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from anto_modulos.anto_conexion import COLUMNAS_PROVEEDOR, conexion, invalidar_lecturas
+from anto_modulos.diferido import ModuloDiferido
+from anto_modulos.registro import configurar_registro
+from anto_modulos.validaciones import validar_proveedor
+
+pyodbc = ModuloDiferido("pyodbc")  # se importa en la primera conexión (ver diferido.py)
+
+LOTE_IMPORTACION = 1000
+FORMATOS_FECHA = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%Y-%m-%d %H:%M:%S")
+
+# Clave de formulario → columna SQL, con CUIL primero
+CAMPOS = (("cuil", "CUIL"),) + tuple(COLUMNAS_PROVEEDOR)
+_COLUMNAS_SQL = ", ".join(col for _, col in CAMPOS)
+
+# Tipos de la tabla temporal (mismos largos que los parámetros de los SPs)
+TIPOS_SQL = {
+    "CUIL": "CHAR(11)",
+    "RAZON_SOCIAL": "VARCHAR(200)",
+    "PROVINCIA": "VARCHAR(50)",
+    "LOCALIDAD": "VARCHAR(50)",
+    "CALLE": "VARCHAR(50)",
+    "CALLE_NRO": "CHAR(6)",
+    "DPTO": "VARCHAR(50)",
+    "PISO": "VARCHAR(50)",
+    "EMAIL": "VARCHAR(50)",
+    "CONDICION_CTA": "VARCHAR(30)",
+    "CONDICION_EN_AFIP": "VARCHAR(30)",
+    "CONDICION_DGR": "VARCHAR(30)",
+    "CONDICION_GCIA": "VARCHAR(30)",
+    "CONDICION_EMPLEADOR": "VARCHAR(30)",
+    "FORMA_JURIDICA": "VARCHAR(80)",
+    "FECHA_ULT_LIB_DEUDA": "DATETIME",
+}
+
+
+def es_texto(col: str) -> bool:
+    return "CHAR" in TIPOS_SQL[col]
+
+
+def sql_crear_staging(tabla: str, columnas: List[str]) -> str:
+    # COLLATE DATABASE_DEFAULT: tempdb puede tener otra intercalación que Gestion
+    definicion = ",\n    ".join(
+        f"{col} {TIPOS_SQL[col]}"
+        + (" COLLATE DATABASE_DEFAULT" if es_texto(col) else "")
+        + (" NOT NULL" if col == "CUIL" else " NULL")
+        for col in columnas
+    )
+    return (
+        f"IF OBJECT_ID('tempdb..{tabla}') IS NOT NULL DROP TABLE {tabla};\n"
+        f"CREATE TABLE {tabla} (\n    {definicion}\n);"
+    )
+
+
+def sql_borrar_staging(tabla: str) -> str:
+    return f"IF OBJECT_ID('tempdb..{tabla}') IS NOT NULL DROP TABLE {tabla};"
+
+
+SQL_CREAR_STAGING = sql_crear_staging("#PROV_IMPORT", [col for _, col in CAMPOS])
+
+SQL_CARGAR_STAGING = (
+    f"INSERT INTO #PROV_IMPORT ({_COLUMNAS_SQL}) VALUES ({', '.join('?' for _ in CAMPOS)})"
+)
+
+# DNI_DESDE_CUIT queda NULL, igual que en el alta desde el formulario
+SQL_INSERTAR_DESDE_STAGING = f"""
+INSERT INTO PROVEEDORES ({_COLUMNAS_SQL}, DNI_DESDE_CUIT)
+SELECT {_COLUMNAS_SQL}, NULL
+FROM #PROV_IMPORT s
+WHERE NOT EXISTS (SELECT 1 FROM PROVEEDORES p WHERE p.CUIL = s.CUIL);
+"""
+
+SQL_VACIAR_STAGING = "TRUNCATE TABLE #PROV_IMPORT;"
+SQL_BORRAR_STAGING = sql_borrar_staging("#PROV_IMPORT")
+
+
+class ErrorImportacion(Exception):
+    """El archivo no se puede importar (formato, encabezados, dependencias)."""
+
+
+@dataclass
+class ResumenImportacion:
+    leidas: int = 0
+    insertadas: int = 0
+    existentes: int = 0
+    rechazadas: int = 0
+    segundos: float = 0.0
+    ruta_rechazos: Optional[str] = None
+
+    @property
+    def filas_por_s(self) -> float:
+        return self.leidas / self.segundos if self.segundos > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"Leídas: {self.leidas} | Insertadas: {self.insertadas} | "
+            f"Ya existentes: {self.existentes} | Rechazadas: {self.rechazadas} | "
+            f"{self.segundos:.1f}s ({self.filas_por_s:,.0f} filas/s)"
+        )
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Lectura en streaming
+# ─────────────────────────────────────────────────────────────────────
+def _mapa_encabezados(encabezados: List[Any]) -> Dict[int, str]:
+    """Índice de columna del archivo → clave interna. Acepta nombres SQL o de formulario."""
+    alias: Dict[str, str] = {}
+    for clave, col in CAMPOS:
+        alias[clave.lower()] = clave
+        alias[col.lower()] = clave
+    alias["cuit"] = "cuil"
+    mapa: Dict[int, str] = {}
+    for i, nombre in enumerate(encabezados):
+        clave = alias.get(str(nombre or "").strip().lower().replace(" ", "_"))
+        if clave:
+            mapa[i] = clave
+    if "cuil" not in mapa.values():
+        raise ErrorImportacion("El archivo no tiene columna CUIL.")
+    return mapa
+
+
+def _como_texto(valor: Any) -> str:
+    if valor is None:
+        return ""
+    if isinstance(valor, float) and valor.is_integer():
+        return str(int(valor))  # Excel guarda CUIL/números como float
+    return str(valor).strip()
+
+
+def _filas_csv(ruta: str, encoding: str) -> Iterator[List[Any]]:
+    with open(ruta, newline="", encoding=encoding) as f:
+        muestra = f.read(4096)
+        f.seek(0)
+        try:
+            dialecto = csv.Sniffer().sniff(muestra, delimiters=",;\t")
+        except csv.Error:
+            dialecto = csv.excel
+        yield from csv.reader(f, dialecto)
+
+
+def _filas_xlsx(ruta: str) -> Iterator[List[Any]]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError as e:
+        raise ErrorImportacion("Para importar .xlsx se necesita el paquete openpyxl.") from e
+    libro = load_workbook(ruta, read_only=True, data_only=True)
+    try:
+        for fila in libro.active.iter_rows(values_only=True):
+            yield list(fila)
+    finally:
+        libro.close()
+
+
+def leer_filas(ruta: str, encoding: str = "utf-8-sig") -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Genera (número de fila en el archivo, {clave: valor}) sin cargar el archivo entero."""
+    ext = os.path.splitext(ruta)[1].lower()
+    if ext in (".xlsx", ".xlsm"):
+        filas = _filas_xlsx(ruta)
+    elif ext in (".csv", ".txt"):
+        filas = _filas_csv(ruta, encoding)
+    else:
+        raise ErrorImportacion(f"Formato no soportado: {ext}")
+
+    encabezados = next(filas, None)
+    if encabezados is None:
+        return
+    mapa = _mapa_encabezados(encabezados)
+    for nro, fila in enumerate(filas, start=2):
+        if not any(v not in (None, "") for v in fila):
+            continue  # fila en blanco
+        yield nro, {clave: fila[i] if i < len(fila) else None for i, clave in mapa.items()}
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Validación / normalización de una fila
+# ─────────────────────────────────────────────────────────────────────
+def _parsear_fecha(valor: Any) -> Optional[datetime]:
+    if valor in (None, ""):
+        return None
+    if isinstance(valor, datetime):
+        return valor
+    texto = str(valor).strip()
+    for fmt in FORMATOS_FECHA:
+        try:
+            return datetime.strptime(texto, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"Fecha no válida: {texto!r}")
+
+
+def normalizar_fila(crudo: Dict[str, Any]) -> Tuple[Optional[tuple], Optional[str]]:
+    """
+    Devuelve (valores en el orden de CAMPOS, None) o (None, motivo de rechazo).
+    Aplica las reglas de validaciones.validar_proveedor más los largos de columna.
+    """
+    datos = {clave: _como_texto(crudo.get(clave)) for clave, _ in CAMPOS if clave != "fecha_ult_lib_deuda"}
+    error = validar_proveedor(datos, controlar_longitudes=True)
+    if error:
+        return None, error
+    try:
+        fecha = _parsear_fecha(crudo.get("fecha_ult_lib_deuda"))
+    except ValueError as e:
+        return None, str(e)
+    valores = tuple(
+        fecha if clave == "fecha_ult_lib_deuda" else (datos[clave] or None)
+        for clave, _ in CAMPOS
+    )
+    return valores, None
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Importación
+# ─────────────────────────────────────────────────────────────────────
+def _insertar_lote(cursor, lote: List[tuple]) -> int:
+    """Carga el lote en #PROV_IMPORT y lo pasa a PROVEEDORES. Devuelve filas insertadas."""
+    cursor.executemany(SQL_CARGAR_STAGING, lote)
+    cursor.execute(SQL_INSERTAR_DESDE_STAGING)
+    insertadas = cursor.rowcount
+    cursor.execute(SQL_VACIAR_STAGING)
+    return max(insertadas, 0)
+
+
+def _duplicado(vistos: Dict[int, int], cuil: str, nro: int) -> Optional[str]:
+    """Registra el CUIL (ya validado) y devuelve el motivo de rechazo si ya apareció antes."""
+    primera = vistos.setdefault(int(cuil), nro)
+    if primera != nro:
+        return f"CUIL duplicado en el archivo (ver fila {primera})"
+    return None
+
+
+def importar_archivo(
+    ruta: str,
+    *,
+    lote: int = LOTE_IMPORTACION,
+    ruta_rechazos: Optional[str] = None,
+    encoding: str = "utf-8-sig",
+    progreso: Optional[Callable[[ResumenImportacion], None]] = None,
+) -> ResumenImportacion:
+    """
+    Importa ``ruta`` (CSV/XLSX) a PROVEEDORES en transacciones de ``lote`` filas.
+    Los CUIL existentes se saltean; las filas inválidas van a ``ruta_rechazos``.
+    """
+    resumen = ResumenImportacion(ruta_rechazos=ruta_rechazos or os.path.splitext(ruta)[0] + ".rechazos.csv")
+    inicio = time.perf_counter()
+
+    with open(resumen.ruta_rechazos, "w", newline="", encoding="utf-8-sig") as f_rech, conexion() as conn:
+        rechazos = csv.writer(f_rech, delimiter=";")
+        rechazos.writerow(["fila", "cuil", "motivo"])
+        cursor = conn.cursor()
+        cursor.fast_executemany = True
+        cursor.execute(SQL_CREAR_STAGING)
+        conn.commit()
+
+        pendientes: Dict[str, Tuple[int, tuple]] = {}  # CUIL → (fila, valores) del lote en curso
+        vistos: Dict[int, int] = {}  # CUIL → primera fila, en todo el archivo (pendientes se vacía por lote)
+
+        def volcar() -> None:
+            if not pendientes:
+                return
+            filas = [valores for _, valores in pendientes.values()]
+            try:
+                insertadas = _insertar_lote(cursor, filas)
+                conn.commit()
+            except pyodbc.Error as e:
+                conn.rollback()
+                cursor.execute(SQL_VACIAR_STAGING)
+                for cuil, (nro, _) in pendientes.items():
+                    rechazos.writerow([nro, cuil, f"Error de base de datos en el lote: {e}"])
+                resumen.rechazadas += len(pendientes)
+            else:
+                resumen.insertadas += insertadas
+                resumen.existentes += len(filas) - insertadas
+            pendientes.clear()
+            if progreso:
+                resumen.segundos = time.perf_counter() - inicio
+                progreso(resumen)
+
+        try:
+            for nro, crudo in leer_filas(ruta, encoding):
+                resumen.leidas += 1
+                valores, motivo = normalizar_fila(crudo)
+                cuil = _como_texto(crudo.get("cuil"))
+                if motivo is None:
+                    motivo = _duplicado(vistos, cuil, nro)
+                if motivo:
+                    rechazos.writerow([nro, cuil, motivo])
+                    resumen.rechazadas += 1
+                    continue
+                pendientes[cuil] = (nro, valores)
+                if len(pendientes) >= lote:
+                    volcar()
+            volcar()
+        finally:
+            # La conexión vuelve al pool: no dejar la tabla temporal viva en la sesión
+            try:
+                cursor.execute(SQL_BORRAR_STAGING)
+                conn.commit()
+            except pyodbc.Error:
+                pass
+            cursor.close()
+
+    resumen.segundos = time.perf_counter() - inicio
+    return resumen
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Fusión (actualización masiva de CUIL existentes)
+# ─────────────────────────────────────────────────────────────────────
+@dataclass
+class ResumenFusion:
+    leidas: int = 0
+    sin_cambios: int = 0
+    actualizadas: int = 0
+    inexistentes: int = 0
+    rechazadas: int = 0
+    segundos: float = 0.0
+    ruta_rechazos: Optional[str] = None
+    cambios_por_columna: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def filas_por_s(self) -> float:
+        return self.leidas / self.segundos if self.segundos > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"Leídas: {self.leidas} | Actualizadas: {self.actualizadas} | "
+            f"Sin cambios: {self.sin_cambios} | CUIL inexistentes: {self.inexistentes} | "
+            f"Rechazadas: {self.rechazadas} | {self.segundos:.1f}s ({self.filas_por_s:,.0f} filas/s)"
+        )
+
+
+def _comparable(alias: str, col: str) -> str:
+    # Intercalación binaria: una corrección de mayúsculas/acentos también es un cambio
+    return f"{alias}.{col} COLLATE Latin1_General_BIN2" if es_texto(col) else f"{alias}.{col}"
+
+
+def sql_diferencias(columnas: List[str]) -> str:
+    """
+    Calcula en #PROV_DIFF, por CUIL, si falta en PROVEEDORES y una máscara de
+    bits con las columnas que cambian (bit i ↔ columnas[i]). EXISTS/EXCEPT
+    compara tratando NULL = NULL; un NULL entrante significa "sin cambio".
+    """
+    bits = " + ".join(
+        f"CASE WHEN s.{col} IS NOT NULL AND EXISTS "
+        f"(SELECT {_comparable('s', col)} EXCEPT SELECT {_comparable('p', col)}) "
+        f"THEN {1 << i} ELSE 0 END"
+        for i, col in enumerate(columnas)
+    )
+    return f"""
+IF OBJECT_ID('tempdb..#PROV_DIFF') IS NOT NULL DROP TABLE #PROV_DIFF;
+SELECT s.CUIL,
+       CASE WHEN p.CUIL IS NULL THEN 1 ELSE 0 END AS FALTA,
+       CASE WHEN p.CUIL IS NULL THEN 0 ELSE {bits} END AS MASCARA
+INTO #PROV_DIFF
+FROM #PROV_MERGE s
+LEFT JOIN PROVEEDORES p ON p.CUIL = s.CUIL;
+"""
+
+
+SQL_RESUMEN_DIFERENCIAS = "SELECT FALTA, MASCARA, COUNT(*) FROM #PROV_DIFF GROUP BY FALTA, MASCARA"
+SQL_CUILS_MODIFICADOS = "SELECT CUIL FROM #PROV_DIFF WHERE FALTA = 0 AND MASCARA <> 0"
+
+
+def sql_actualizar_mascara(columnas: List[str], mascara: int) -> str:
+    """UPDATE de las filas con esa máscara, tocando solo las columnas que cambian."""
+    asignaciones = ", ".join(
+        f"p.{col} = s.{col}" for i, col in enumerate(columnas) if mascara & (1 << i)
+    )
+    return f"""
+UPDATE p SET {asignaciones}
+FROM PROVEEDORES p
+JOIN #PROV_MERGE s ON s.CUIL = p.CUIL
+JOIN #PROV_DIFF d ON d.CUIL = s.CUIL
+WHERE d.FALTA = 0 AND d.MASCARA = ?;
+"""
+
+
+def normalizar_fila_parcial(crudo: Dict[str, Any], claves: List[str]) -> Tuple[Optional[tuple], Optional[str]]:
+    """
+    Como normalizar_fila() pero para un subconjunto de columnas: las celdas
+    vacías quedan en None (= sin cambio) y solo se validan las informadas.
+    """
+    datos = {
+        clave: _como_texto(crudo.get(clave))
+        for clave in claves if clave != "fecha_ult_lib_deuda"
+    }
+    informados = {clave: valor for clave, valor in datos.items() if valor or clave == "cuil"}
+    error = validar_proveedor(informados, controlar_longitudes=True, parcial=True)
+    if error:
+        return None, error
+    try:
+        fecha = _parsear_fecha(crudo.get("fecha_ult_lib_deuda")) if "fecha_ult_lib_deuda" in claves else None
+    except ValueError as e:
+        return None, str(e)
+    return tuple(fecha if clave == "fecha_ult_lib_deuda" else (datos[clave] or None) for clave in claves), None
+
+
+def fusionar_archivo(
+    ruta: str,
+    *,
+    lote: int = LOTE_IMPORTACION,
+    ruta_rechazos: Optional[str] = None,
+    encoding: str = "utf-8-sig",
+    progreso: Optional[Callable[[ResumenFusion], None]] = None,
+) -> ResumenFusion:
+    """
+    Aplica ``ruta`` sobre PROVEEDORES: actualiza solo filas y columnas que
+    cambian e informa filas sin cambios, actualizadas y CUIL inexistentes.
+    """
+    resumen = ResumenFusion(ruta_rechazos=ruta_rechazos or os.path.splitext(ruta)[0] + ".rechazos.csv")
+    inicio = time.perf_counter()
+
+    filas = leer_filas(ruta, encoding)
+    primera = next(filas, None)
+    if primera is None:
+        return resumen
+    # Columnas presentes en el archivo, en el orden de CAMPOS (CUIL primero)
+    claves = [clave for clave, _ in CAMPOS if clave in primera[1]]
+    columnas = [col for clave, col in CAMPOS if clave in primera[1] and clave != "cuil"]
+    if not columnas:
+        raise ErrorImportacion("El archivo no tiene columnas para actualizar además del CUIL.")
+    resumen.cambios_por_columna = {col: 0 for col in columnas}
+    sql_cargar = (
+        f"INSERT INTO #PROV_MERGE (CUIL, {', '.join(columnas)}) "
+        f"VALUES ({', '.join('?' for _ in claves)})"
+    )
+    sql_diff = sql_diferencias(columnas)
+
+    with open(resumen.ruta_rechazos, "w", newline="", encoding="utf-8-sig") as f_rech, conexion() as conn:
+        rechazos = csv.writer(f_rech, delimiter=";")
+        rechazos.writerow(["fila", "cuil", "motivo"])
+        cursor = conn.cursor()
+        cursor.fast_executemany = True
+        cursor.execute(sql_crear_staging("#PROV_MERGE", ["CUIL"] + columnas))
+        conn.commit()
+
+        pendientes: Dict[str, Tuple[int, tuple]] = {}
+        vistos: Dict[int, int] = {}
+
+        def volcar() -> None:
+            if not pendientes:
+                return
+            try:
+                cursor.executemany(sql_cargar, [valores for _, valores in pendientes.values()])
+                cursor.execute(sql_diff)
+                grupos = cursor.execute(SQL_RESUMEN_DIFERENCIAS).fetchall()
+                for falta, mascara, cantidad in grupos:
+                    if not falta and mascara:
+                        cursor.execute(sql_actualizar_mascara(columnas, mascara), (mascara,))
+                modificados = [fila[0] for fila in cursor.execute(SQL_CUILS_MODIFICADOS).fetchall()]
+                cursor.execute("TRUNCATE TABLE #PROV_MERGE;")
+                conn.commit()
+            except pyodbc.Error as e:
+                conn.rollback()
+                cursor.execute("TRUNCATE TABLE #PROV_MERGE;")
+                for cuil, (nro, _) in pendientes.items():
+                    rechazos.writerow([nro, cuil, f"Error de base de datos en el lote: {e}"])
+                resumen.rechazadas += len(pendientes)
+            else:
+                for falta, mascara, cantidad in grupos:
+                    if falta:
+                        resumen.inexistentes += cantidad
+                    elif not mascara:
+                        resumen.sin_cambios += cantidad
+                    else:
+                        resumen.actualizadas += cantidad
+                        for i, col in enumerate(columnas):
+                            if mascara & (1 << i):
+                                resumen.cambios_por_columna[col] += cantidad
+                for cuil in modificados:
+                    invalidar_lecturas(cuil.strip())
+            pendientes.clear()
+            if progreso:
+                resumen.segundos = time.perf_counter() - inicio
+                progreso(resumen)
+
+        try:
+            for nro, crudo in chain([primera], filas):
+                resumen.leidas += 1
+                valores, motivo = normalizar_fila_parcial(crudo, claves)
+                cuil = _como_texto(crudo.get("cuil"))
+                if motivo is None:
+                    motivo = _duplicado(vistos, cuil, nro)
+                if motivo:
+                    rechazos.writerow([nro, cuil, motivo])
+                    resumen.rechazadas += 1
+                    continue
+                pendientes[cuil] = (nro, valores)
+                if len(pendientes) >= lote:
+                    volcar()
+            volcar()
+        finally:
+            try:
+                cursor.execute(sql_borrar_staging("#PROV_DIFF"))
+                cursor.execute(sql_borrar_staging("#PROV_MERGE"))
+                conn.commit()
+            except pyodbc.Error:
+                pass
+            cursor.close()
+
+    resumen.segundos = time.perf_counter() - inicio
+    return resumen
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Importa o fusiona un padrón de proveedores (CSV/XLSX).")
+    parser.add_argument("archivo")
+    parser.add_argument("--modo", choices=("alta", "fusion"), default="alta",
+                        help="alta: inserta CUIL nuevos; fusion: actualiza CUIL existentes")
+    parser.add_argument("--lote", type=int, default=LOTE_IMPORTACION, help="filas por transacción")
+    parser.add_argument("--rechazos", help="CSV de filas rechazadas (por defecto <archivo>.rechazos.csv)")
+    parser.add_argument("--encoding", default="utf-8-sig", help="codificación del CSV (p. ej. cp1252)")
+    args = parser.parse_args(argv)
+    configurar_registro()
+
+    def mostrar(r) -> None:
+        print(f"[importacion] {r}")
+
+    funcion = fusionar_archivo if args.modo == "fusion" else importar_archivo
+    try:
+        resumen = funcion(
+            args.archivo, lote=args.lote, ruta_rechazos=args.rechazos,
+            encoding=args.encoding, progreso=mostrar,
+        )
+    except ErrorImportacion as e:
+        print(f"[importacion] {e}")
+        return 2
+    print(f"[importacion] Finalizado. {resumen}")
+    if isinstance(resumen, ResumenFusion) and resumen.actualizadas:
+        detalle = ", ".join(f"{col}: {n}" for col, n in resumen.cambios_por_columna.items() if n)
+        print(f"[importacion] Cambios por columna: {detalle}")
+    if resumen.rechazadas:
+        print(f"[importacion] Rechazos en: {resumen.ruta_rechazos}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
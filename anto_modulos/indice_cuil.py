@@ -0,0 +1,286 @@
+# anto_modulos/indice_cuil.py
+# Índice en memoria de todos los CUIL para búsqueda parcial (prefijo de CUIL o DNI).
+#
+# Los CUIL se guardan como enteros en dos array('Q') ordenados (8 bytes por
+# entrada cada uno, en lugar de ~60 de un str):
+#   - _cuils: el CUIL tal cual → un prefijo de k dígitos es el rango
+#     [p·10^(11-k), (p+1)·10^(11-k)), resuelto con dos bisect.
+#   - _dnis:  DNI·1000 + tipo·10 + verificador → todos los CUIL de un DNI
+#     quedan contiguos en [dni·1000, (dni+1)·1000).
+# La carga es diferida (primera búsqueda o cargar_en_segundo_plano()) y el
+# refresco es incremental por ROW_VER (ver sql/AntoSync_Proveedores.sql); si la
+# columna no existe se recarga completo cada INTERVALO_REFRESCO_S.
+#
+# Las lecturas de SQL01 y el armado de los arrays corren fuera de _lock; ese
+# lock solo cubre la publicación, así agregar() (hilo de la GUI) nunca espera a
+# la red. Lo agregado mientras una carga está en curso se incorpora al publicarla.
+
+from __future__ import annotations
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from heapq import merge
+from typing import Any, Callable, ContextManager, Dict, Iterable, List, Optional, Tuple
+
+from anto_modulos.diferido import ModuloDiferido
+from anto_modulos.registro import obtener_logger
+
+log = obtener_logger(__name__)
+pyodbc = ModuloDiferido("pyodbc")  # se importa en la primera conexión (ver diferido.py)
+
+# ─── Configuración ────────────────────────────────────────────────────────────
+INTERVALO_REFRESCO_S = 120    # antigüedad máxima antes de buscar CUIL nuevos
+LOTE_LECTURA = 20000          # filas por fetchmany en la carga completa
+MIN_DIGITOS_PREFIJO = 3       # por debajo de esto el rango es demasiado amplio
+MAX_RESULTADOS = 50
+
+_SQL_CARGA = """
+    SELECT CUIL, CAST(ROW_VER AS BINARY(8))
+    FROM PROVEEDORES
+    WHERE ROW_VER < MIN_ACTIVE_ROWVERSION()
+"""
+_SQL_CARGA_SIN_ROW_VER = "SELECT CUIL FROM PROVEEDORES"
+_SQL_CAMBIOS = """
+    SELECT CUIL, CAST(ROW_VER AS BINARY(8))
+    FROM PROVEEDORES
+    WHERE ROW_VER > ? AND ROW_VER < MIN_ACTIVE_ROWVERSION()
+"""
+
+_POTENCIAS = [10 ** i for i in range(12)]
+
+
+def _a_entero(cuil: Any) -> Optional[int]:
+    texto = str(cuil or "").strip()
+    return int(texto) if len(texto) == 11 and texto.isdigit() else None
+
+
+def _clave_dni(cuil: int) -> int:
+    tipo, resto = divmod(cuil, 10 ** 9)
+    dni, verificador = divmod(resto, 10)
+    return dni * 1000 + tipo * 10 + verificador
+
+
+def _cuil_de_clave_dni(clave: int) -> int:
+    dni, resto = divmod(clave, 1000)
+    tipo, verificador = divmod(resto, 10)
+    return tipo * 10 ** 9 + dni * 10 + verificador
+
+
+def _fusionar(base: array, nuevos: Iterable[int]) -> array:
+    """Nuevo array ordenado con ``base`` + ``nuevos`` sin duplicados (base se deja intacto)."""
+    nuevos = sorted(set(nuevos))
+    resultado = array("Q")
+    anterior = None
+    for valor in merge(base, nuevos):
+        if valor != anterior:
+            resultado.append(valor)
+            anterior = valor
+    return resultado
+
+
+def _insertar(valores: array, valor: int) -> bool:
+    """Inserta ``valor`` en su posición (in place). False si ya estaba."""
+    i = bisect_left(valores, valor)
+    if i < len(valores) and valores[i] == valor:
+        return False
+    valores.insert(i, valor)
+    return True
+
+
+class IndiceCUIL:
+    """
+    Índice de CUIL para autocompletar.
+
+    ``conexion`` es una función que devuelve un context manager con una conexión
+    a SQL01 (normalmente ``anto_conexion.conexion``).
+    """
+
+    def __init__(self, conexion: Callable[[], ContextManager[Any]]) -> None:
+        self._conexion = conexion
+        self._cuils = array("Q")
+        self._dnis = array("Q")
+        self._marca: Optional[bytes] = None       # None = sin ROW_VER, refresco completo
+        self._cargado_en: Optional[float] = None
+        self._carga = threading.Lock()             # serializa cargas/refrescos (incluye la red)
+        self._lock = threading.Lock()              # publicación de los arrays y _pendientes
+        self._pendientes: Optional[List[int]] = None  # agregados durante una carga en curso
+        self._hilo: Optional[threading.Thread] = None
+        self.ultimo_error: Optional[str] = None
+
+    # ── Estado ──
+
+    @property
+    def listo(self) -> bool:
+        return self._cargado_en is not None
+
+    def __len__(self) -> int:
+        return len(self._cuils)
+
+    def estadisticas(self) -> Dict[str, Any]:
+        cuils, dnis = self._cuils, self._dnis
+        bytes_ = cuils.buffer_info()[1] * cuils.itemsize + dnis.buffer_info()[1] * dnis.itemsize
+        return {
+            "entradas": len(cuils),
+            "bytes": bytes_,
+            "bytes_por_entrada": bytes_ / len(cuils) if cuils else 0.0,
+            "incremental": self._marca is not None,
+            "antiguedad_s": None if self._cargado_en is None else time.time() - self._cargado_en,
+            "ultimo_error": self.ultimo_error,
+        }
+
+    # ── Búsqueda ──
+
+    def buscar_prefijo(self, prefijo: str, limite: int = MAX_RESULTADOS) -> List[str]:
+        """CUIL que empiezan con ``prefijo`` (en orden)."""
+        if not prefijo.isdigit() or not (MIN_DIGITOS_PREFIJO <= len(prefijo) <= 11):
+            return []
+        cuils = self._cuils  # referencia local: las recargas publican un array nuevo
+        escala = _POTENCIAS[11 - len(prefijo)]
+        desde = int(prefijo) * escala
+        i = bisect_left(cuils, desde)
+        j = min(bisect_left(cuils, desde + escala), i + limite)
+        return [f"{cuils[k]:011d}" for k in range(i, j)]
+
+    def buscar_dni(self, dni: str, limite: int = MAX_RESULTADOS) -> List[str]:
+        """CUIL cuyo DNI (dígitos 3 a 10) es exactamente ``dni`` (7 u 8 dígitos)."""
+        if not dni.isdigit() or len(dni) not in (7, 8):
+            return []
+        dnis = self._dnis
+        desde = int(dni) * 1000
+        i = bisect_left(dnis, desde)
+        j = min(bisect_left(dnis, desde + 1000), i + limite)
+        return [f"{_cuil_de_clave_dni(dnis[k]):011d}" for k in range(i, j)]
+
+    def buscar(self, texto: str, limite: int = MAX_RESULTADOS) -> List[str]:
+        """Coincidencias por DNI exacto primero y luego por prefijo de CUIL."""
+        texto = texto.strip()
+        resultados = self.buscar_dni(texto, limite)
+        vistos = set(resultados)
+        for cuil in self.buscar_prefijo(texto, limite):
+            if len(resultados) >= limite:
+                break
+            if cuil not in vistos:
+                resultados.append(cuil)
+        return resultados
+
+    # ── Carga y refresco ──
+
+    def _empezar_carga(self) -> None:
+        with self._lock:
+            self._pendientes = []
+
+    def _publicar(self, cuils: array, dnis: array) -> None:
+        """Publica arrays recién armados sumando lo agregado mientras se armaban."""
+        with self._lock:
+            for valor in self._pendientes or ():
+                _insertar(cuils, valor)
+                _insertar(dnis, _clave_dni(valor))
+            self._pendientes = None
+            # Asignación atómica: los lectores ven el array viejo o el nuevo, nunca uno a medio armar
+            self._cuils, self._dnis = cuils, dnis
+            self._cargado_en = time.time()
+
+    def _leer(self, cursor, sql: str, *params) -> Tuple[List[int], Optional[bytes]]:
+        cursor.execute(sql, params) if params else cursor.execute(sql)
+        valores: List[int] = []
+        marca = None
+        while True:
+            filas = cursor.fetchmany(LOTE_LECTURA)
+            if not filas:
+                break
+            for fila in filas:
+                valor = _a_entero(fila[0])
+                if valor is not None:
+                    valores.append(valor)
+                if len(fila) > 1 and fila[1] is not None:
+                    rv = bytes(fila[1])
+                    marca = rv if marca is None or rv > marca else marca
+        return valores, marca
+
+    def cargar(self) -> None:
+        """Carga completa desde SQL01."""
+        with self._carga:
+            self._cargar()
+
+    def _cargar(self) -> None:
+        inicio = time.perf_counter()
+        self._empezar_carga()
+        try:
+            with self._conexion() as conn:
+                cursor = conn.cursor()
+                try:
+                    valores, marca = self._leer(cursor, _SQL_CARGA)
+                    marca = marca or b"\x00" * 8
+                except pyodbc.Error:
+                    # Sin columna ROW_VER: solo recargas completas
+                    valores, marca = self._leer(cursor, _SQL_CARGA_SIN_ROW_VER)
+                    marca = None
+                cursor.close()
+            cuils = array("Q", sorted(set(valores)))
+            dnis = array("Q", sorted(_clave_dni(v) for v in cuils))
+        except BaseException:
+            with self._lock:
+                self._pendientes = None
+            raise
+        self._marca = marca
+        self._publicar(cuils, dnis)
+        self.ultimo_error = None
+        log.info("%d CUIL cargados en %.2fs", len(cuils), time.perf_counter() - inicio)
+
+    def refrescar(self) -> int:
+        """Incorpora los CUIL nuevos desde la última carga. Devuelve cuántos se agregaron."""
+        with self._carga:
+            antes = len(self._cuils)
+            if not self.listo or self._marca is None:
+                self._cargar()
+                return max(0, len(self._cuils) - antes)
+            with self._conexion() as conn:
+                cursor = conn.cursor()
+                valores, marca = self._leer(cursor, _SQL_CAMBIOS, self._marca)
+                cursor.close()
+            if marca:
+                self._marca = marca
+            if not valores:
+                self._cargado_en = time.time()
+                return 0
+            with self._lock:
+                self._pendientes = []
+                # Copias: agregar() inserta in place en los arrays publicados
+                base_cuils, base_dnis = self._cuils[:], self._dnis[:]
+            try:
+                cuils = _fusionar(base_cuils, valores)
+                dnis = _fusionar(base_dnis, (_clave_dni(v) for v in valores))
+            except BaseException:
+                with self._lock:
+                    self._pendientes = None
+                raise
+            self._publicar(cuils, dnis)
+            return len(self._cuils) - antes
+
+    def agregar(self, cuil: str) -> None:
+        """Agrega un CUIL recién dado de alta sin esperar al próximo refresco (no-op si ya estaba)."""
+        valor = _a_entero(cuil)
+        if valor is None:
+            return
+        with self._lock:
+            if self._pendientes is not None:
+                self._pendientes.append(valor)  # lo incorpora la carga en curso al publicar
+            if self.listo and _insertar(self._cuils, valor):
+                _insertar(self._dnis, _clave_dni(valor))
+
+    def cargar_en_segundo_plano(self) -> None:
+        """Carga (o refresca si está vencido) en un hilo daemon, sin bloquear la GUI."""
+        if self._hilo is not None and self._hilo.is_alive():
+            return
+        if self.listo and time.time() - self._cargado_en < INTERVALO_REFRESCO_S:
+            return
+        self._hilo = threading.Thread(target=self._cargar_seguro, name="indice-cuil", daemon=True)
+        self._hilo.start()
+
+    def _cargar_seguro(self) -> None:
+        try:
+            self.refrescar()
+        except Exception as e:
+            self.ultimo_error = str(e)
+            log.warning("Error al cargar el índice: %s", e)
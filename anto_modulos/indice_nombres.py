@@ -0,0 +1,289 @@
+# anto_modulos/indice_nombres.py
+# Índice invertido de trigramas sobre RAZON_SOCIAL para buscar proveedores por nombre.
+#
+# Los nombres se normalizan (sin acentos, minúsculas, solo letras/dígitos) y
+# cada palabra aporta sus trigramas con relleno (" sa", "san", "ant", ..., "os ").
+# Cada trigrama apunta a un array('I') con los ids de los documentos que lo
+# contienen. Una búsqueda cuenta trigramas compartidos por documento y ordena
+# por similitud de Jaccard, con un plus si el nombre contiene la consulta entera.
+#
+# Las modificaciones no reescriben las listas: el documento viejo se marca como
+# borrado y se agrega uno nuevo; el índice se compacta cuando hay muchos borrados.
+#
+# La construcción (y la compactación, en un hilo aparte) arma un _Documentos
+# nuevo fuera del lock y lo publica bajo el lock. Las modificaciones que llegan
+# antes de que el índice esté listo o durante una reconstrucción se encolan y se
+# aplican al publicar, así no se pierden.
+
+from __future__ import annotations
+import heapq
+import re
+import sys
+import threading
+import time
+import unicodedata
+from array import array
+from collections import Counter
+from typing import Any, Callable, ContextManager, Dict, Iterable, List, Optional, Tuple
+
+from anto_modulos.registro import obtener_logger
+
+log = obtener_logger(__name__)
+
+# ─── Configuración ────────────────────────────────────────────────────────────
+MIN_CARACTERES = 3            # consultas más cortas no generan trigramas útiles
+MAX_RESULTADOS = 20
+SIMILITUD_MINIMA = 0.2
+PRESUPUESTO_POSTINGS = 250_000  # tope de ids a recorrer por consulta (latencia acotada)
+LOTE_LECTURA = 20000
+
+_SQL_CARGA = "SELECT CUIL, RAZON_SOCIAL FROM PROVEEDORES"
+_NO_ALFANUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalizar(texto: Optional[str]) -> str:
+    """Minúsculas, sin acentos y con un solo espacio entre palabras."""
+    sin_acentos = unicodedata.normalize("NFKD", texto or "").encode("ascii", "ignore").decode("ascii")
+    return _NO_ALFANUM.sub(" ", sin_acentos.lower()).strip()
+
+
+def trigramas(normalizado: str) -> set:
+    resultado = set()
+    for palabra in normalizado.split():
+        relleno = f" {palabra} "
+        resultado.update(relleno[i:i + 3] for i in range(len(relleno) - 2))
+    return resultado
+
+
+class _Documentos:
+    """Estructuras del índice; se arman completas y se publican de una vez."""
+
+    def __init__(self) -> None:
+        self.postings: Dict[str, array] = {}
+        self.cuils = array("Q")          # doc id → CUIL
+        self.nombres: List[str] = []     # doc id → RAZON_SOCIAL original
+        self.normalizados: List[str] = []
+        self.largos = array("H")         # doc id → cantidad de trigramas
+        self.doc_de_cuil: Dict[int, int] = {}
+        self.borrados = 0
+
+    def agregar(self, cuil: int, nombre: str) -> bool:
+        """Alta o modificación de ``cuil``. False si ya tenía ese nombre."""
+        anterior = self.doc_de_cuil.get(cuil)
+        if anterior is not None:
+            if self.nombres[anterior] == nombre:
+                return False
+            self.nombres[anterior] = ""  # marca de borrado; sus ids quedan huérfanos en postings
+            self.normalizados[anterior] = ""
+            self.borrados += 1
+        doc = len(self.cuils)
+        normalizado = normalizar(nombre)
+        grams = trigramas(normalizado)
+        self.cuils.append(cuil)
+        self.nombres.append(nombre)
+        self.normalizados.append(normalizado)
+        self.largos.append(min(len(grams), 0xFFFF))
+        self.doc_de_cuil[cuil] = doc
+        for gram in grams:
+            ids = self.postings.get(gram)
+            if ids is None:
+                ids = self.postings[gram] = array("I")
+            ids.append(doc)
+        return True
+
+    def requiere_compactar(self) -> bool:
+        return self.borrados > max(1000, len(self.doc_de_cuil) // 10)
+
+
+class IndiceNombres:
+    """
+    Índice de razones sociales para autocompletar.
+
+    ``conexion`` es una función que devuelve un context manager con una conexión
+    a SQL01 (normalmente ``anto_conexion.conexion``). Si se pasa ``replica`` se
+    construye desde la réplica local en lugar de SQL01.
+    """
+
+    def __init__(self, conexion: Callable[[], ContextManager[Any]], replica=None) -> None:
+        self._conexion = conexion
+        self._replica = replica
+        self._lock = threading.Lock()
+        self._hilo: Optional[threading.Thread] = None
+        self._compactando = False
+        self.ultimo_error: Optional[str] = None
+        self._docs = _Documentos()
+        self._listo = False
+        # Modificaciones a aplicar al publicar (None: no hay construcción pendiente)
+        self._pendientes: Optional[List[Tuple[int, str]]] = []
+
+    # ── Estado ──
+
+    @property
+    def listo(self) -> bool:
+        return self._listo
+
+    def __len__(self) -> int:
+        return len(self._docs.doc_de_cuil)
+
+    def estadisticas(self) -> Dict[str, Any]:
+        """Entradas, trigramas y memoria estimada (total y por entrada)."""
+        with self._lock:
+            d = self._docs
+            postings = sum(sys.getsizeof(t) + sys.getsizeof(ids) for t, ids in d.postings.items())
+            textos = sum(sys.getsizeof(n) for n in d.nombres) + sum(sys.getsizeof(n) for n in d.normalizados)
+            estructura = (
+                sys.getsizeof(d.postings) + sys.getsizeof(d.doc_de_cuil)
+                + sys.getsizeof(d.nombres) + sys.getsizeof(d.normalizados)
+                + sys.getsizeof(d.cuils) + sys.getsizeof(d.largos)
+            )
+            entradas = len(d.doc_de_cuil)
+            total = postings + textos + estructura
+            return {
+                "entradas": entradas,
+                "documentos_borrados": d.borrados,
+                "trigramas": len(d.postings),
+                "bytes_postings": postings,
+                "bytes_textos": textos,
+                "bytes_total": total,
+                "bytes_por_entrada": total / entradas if entradas else 0.0,
+            }
+
+    # ── Construcción y actualización ──
+
+    def construir(self, filas: Iterable[Tuple[Any, Optional[str]]]) -> None:
+        """Reconstruye el índice a partir de pares (CUIL, RAZON_SOCIAL)."""
+        inicio = time.perf_counter()
+        with self._lock:
+            if self._pendientes is None:
+                self._pendientes = []
+        try:
+            # Fuera del lock: las búsquedas siguen usando el índice anterior
+            docs = _Documentos()
+            for cuil, nombre in filas:
+                texto = str(cuil or "").strip()
+                if len(texto) == 11 and texto.isdigit() and nombre:
+                    docs.agregar(int(texto), nombre.strip())
+        except BaseException:
+            with self._lock:
+                if self._listo:
+                    self._pendientes = None  # ya se aplicaron al índice vigente
+            raise
+        with self._lock:
+            for cuil, nombre in self._pendientes or ():
+                docs.agregar(cuil, nombre)
+            self._docs = docs
+            self._pendientes = None
+            self._listo = True
+        stats = self.estadisticas()
+        log.info(
+            "%d nombres, %d trigramas en %.2fs (~%.0f bytes/entrada)",
+            stats["entradas"], stats["trigramas"], time.perf_counter() - inicio, stats["bytes_por_entrada"],
+        )
+
+    def _filas_sql(self) -> List[Tuple[Any, Optional[str]]]:
+        filas: List[Tuple[Any, Optional[str]]] = []
+        with self._conexion() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_SQL_CARGA)
+            while True:
+                lote = cursor.fetchmany(LOTE_LECTURA)
+                if not lote:
+                    break
+                filas.extend(lote)
+            cursor.close()
+        return filas
+
+    def cargar(self) -> None:
+        """Construye desde la réplica local si está completa; si no, desde SQL01."""
+        if self._replica is not None and self._replica.estado()["carga_inicial_completa"]:
+            self.construir(self._replica.leer_columnas("RAZON_SOCIAL"))
+        else:
+            self.construir(self._filas_sql())
+
+    def actualizar(self, cuil: str, razon_social: Optional[str]) -> None:
+        """Refleja un alta o modificación hecha desde la aplicación."""
+        texto = (cuil or "").strip()
+        if len(texto) != 11 or not texto.isdigit() or not razon_social:
+            return
+        valor, nombre = int(texto), razon_social.strip()
+        with self._lock:
+            if self._pendientes is not None:
+                self._pendientes.append((valor, nombre))  # la construcción en curso la aplica al publicar
+            if not self._listo:
+                return
+            compactar = (
+                self._docs.agregar(valor, nombre)
+                and self._docs.requiere_compactar()
+                and not self._compactando
+            )
+            if compactar:
+                self._compactando = True
+        if compactar:
+            threading.Thread(target=self._compactar, name="indice-nombres-compactar", daemon=True).start()
+
+    def _compactar(self) -> None:
+        try:
+            with self._lock:
+                d = self._docs
+                docs, cuils, nombres = list(d.doc_de_cuil.values()), d.cuils[:], list(d.nombres)
+                if self._pendientes is None:
+                    self._pendientes = []  # lo modificado desde esta copia se aplica al publicar
+            docs.sort()
+            self.construir((f"{cuils[doc]:011d}", nombres[doc]) for doc in docs)
+        except Exception as e:
+            log.warning("Error al compactar el índice: %s", e)
+        finally:
+            self._compactando = False
+
+    def cargar_en_segundo_plano(self) -> None:
+        if self._listo or (self._hilo is not None and self._hilo.is_alive()):
+            return
+        self._hilo = threading.Thread(target=self._cargar_seguro, name="indice-nombres", daemon=True)
+        self._hilo.start()
+
+    def _cargar_seguro(self) -> None:
+        try:
+            self.cargar()
+            self.ultimo_error = None
+        except Exception as e:
+            self.ultimo_error = str(e)
+            log.warning("Error al construir el índice: %s", e)
+
+    # ── Búsqueda ──
+
+    def buscar(self, texto: str, limite: int = MAX_RESULTADOS) -> List[Tuple[str, str, float]]:
+        """
+        Devuelve hasta ``limite`` tuplas (CUIL, RAZON_SOCIAL, similitud) ordenadas
+        de mayor a menor similitud.
+        """
+        consulta = normalizar(texto)
+        if len(consulta.replace(" ", "")) < MIN_CARACTERES or not self._listo:
+            return []
+        grams = trigramas(consulta)
+        with self._lock:
+            d = self._docs
+            listas = sorted(
+                (d.postings[g] for g in grams if g in d.postings), key=len
+            )
+            # Trigramas más raros primero; los muy comunes se saltean si exceden el presupuesto
+            votos: Counter = Counter()
+            recorridos = 0
+            for ids in listas:
+                if recorridos and recorridos + len(ids) > PRESUPUESTO_POSTINGS:
+                    break
+                votos.update(ids)
+                recorridos += len(ids)
+
+            def puntaje(item: Tuple[int, int]) -> float:
+                doc, comunes = item
+                jaccard = comunes / (len(grams) + d.largos[doc] - comunes)
+                return jaccard + (0.5 if consulta in d.normalizados[doc] else 0.0)
+
+            vivos = ((doc, n) for doc, n in votos.items() if d.nombres[doc])
+            mejores = heapq.nlargest(limite, vivos, key=puntaje)
+            resultados = []
+            for doc, n in mejores:
+                score = puntaje((doc, n))
+                if score >= SIMILITUD_MINIMA:
+                    resultados.append((f"{d.cuils[doc]:011d}", d.nombres[doc], round(score, 3)))
+        return resultados
@@ -0,0 +1,146 @@
+# anto_modulos/odbc_drivers.py
+# Resolución del driver ODBC de SQL Server, compartida por todos los módulos de conexión.
+#
+# En lugar de probar pyodbc.connect con cada driver en cada consulta, el driver
+# ganador se resuelve una vez por proceso (intersectando la lista preferida con
+# pyodbc.drivers()) y se persiste en un cache en disco por equipo y servidor.
+# Si el driver cacheado deja de conectar, se invalida y se vuelve a resolver.
+
+from __future__ import annotations
+import json
+import os
+import socket
+import threading
+from typing import Any, Dict, List, Optional
+
+from anto_modulos.diferido import ModuloDiferido
+from anto_modulos.resources import user_data_path
+from anto_modulos.registro import obtener_logger
+
+log = obtener_logger(__name__)
+pyodbc = ModuloDiferido("pyodbc")  # se importa en la primera conexión (ver diferido.py)
+
+# Orden de preferencia (el primero instalado que conecte gana)
+DRIVERS_PREFERIDOS = [
+    'ODBC Driver 17 for SQL Server',  # Preferido y más reciente
+    'SQL Server Native Client 11.0',  # Native Client version 11
+    'SQL Server Native Client 10.0',  # Native Client version 10
+    'SQL Server',                     # Generic ODBC driver name (legacy)
+]
+
+CACHE_ARCHIVO = "odbc_driver.json"
+
+_lock = threading.Lock()
+_resueltos: Dict[str, str] = {}   # clave host|server → driver (memoria del proceso)
+
+
+def _clave(server: str) -> str:
+    return f"{socket.gethostname().lower()}|{server.lower()}"
+
+
+def _ruta_cache() -> str:
+    return user_data_path(CACHE_ARCHIVO)
+
+
+def _leer_cache() -> Dict[str, str]:
+    try:
+        with open(_ruta_cache(), encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _escribir_cache(data: Dict[str, str]) -> None:
+    ruta = _ruta_cache()
+    tmp = ruta + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, ruta)
+    except OSError as e:
+        log.warning("No se pudo guardar el cache de drivers: %s", e)
+
+
+def drivers_candidatos() -> List[str]:
+    """Drivers preferidos que están efectivamente instalados en el equipo."""
+    try:
+        instalados = set(pyodbc.drivers())
+    except pyodbc.Error:
+        instalados = set()
+    candidatos = [d for d in DRIVERS_PREFERIDOS if d in instalados]
+    # Si el driver manager no informa nada, probar la lista completa como antes
+    return candidatos or list(DRIVERS_PREFERIDOS)
+
+
+def driver_cacheado(server: str) -> Optional[str]:
+    clave = _clave(server)
+    with _lock:
+        if clave not in _resueltos:
+            driver = _leer_cache().get(clave)
+            if driver:
+                _resueltos[clave] = driver
+        return _resueltos.get(clave)
+
+
+def _recordar(server: str, driver: str) -> None:
+    clave = _clave(server)
+    with _lock:
+        if _resueltos.get(clave) == driver:
+            return
+        _resueltos[clave] = driver
+        data = _leer_cache()
+        data[clave] = driver
+        _escribir_cache(data)
+
+
+def invalidar(server: str) -> None:
+    """Olvida el driver resuelto para ``server`` (memoria y disco)."""
+    clave = _clave(server)
+    with _lock:
+        _resueltos.pop(clave, None)
+        data = _leer_cache()
+        if data.pop(clave, None) is not None:
+            _escribir_cache(data)
+
+
+def cadena_conexion(driver: str, server: str, database: str) -> str:
+    return (
+        f"DRIVER={{{driver}}};"
+        f"SERVER={server};"
+        f"DATABASE={database};"
+        "Trusted_Connection=yes;"
+    )
+
+
+def conectar(server: str, database: str, **kwargs: Any):
+    """
+    Abre una conexión Trusted_Connection usando el driver cacheado; solo si
+    falla se recorren los demás candidatos (y el ganador reemplaza al cacheado).
+    """
+    cacheado = driver_cacheado(server)
+    if cacheado:
+        try:
+            return pyodbc.connect(cadena_conexion(cacheado, server, database), **kwargs)
+        except pyodbc.Error as error:
+            log.warning("Driver cacheado %r falló, se vuelve a resolver: %s", cacheado, error)
+            invalidar(server)
+
+    ultimo_error: Optional[Exception] = None
+    for driver in drivers_candidatos():
+        if driver == cacheado:
+            continue
+        try:
+            log.debug("Intentando conectar con el driver: %s", driver)
+            conn = pyodbc.connect(cadena_conexion(driver, server, database), **kwargs)
+            log.info("Conexión exitosa con el driver: %s", driver)
+            _recordar(server, driver)
+            return conn
+        except pyodbc.Error as error:
+            log.warning("Error al intentar conectar con el driver %s: %s", driver, error)
+            ultimo_error = error
+
+    raise Exception(
+        "No se pudo conectar a la base de datos con ninguno de los drivers disponibles."
+        + (f" Último error: {ultimo_error}" if ultimo_error else "")
+    )
@@ -0,0 +1,109 @@
+# anto_modulos/perfil_arranque.py
+# Modo --profile-startup: tiempos de importación y de cada fase del arranque.
+#
+# iniciar() envuelve builtins.__import__ y mide cada módulo la primera vez que
+# se importa (tiempo inclusivo y propio, sin contar los módulos que importa).
+# Funciona también en el .exe de PyInstaller, donde no se puede usar
+# "python -X importtime". escribir_reporte() deja un .txt en
+# %LOCALAPPDATA%\Proveedores\diagnostico con los módulos más caros y las fases.
+
+from __future__ import annotations
+import builtins
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from anto_modulos.resources import user_data_path
+
+ARGUMENTO = "--profile-startup"
+MODULOS_EN_REPORTE = 40
+
+_import_original = builtins.__import__
+_inicio: Optional[float] = None
+_hilo_principal: Optional[int] = None
+_pila: List[List[Any]] = []                               # [nombre, t0, ms de hijos]
+_modulos: Dict[str, Tuple[float, float, int]] = {}        # nombre → (inclusivo, propio, profundidad)
+_marcas: List[Tuple[str, float]] = []
+
+
+def solicitado(argv: Optional[List[str]] = None) -> bool:
+    return ARGUMENTO in (sys.argv if argv is None else argv)
+
+
+def activo() -> bool:
+    return builtins.__import__ is _importar
+
+
+def _importar(nombre, globales=None, locales=None, desde=(), nivel=0):
+    # Solo el hilo principal y solo la primera importación de cada módulo
+    if (
+        threading.get_ident() != _hilo_principal
+        or nivel != 0
+        or nombre in sys.modules
+    ):
+        return _import_original(nombre, globales, locales, desde, nivel)
+    entrada = [nombre, time.perf_counter(), 0.0]
+    _pila.append(entrada)
+    try:
+        return _import_original(nombre, globales, locales, desde, nivel)
+    finally:
+        _pila.pop()
+        ms = (time.perf_counter() - entrada[1]) * 1000
+        if nombre not in _modulos:
+            _modulos[nombre] = (ms, ms - entrada[2], len(_pila))
+        if _pila:
+            _pila[-1][2] += ms
+
+
+def iniciar(inicio: Optional[float] = None) -> None:
+    """Empieza a medir importaciones (llamar antes de las importaciones pesadas)."""
+    global _inicio, _hilo_principal
+    _inicio = inicio if inicio is not None else time.perf_counter()
+    _hilo_principal = threading.get_ident()
+    builtins.__import__ = _importar
+    if ARGUMENTO in sys.argv:
+        sys.argv.remove(ARGUMENTO)
+
+
+def detener() -> None:
+    if activo():
+        builtins.__import__ = _import_original
+
+
+def marcar(fase: str) -> None:
+    """Registra el momento (ms desde el inicio) en que termina ``fase``."""
+    if _inicio is not None:
+        _marcas.append((fase, (time.perf_counter() - _inicio) * 1000))
+
+
+def escribir_reporte(fases: Optional[Dict[str, float]] = None, ruta: Optional[str] = None) -> str:
+    """
+    Escribe el reporte y deja de medir. ``fases``: duraciones en segundos
+    (p. ej. Arranque.fases). Devuelve la ruta del archivo.
+    """
+    detener()
+    if ruta is None:
+        ruta = user_data_path("diagnostico", f"arranque-{datetime.now():%Y%m%d-%H%M%S}.txt")
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+
+    lineas = [f"Perfil de arranque — {datetime.now():%Y-%m-%d %H:%M:%S}", ""]
+    lineas.append("Marcas (ms desde el inicio del proceso)")
+    lineas += [f"  {ms:9.1f}  {fase}" for fase, ms in _marcas]
+    if fases:
+        lineas += ["", "Fases (ms)"]
+        lineas += [f"  {segundos * 1000:9.1f}  {fase}" for fase, segundos in fases.items()]
+
+    directos = sorted(((m, d) for m, d in _modulos.items() if d[2] == 0), key=lambda x: -x[1][0])
+    lineas += ["", f"Importaciones desde main (inclusivo, ms) — total {sum(d[0] for _, d in directos):.1f}"]
+    lineas += [f"  {d[0]:9.1f}  {m}" for m, d in directos[:MODULOS_EN_REPORTE]]
+
+    propios = sorted(_modulos.items(), key=lambda x: -x[1][1])
+    lineas += ["", f"Módulos más caros (tiempo propio, ms) — {len(_modulos)} módulos importados"]
+    lineas += [f"  {d[1]:9.1f}  {'  ' * d[2]}{m}" for m, d in propios[:MODULOS_EN_REPORTE]]
+
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.write("\n".join(lineas) + "\n")
+    return ruta
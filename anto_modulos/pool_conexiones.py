@@ -0,0 +1,363 @@
+# anto_modulos/pool_conexiones.py
+# Pool de conexiones thread-safe para reutilizar sesiones ODBC ya autenticadas.
+#
+# Cada conexión Trusted_Connection implica un handshake Kerberos/NTLM completo;
+# el pool mantiene conexiones "calientes" y las entrega en checkout, verificando
+# su salud si estuvieron ociosas y descartando las que superan el tiempo máximo
+# de inactividad.
+#
+# Al devolverse, la conexión solo hace rollback si quien la usó pudo dejar
+# trabajo sin confirmar: cualquier sentencia que no sea un SELECT ni el EXEC
+# de un procedimiento declarado de solo lectura, sin un commit/rollback
+# posterior. Las lecturas no pagan esa ida y vuelta extra.
+
+from __future__ import annotations
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional
+
+
+class PoolAgotadoError(Exception):
+    """No hubo conexión disponible dentro del tiempo de espera."""
+
+
+_LECTURA = re.compile(r"\s*(SELECT|WITH|SET\s+NOCOUNT)\b", re.I)
+_EXEC = re.compile(r"\s*EXEC(?:UTE)?\s+(?:\[?dbo\]?\.)?\[?(\w+)", re.I)
+
+
+def es_lectura(sql: str, procedimientos: FrozenSet[str] = frozenset()) -> bool:
+    """
+    True si todas las sentencias de ``sql`` son lecturas: SELECT/WITH, SET NOCOUNT
+    o EXEC de un procedimiento de ``procedimientos`` (nombres en minúsculas).
+    """
+    for sentencia in sql.split(";"):
+        if not sentencia.strip() or _LECTURA.match(sentencia):
+            continue
+        m = _EXEC.match(sentencia)
+        if m is None or m.group(1).lower() not in procedimientos:
+            return False
+    return True
+
+
+class _Entrada:
+    __slots__ = ("conexion", "ultimo_uso")
+
+    def __init__(self, conexion: Any) -> None:
+        self.conexion = conexion
+        self.ultimo_uso = time.monotonic()
+
+
+class _CursorPooled:
+    """Cursor de una ConexionPooled: avisa a la conexión qué sentencias ejecuta."""
+
+    def __init__(self, conexion: "ConexionPooled", cursor: Any) -> None:
+        self.__dict__["_conexion"] = conexion
+        self.__dict__["_cursor"] = cursor
+
+    def __getattr__(self, nombre: str) -> Any:
+        return getattr(self._cursor, nombre)
+
+    def __setattr__(self, nombre: str, valor: Any) -> None:
+        setattr(self._cursor, nombre, valor)  # p. ej. fast_executemany
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._cursor)
+
+    def __enter__(self) -> "_CursorPooled":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._cursor.close()
+
+    def execute(self, sql: str, *parametros: Any) -> "_CursorPooled":
+        self._conexion._registrar(sql)
+        self._cursor.execute(sql, *parametros)
+        return self
+
+    def executemany(self, sql: str, parametros: Any) -> None:
+        self._conexion._registrar(sql)
+        self._cursor.executemany(sql, parametros)
+
+
+class ConexionPooled:
+    """
+    Envoltorio de una conexión prestada por el pool.
+
+    Delega todo en la conexión real; ``close()`` la devuelve al pool en lugar de
+    cerrarla, así el código existente (``conn.close()``) sigue funcionando.
+    """
+
+    def __init__(self, pool: "PoolConexiones", entrada: _Entrada) -> None:
+        self._pool = pool
+        self._entrada: Optional[_Entrada] = entrada
+        self._pendiente = False  # pudo quedar trabajo sin confirmar → rollback al devolver
+
+    def __getattr__(self, nombre: str) -> Any:
+        entrada = self.__dict__.get("_entrada")
+        if entrada is None:
+            raise AttributeError(f"Conexión ya devuelta al pool ({nombre})")
+        return getattr(entrada.conexion, nombre)
+
+    def _registrar(self, sql: str) -> None:
+        if not self._pendiente and not es_lectura(sql, self._pool.procedimientos_lectura):
+            self._pendiente = True
+
+    def cursor(self) -> _CursorPooled:
+        return _CursorPooled(self, self.__getattr__("cursor")())
+
+    def execute(self, sql: str, *parametros: Any) -> _CursorPooled:
+        return self.cursor().execute(sql, *parametros)
+
+    def commit(self) -> None:
+        self.__getattr__("commit")()
+        self._pendiente = False
+
+    def rollback(self) -> None:
+        self.__getattr__("rollback")()
+        self._pendiente = False
+
+    def close(self) -> None:
+        entrada, self._entrada = self._entrada, None
+        if entrada is not None:
+            self._pool._devolver(entrada, self._pendiente)
+
+    def descartar(self) -> None:
+        """Cierra la conexión real sin devolverla (p. ej. tras un error de red)."""
+        entrada, self._entrada = self._entrada, None
+        if entrada is not None:
+            self._pool._descartar(entrada)
+
+    def __enter__(self) -> "ConexionPooled":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # Red de seguridad: si alguien olvidó close(), no perder el cupo del pool.
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class PoolConexiones:
+    """
+    Pool thread-safe con tamaño mínimo/máximo, desalojo por inactividad y
+    verificación de salud en checkout.
+
+    ``fabrica`` es una función sin argumentos que abre una conexión nueva.
+    ``procedimientos_lectura``: procedimientos que no escriben (su EXEC no
+    obliga a un rollback al devolver la conexión).
+    """
+
+    def __init__(
+        self,
+        fabrica: Callable[[], Any],
+        *,
+        min_size: int = 1,
+        max_size: int = 4,
+        max_ocioso_s: float = 300.0,
+        verificar_tras_s: float = 30.0,
+        timeout_s: float = 30.0,
+        consulta_salud: str = "SELECT 1",
+        procedimientos_lectura: Iterable[str] = (),
+    ) -> None:
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Tamaños de pool inválidos")
+        self._fabrica = fabrica
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_ocioso_s = max_ocioso_s
+        self.verificar_tras_s = verificar_tras_s
+        self.timeout_s = timeout_s
+        self.consulta_salud = consulta_salud
+        self.procedimientos_lectura = frozenset(p.lower() for p in procedimientos_lectura)
+
+        self._cond = threading.Condition(threading.Lock())
+        self._libres: List[_Entrada] = []   # LIFO: pop() entrega la más reciente
+        self._total = 0                     # libres + prestadas + en apertura
+        self._cerrado = False
+        self._stats: Dict[str, int] = {
+            "hits": 0, "misses": 0, "creadas": 0, "descartadas": 0,
+            "desalojadas": 0, "fallas_salud": 0, "esperas": 0, "rollbacks": 0,
+        }
+
+    # ── API pública ──
+
+    def obtener(self, timeout_s: Optional[float] = None) -> ConexionPooled:
+        """Presta una conexión (reutilizada si hay una libre y sana)."""
+        limite = time.monotonic() + (self.timeout_s if timeout_s is None else timeout_s)
+        while True:
+            entrada = None
+            crear = False
+            with self._cond:
+                if self._cerrado:
+                    raise PoolAgotadoError("El pool está cerrado")
+                ociosas = self._desalojar_ociosas()
+                while not self._libres and self._total >= self.max_size:
+                    restante = limite - time.monotonic()
+                    if restante <= 0:
+                        raise PoolAgotadoError(
+                            f"Sin conexiones libres tras {self.timeout_s:.0f}s (max={self.max_size})"
+                        )
+                    self._stats["esperas"] += 1
+                    self._cond.wait(restante)
+                    if self._cerrado:
+                        raise PoolAgotadoError("El pool está cerrado")
+                if self._libres:
+                    entrada = self._libres.pop()
+                else:
+                    self._total += 1
+                    crear = True
+
+            for vieja in ociosas:
+                _cerrar_silencioso(vieja.conexion)
+            if crear:
+                entrada = self._crear_entrada()
+                with self._cond:
+                    self._stats["misses"] += 1
+                return ConexionPooled(self, entrada)
+
+            if self._saludable(entrada):
+                with self._cond:
+                    self._stats["hits"] += 1
+                return ConexionPooled(self, entrada)
+            # Conexión rota: descartarla y volver a intentar
+            with self._cond:
+                self._stats["fallas_salud"] += 1
+            self._descartar(entrada)
+
+    @contextmanager
+    def conexion(self) -> Iterator[ConexionPooled]:
+        """Context manager: ``with pool.conexion() as conn: ...``"""
+        conn = self.obtener()
+        try:
+            yield conn
+        finally:
+            conn.close()  # _devolver() hace rollback si hace falta y descarta si la sesión quedó rota
+
+    def calentar(self) -> int:
+        """Abre conexiones hasta alcanzar ``min_size``. Devuelve cuántas abrió."""
+        abiertas = 0
+        while True:
+            with self._cond:
+                if self._total >= self.min_size:
+                    return abiertas
+                self._total += 1
+            entrada = self._crear_entrada()
+            self._devolver(entrada, pendiente=False)
+            abiertas += 1
+
+    def cerrar(self) -> None:
+        """
+        Cierra todas las conexiones libres; las prestadas se cierran al
+        devolverse. Después de cerrar, obtener() falla con PoolAgotadoError.
+        """
+        with self._cond:
+            self._cerrado = True
+            libres, self._libres = self._libres, []
+            self._total -= len(libres)
+            self._cond.notify_all()
+        for entrada in libres:
+            _cerrar_silencioso(entrada.conexion)
+
+    def estadisticas(self) -> Dict[str, Any]:
+        """Contadores de hits/misses y ocupación actual del pool."""
+        with self._cond:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["libres"] = len(self._libres)
+            stats["en_uso"] = self._total - len(self._libres)
+            stats["total"] = self._total
+        consultas = stats["hits"] + stats["misses"]
+        stats["ratio_hits"] = (stats["hits"] / consultas) if consultas else 0.0
+        return stats
+
+    # ── Internos ──
+
+    def _crear_entrada(self) -> _Entrada:
+        try:
+            conexion = self._fabrica()
+        except BaseException:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._stats["creadas"] += 1
+        return _Entrada(conexion)
+
+    def _saludable(self, entrada: _Entrada) -> bool:
+        if time.monotonic() - entrada.ultimo_uso < self.verificar_tras_s:
+            return True
+        try:
+            cursor = entrada.conexion.cursor()
+            cursor.execute(self.consulta_salud)
+            cursor.fetchall()
+            cursor.close()
+            return True
+        except Exception:
+            return False
+
+    def _devolver(self, entrada: _Entrada, pendiente: bool = True) -> None:
+        if self._cerrado:
+            self._descartar(entrada)
+            return
+        if pendiente:
+            # Cerrar la transacción que pudo quedar abierta antes de reutilizar la sesión
+            try:
+                entrada.conexion.rollback()
+            except Exception:
+                self._descartar(entrada)
+                return
+            with self._cond:
+                self._stats["rollbacks"] += 1
+        entrada.ultimo_uso = time.monotonic()
+        with self._cond:
+            if self._cerrado:  # cerrar() pudo correr durante el rollback
+                descartar = True
+            else:
+                descartar = False
+                self._libres.append(entrada)
+                self._cond.notify()
+        if descartar:
+            self._descartar(entrada)
+
+    def _descartar(self, entrada: _Entrada) -> None:
+        _cerrar_silencioso(entrada.conexion)
+        with self._cond:
+            self._total -= 1
+            self._stats["descartadas"] += 1
+            self._cond.notify()
+
+    def _desalojar_ociosas(self) -> List[_Entrada]:
+        """
+        Debe llamarse con el lock tomado. Quita del pool las ociosas que sobran
+        del mínimo y las devuelve para cerrarlas fuera del lock.
+        """
+        if not self._libres:
+            return []
+        ahora = time.monotonic()
+        conservar: List[_Entrada] = []
+        desalojar: List[_Entrada] = []
+        # _libres está ordenada de más antigua a más reciente
+        for entrada in self._libres:
+            sobrantes = self._total - len(desalojar) > self.min_size
+            if sobrantes and ahora - entrada.ultimo_uso > self.max_ocioso_s:
+                desalojar.append(entrada)
+            else:
+                conservar.append(entrada)
+        if desalojar:
+            self._libres = conservar
+            self._total -= len(desalojar)
+            self._stats["desalojadas"] += len(desalojar)
+        return desalojar
+
+
+def _cerrar_silencioso(conexion: Any) -> None:
+    try:
+        conexion.close()
+    except Exception:
+        pass
@@ -0,0 +1,127 @@
+# anto_modulos/registro.py
+# Registro (logging) de la aplicación: niveles, formato diferido y escritura
+# en segundo plano a archivos rotativos.
+#
+# Los módulos piden su logger con obtener_logger(__name__) y registran con
+# formato diferido: log.debug("Buscar CUIL %s", cuil). Si el nivel no está
+# habilitado la llamada solo evalúa isEnabledFor (no arma el texto).
+#
+# Los registros pasan por un QueueHandler (barato, en el hilo que llama) y un
+# QueueListener los escribe desde su propio hilo en un RotatingFileHandler
+# (%LOCALAPPDATA%\Proveedores\logs) y en la consola si existe (en el build
+# --noconsole de PyInstaller sys.stderr es None). Allí mismo se enmascaran CUIL
+# y emails si ENMASCARAR_PII está activo.
+#
+# Variables de entorno: PROVEEDORES_LOG_NIVEL (DEBUG/INFO/...) y
+# PROVEEDORES_LOG_PII=1 para ver CUIL y emails sin enmascarar.
+
+from __future__ import annotations
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import sys
+from typing import Optional
+
+from anto_modulos.resources import user_data_path
+
+# ─── Configuración ────────────────────────────────────────────────────────────
+NIVEL_POR_DEFECTO = "INFO"
+ENMASCARAR_PII = True
+ARCHIVO_LOG = "proveedores.log"
+MAX_BYTES = 2 * 1024 * 1024
+ARCHIVOS_RESPALDO = 5
+FORMATO = "%(asctime)s %(levelname)-7s %(threadName)s %(name)s: %(message)s"
+
+RAIZ = "proveedores"
+
+_CUIL_RE = re.compile(r"(?<!\d)(\d{2})(\d{8})(\d)(?!\d)")
+_EMAIL_RE = re.compile(r"([A-Za-z0-9._%+-])[A-Za-z0-9._%+-]*(@[A-Za-z0-9.-]+)")
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def enmascarar(texto: str) -> str:
+    """20123456786 → 20********6 ; juan.perez@x.com → j***@x.com"""
+    texto = _CUIL_RE.sub(lambda m: f"{m.group(1)}{'*' * 8}{m.group(3)}", texto)
+    return _EMAIL_RE.sub(r"\1***\2", texto)
+
+
+class FiltroPII(logging.Filter):
+    """Enmascara CUIL y emails en el mensaje ya formateado (corre en el hilo del listener)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.msg = enmascarar(record.getMessage())
+        record.args = None
+        return True
+
+
+def obtener_logger(nombre: str) -> logging.Logger:
+    """Logger hijo de "proveedores" (p. ej. obtener_logger(__name__))."""
+    nombre = nombre.rsplit(".", 1)[-1] if nombre != "__main__" else "main"
+    return logging.getLogger(f"{RAIZ}.{nombre}")
+
+
+def configurar_registro(
+    nivel: Optional[str] = None,
+    ruta: Optional[str] = None,
+    enmascarar_pii: Optional[bool] = None,
+) -> str:
+    """
+    Instala el QueueHandler/QueueListener (idempotente). Devuelve la ruta del
+    archivo de log.
+    """
+    global _listener
+    pedido = (nivel or os.environ.get("PROVEEDORES_LOG_NIVEL") or NIVEL_POR_DEFECTO).strip().upper()
+    nivel = pedido if isinstance(logging.getLevelName(pedido), int) else NIVEL_POR_DEFECTO
+    if enmascarar_pii is None:
+        enmascarar_pii = ENMASCARAR_PII and os.environ.get("PROVEEDORES_LOG_PII") != "1"
+    ruta = ruta or user_data_path("logs", ARCHIVO_LOG)
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+
+    raiz = logging.getLogger(RAIZ)
+    raiz.setLevel(nivel)
+    if _listener is not None:
+        _avisar_nivel_invalido(pedido, nivel)
+        return ruta
+    raiz.propagate = False
+
+    formato = logging.Formatter(FORMATO)
+    destinos = []
+    archivo = logging.handlers.RotatingFileHandler(
+        ruta, maxBytes=MAX_BYTES, backupCount=ARCHIVOS_RESPALDO, encoding="utf-8", delay=True
+    )
+    destinos.append(archivo)
+    if sys.stderr is not None:
+        destinos.append(logging.StreamHandler(sys.stderr))
+    for destino in destinos:
+        destino.setFormatter(formato)
+        if enmascarar_pii:
+            destino.addFilter(FiltroPII())
+
+    cola: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    raiz.addHandler(logging.handlers.QueueHandler(cola))
+    _listener = logging.handlers.QueueListener(cola, *destinos, respect_handler_level=True)
+    _listener.start()
+    atexit.register(detener_registro)
+    _avisar_nivel_invalido(pedido, nivel)
+    return ruta
+
+
+def _avisar_nivel_invalido(pedido: str, nivel: str) -> None:
+    if pedido != nivel:
+        obtener_logger(__name__).warning(
+            "Nivel de log desconocido %r (PROVEEDORES_LOG_NIVEL); se usa %s", pedido, nivel
+        )
+
+
+def detener_registro() -> None:
+    """Vacía la cola y cierra los archivos (se llama solo al salir)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for destino in _listener.handlers:
+            destino.close()
+        _listener = None
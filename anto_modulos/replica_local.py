@@ -0,0 +1,291 @@
+# anto_modulos/replica_local.py
+# Réplica local (SQLite) de la tabla Proveedores para sucursales con enlaces lentos.
+#
+# Carga inicial completa + pulls incrementales por marca de agua ROW_VER
+# (ver sql/AntoSync_Proveedores.sql). Cada lote se confirma junto con su marca
+# de agua, así una sincronización interrumpida se retoma donde quedó.
+#
+# Las bajas físicas no viajan por ROW_VER: la réplica se reconstruye entera
+# cada RECONSTRUIR_CADA_S para descartarlas. La reconstrucción carga una tabla
+# sombra (proveedores_nueva) con su propia marca de agua; mientras tanto se
+# sigue leyendo la tabla vigente, y al completarse se reemplaza en una sola
+# transacción.
+#
+# estado() no consulta la base: filas, carga completa y última sincronización
+# se mantienen en memoria (y en meta) al confirmar cada lote.
+
+from __future__ import annotations
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
+
+from anto_modulos.anto_conexion import COLUMNAS_PROVEEDOR
+from anto_modulos.registro import obtener_logger
+from anto_modulos.resources import user_data_path
+
+log = obtener_logger(__name__)
+
+# ─── Configuración ────────────────────────────────────────────────────────────
+REPLICA_HABILITADA = False          # activar en sucursales con enlace lento
+REPLICA_ARCHIVO = "replica_proveedores.sqlite3"
+LOTE_SYNC = 5000                    # filas por lote (y por transacción local)
+INTERVALO_SYNC_S = 300              # cada cuánto se buscan cambios
+RECONSTRUIR_CADA_S = 7 * 24 * 3600  # recarga completa semanal (propaga bajas)
+
+_SIN_MARCA = b"\x00" * 8
+_TABLA = "proveedores"
+_TABLA_NUEVA = "proveedores_nueva"   # sombra durante una reconstrucción
+_COLUMNAS = [col for _, col in COLUMNAS_PROVEEDOR]
+_IDX_FECHA = _COLUMNAS.index("FECHA_ULT_LIB_DEUDA")
+
+
+class ReplicaProveedores:
+    """
+    Réplica SQLite de Proveedores.
+
+    ``conexion`` es una función que devuelve un context manager con una conexión
+    a SQL01 (normalmente ``anto_conexion.conexion``).
+    """
+
+    def __init__(
+        self,
+        conexion: Callable[[], ContextManager[Any]],
+        ruta: Optional[str] = None,
+        *,
+        lote: int = LOTE_SYNC,
+        intervalo_s: float = INTERVALO_SYNC_S,
+    ) -> None:
+        self._conexion = conexion
+        self.ruta = ruta or user_data_path(REPLICA_ARCHIVO)
+        self.lote = lote
+        self.intervalo_s = intervalo_s
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._detener = threading.Event()
+        self._hilo: Optional[threading.Thread] = None
+        self.ultimo_error: Optional[str] = None
+        self._db = sqlite3.connect(self.ruta, check_same_thread=False)
+        self._crear_esquema()
+        self._leer_estado()
+
+    # ── Esquema / metadatos ──
+
+    def _crear_tabla(self, tabla: str) -> None:
+        columnas = ", ".join(_COLUMNAS)
+        self._db.execute(
+            f"CREATE TABLE IF NOT EXISTS {tabla} (CUIL TEXT PRIMARY KEY, {columnas}, ROW_VER BLOB)"
+        )
+
+    def _crear_esquema(self) -> None:
+        with self._lock, self._db:
+            self._crear_tabla(_TABLA)
+            self._db.execute("CREATE TABLE IF NOT EXISTS meta (clave TEXT PRIMARY KEY, valor TEXT)")
+
+    def _leer_estado(self) -> None:
+        with self._lock, self._db:
+            filas = self._meta("filas")
+            if filas is None:  # réplica anterior a este contador: se cuenta una sola vez
+                filas = str(self._db.execute(f"SELECT COUNT(*) FROM {_TABLA}").fetchone()[0])
+                self._set_meta("filas", filas)
+            self._filas = int(filas)
+            self._completa = self._meta("carga_inicial_completa") == "1"
+            ultima = self._meta("ultima_sincronizacion")
+            self._ultima = float(ultima) if ultima else None
+            self._reconstruyendo = self._meta("reconstruyendo") == "1"
+
+    def _meta(self, clave: str) -> Optional[str]:
+        fila = self._db.execute("SELECT valor FROM meta WHERE clave = ?", (clave,)).fetchone()
+        return fila[0] if fila else None
+
+    def _set_meta(self, clave: str, valor: str) -> None:
+        self._db.execute("INSERT OR REPLACE INTO meta (clave, valor) VALUES (?, ?)", (clave, valor))
+
+    def estado(self) -> Dict[str, Any]:
+        """
+        Filas, si terminó la carga inicial, momento de la última sincronización
+        completa y segundos desde entonces. No consulta la base ni toma el lock.
+        """
+        ultima = self._ultima
+        return {
+            "filas": self._filas,
+            "carga_inicial_completa": self._completa,
+            "reconstruyendo": self._reconstruyendo,
+            "ultima_sincronizacion": ultima,
+            "antiguedad_s": None if ultima is None else max(0.0, time.time() - ultima),
+            "ultimo_error": self.ultimo_error,
+        }
+
+    def antiguedad_s(self) -> Optional[float]:
+        """Segundos desde que la réplica estuvo al día con SQL01 (None si nunca)."""
+        return self.estado()["antiguedad_s"]
+
+    # ── Lectura ──
+
+    def buscar(self, cuil: str) -> Optional[Dict[str, Any]]:
+        """Registro desde la réplica, o None si la réplica no lo tiene."""
+        sql = f"SELECT {', '.join(_COLUMNAS)} FROM {_TABLA} WHERE CUIL = ?"
+        with self._lock:
+            fila = self._db.execute(sql, (cuil,)).fetchone()
+        if fila is None:
+            return None
+        fila = list(fila)
+        if fila[_IDX_FECHA]:
+            fila[_IDX_FECHA] = datetime.fromisoformat(fila[_IDX_FECHA])
+        return {clave: fila[i] for i, (clave, _) in enumerate(COLUMNAS_PROVEEDOR)}
+
+    def leer_columnas(self, *columnas: str) -> List[Tuple[Any, ...]]:
+        """Filas (CUIL, *columnas) de toda la réplica ordenadas por CUIL (para índices en memoria)."""
+        desconocidas = set(columnas) - set(_COLUMNAS)
+        if desconocidas:
+            raise ValueError(f"Columnas desconocidas: {sorted(desconocidas)}")
+        sql = f"SELECT CUIL, {', '.join(columnas)} FROM {_TABLA} ORDER BY CUIL"
+        with self._lock:
+            return self._db.execute(sql).fetchall()
+
+    def invalidar(self, cuil: str) -> None:
+        """Quita un CUIL (p. ej. tras editarlo) hasta que la próxima sincronización lo traiga."""
+        with self._lock, self._db:
+            borradas = self._db.execute(f"DELETE FROM {_TABLA} WHERE CUIL = ?", (cuil,)).rowcount
+            if self._reconstruyendo:
+                self._db.execute(f"DELETE FROM {_TABLA_NUEVA} WHERE CUIL = ?", (cuil,))
+            if borradas > 0:
+                self._filas -= borradas
+                self._set_meta("filas", str(self._filas))
+
+    # ── Sincronización ──
+
+    def sincronizar(self) -> int:
+        """
+        Trae lotes de cambios hasta alcanzar a SQL01. Devuelve las filas aplicadas.
+        Es seguro interrumpirla: cada lote se confirma junto con su marca de agua.
+        """
+        with self._sync_lock:
+            self._reconstruir_si_corresponde()
+            total = 0
+            while not self._detener.is_set():
+                # Durante una reconstrucción los lotes van a la tabla sombra
+                sombra = self._reconstruyendo
+                with self._lock:
+                    marca_hex = self._meta("marca_agua_nueva" if sombra else "marca_agua")
+                marca = bytes.fromhex(marca_hex) if marca_hex else _SIN_MARCA
+
+                with self._conexion() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute("EXEC dbo.AntoSync_Proveedores @DESDE = ?, @LOTE = ?", (marca, self.lote))
+                    filas = cursor.fetchall()
+                    cursor.close()
+
+                if filas:
+                    self._aplicar_lote(filas, sombra)
+                    total += len(filas)
+                if len(filas) < self.lote:
+                    with self._lock, self._db:
+                        if sombra:
+                            self._reemplazar_por_sombra()
+                        ahora = time.time()
+                        self._set_meta("carga_inicial_completa", "1")
+                        self._set_meta("ultima_sincronizacion", str(ahora))
+                    self._completa, self._ultima = True, ahora
+                    break
+            self.ultimo_error = None
+            return total
+
+    def _aplicar_lote(self, filas, sombra: bool = False) -> None:
+        tabla = _TABLA_NUEVA if sombra else _TABLA
+        clave_filas = "filas_nueva" if sombra else "filas"
+        placeholders = ", ".join("?" for _ in range(len(_COLUMNAS) + 2))
+        sql = f"INSERT OR REPLACE INTO {tabla} (CUIL, {', '.join(_COLUMNAS)}, ROW_VER) VALUES ({placeholders})"
+        datos = []
+        for fila in filas:
+            valores = list(fila)
+            fecha = valores[1 + _IDX_FECHA]
+            if isinstance(fecha, datetime):
+                valores[1 + _IDX_FECHA] = fecha.isoformat()
+            valores[-1] = bytes(valores[-1])
+            datos.append(valores)
+        with self._lock, self._db:
+            existentes = self._contar_existentes(tabla, [valores[0] for valores in datos])
+            self._db.executemany(sql, datos)
+            filas_tabla = int(self._meta(clave_filas) or 0) + len(datos) - existentes
+            self._set_meta(clave_filas, str(filas_tabla))
+            self._set_meta("marca_agua_nueva" if sombra else "marca_agua", bytes(filas[-1][-1]).hex())
+        if not sombra:
+            self._filas = filas_tabla
+
+    def _contar_existentes(self, tabla: str, cuils: List[Any]) -> int:
+        """Cuántos de ``cuils`` ya están en ``tabla`` (para mantener el contador de filas)."""
+        existentes = 0
+        for i in range(0, len(cuils), 500):  # límite de parámetros de SQLite
+            parte = cuils[i:i + 500]
+            existentes += self._db.execute(
+                f"SELECT COUNT(*) FROM {tabla} WHERE CUIL IN ({', '.join('?' for _ in parte)})", parte
+            ).fetchone()[0]
+        return existentes
+
+    def _reemplazar_por_sombra(self) -> None:
+        # Dentro de la transacción de sincronizar(): la tabla vigente se cambia de una vez
+        self._db.execute(f"DROP TABLE {_TABLA}")
+        self._db.execute(f"ALTER TABLE {_TABLA_NUEVA} RENAME TO {_TABLA}")
+        self._set_meta("marca_agua", self._meta("marca_agua_nueva") or _SIN_MARCA.hex())
+        self._set_meta("filas", self._meta("filas_nueva") or "0")
+        self._db.execute(
+            "DELETE FROM meta WHERE clave IN ('marca_agua_nueva', 'filas_nueva', 'reconstruyendo')"
+        )
+        self._filas = int(self._meta("filas"))
+        self._reconstruyendo = False
+        log.info("Réplica reconstruida (%d filas)", self._filas)
+
+    def _reconstruir_si_corresponde(self) -> None:
+        with self._lock:
+            inicio = self._meta("inicio_carga_completa")
+        if inicio and time.time() - float(inicio) < RECONSTRUIR_CADA_S:
+            return
+        self.reconstruir()
+
+    def reconstruir(self) -> None:
+        """
+        Programa una carga completa. Si la réplica ya estaba completa se carga en
+        la tabla sombra y se sigue usando la vigente hasta terminar; si no, se
+        vacía y se carga directamente.
+        """
+        with self._lock, self._db:
+            self._db.execute(f"DROP TABLE IF EXISTS {_TABLA_NUEVA}")
+            self._db.execute("DELETE FROM meta WHERE clave IN ('marca_agua_nueva', 'filas_nueva', 'reconstruyendo')")
+            if self._completa:
+                self._crear_tabla(_TABLA_NUEVA)
+                self._set_meta("reconstruyendo", "1")
+                self._reconstruyendo = True
+            else:
+                self._db.execute(f"DELETE FROM {_TABLA}")
+                self._db.execute("DELETE FROM meta")
+                self._set_meta("filas", "0")
+                self._filas, self._ultima, self._reconstruyendo = 0, None, False
+            self._set_meta("inicio_carga_completa", str(time.time()))
+
+    # ── Hilo en segundo plano ──
+
+    def iniciar(self) -> None:
+        """Sincroniza ahora y luego cada ``intervalo_s`` en un hilo daemon."""
+        if self._hilo is not None and self._hilo.is_alive():
+            return
+        self._detener.clear()
+        self._hilo = threading.Thread(target=self._bucle, name="replica-proveedores", daemon=True)
+        self._hilo.start()
+
+    def detener(self) -> None:
+        self._detener.set()
+        if self._hilo is not None:
+            self._hilo.join(timeout=5)
+
+    def _bucle(self) -> None:
+        while not self._detener.is_set():
+            try:
+                n = self.sincronizar()
+                if n:
+                    log.debug("%d filas sincronizadas", n)
+            except Exception as e:
+                self.ultimo_error = str(e)
+                log.warning("Error al sincronizar: %s", e)
+            self._detener.wait(self.intervalo_s)
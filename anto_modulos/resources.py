@@ -3,6 +3,8 @@ from __future__ import annotations
 import os
 import sys
 
+APP_DIR_NAME = "Proveedores"
+
 def _base_dir() -> str:
     """Carpeta base para recursos. Compatible con PyInstaller (_MEIPASS)."""
     if hasattr(sys, "_MEIPASS"):
@@ -13,9 +15,122 @@ def resource_path(*parts: str) -> str:
     """Devuelve una ruta absoluta a un recurso dentro del proyecto/EXE."""
     return os.path.join(_base_dir(), *parts)
 
+def user_data_path(*parts: str) -> str:
+    """
+    Ruta escribible por usuario para caches locales (%LOCALAPPDATA%\\Proveedores
+    en Windows, ~/.proveedores en otros sistemas). Crea la carpeta si no existe.
+    """
+    base = os.environ.get("LOCALAPPDATA")
+    carpeta = os.path.join(base, APP_DIR_NAME) if base else os.path.join(os.path.expanduser("~"), ".proveedores")
+    os.makedirs(carpeta, exist_ok=True)
+    return os.path.join(carpeta, *parts)
+
 # 🔹 Cambiá estos nombres si tu icono de ventana es otro
 ICON_MAIN = resource_path("Source", "userprofile4.png")  # o "userprofile4.png" si preferís
 # 🔹 Flecha personalizada para el QDateEdit (usa la que ya tenés en /Source)
 DATE_ARROW_DOWN = resource_path("Source", "down-arrow_15775882.png")
 # 🔹 GIF animado para el diálogo de acceso denegado
 GIF_DENEGADO = resource_path("Source", "giphy.gif")
+
+# ─────────────────────────────────────────────────────────────────────
+# Caché de imágenes (pixmaps, íconos y animaciones)
+# ─────────────────────────────────────────────────────────────────────
+# Variantes pre-escaladas (alto en px) que genera preescalar_assets.py al
+# compilar (ver build.bat) en Source/escalados. Si no existen se escala en
+# tiempo de ejecución, igual que antes.
+ESCALADOS = {
+    GIF_DENEGADO: (150,),
+    ICON_MAIN: (36, 160),
+}
+CARPETA_ESCALADOS = ("Source", "escalados")
+
+# Qt se importa recién al pedir una imagen: este módulo lo usan también las
+# herramientas de línea de comandos (importación/exportación).
+_pixmaps: dict = {}
+_iconos: dict = {}
+_animaciones: dict = {}
+
+
+def ruta_escalada(ruta: str, alto: int) -> str:
+    """Ruta de la variante pre-escalada de ``ruta`` a ``alto`` px (puede no existir)."""
+    nombre, extension = os.path.splitext(os.path.basename(ruta))
+    return resource_path(*CARPETA_ESCALADOS, f"{nombre}@{alto}{extension}")
+
+
+def _origen(ruta: str, alto: int | None) -> tuple[str, bool]:
+    """(archivo a leer, ya está escalado)."""
+    if alto is not None:
+        escalada = ruta_escalada(ruta, alto)
+        if os.path.isfile(escalada):
+            return escalada, True
+    return ruta, alto is None
+
+
+def tamano_imagen(ruta: str, alto: int | None = None):
+    """
+    QSize de la imagen leyendo solo el encabezado (sin decodificarla); con
+    ``alto``, el tamaño proporcional a esa altura. QSize() inválido si no existe.
+    """
+    from PyQt5.QtCore import QSize
+    from PyQt5.QtGui import QImageReader
+
+    tamano = QImageReader(ruta).size()
+    if alto is None or not tamano.isValid() or tamano.height() <= 0:
+        return tamano
+    return QSize(round(tamano.width() * alto / tamano.height()), alto)
+
+
+def pixmap(ruta: str, alto: int | None = None):
+    """QPixmap de ``ruta`` (a ``alto`` px si se indica), decodificado una vez por proceso."""
+    from PyQt5.QtGui import QImageReader, QPixmap
+
+    clave = (ruta, alto)
+    pix = _pixmaps.get(clave)
+    if pix is None:
+        archivo, listo = _origen(ruta, alto)
+        lector = QImageReader(archivo)
+        if not listo:
+            # Decodificar directo al tamaño final (sin imagen intermedia a tamaño completo)
+            lector.setScaledSize(tamano_imagen(archivo, alto))
+        imagen = lector.read()
+        pix = QPixmap.fromImage(imagen) if not imagen.isNull() else QPixmap()
+        _pixmaps[clave] = pix
+    return pix
+
+
+def icono(ruta: str):
+    """QIcon compartido (Qt carga el archivo recién cuando hay que dibujarlo)."""
+    from PyQt5.QtGui import QIcon
+
+    ico = _iconos.get(ruta)
+    if ico is None:
+        ico = _iconos[ruta] = QIcon(ruta) if os.path.isfile(ruta) else QIcon()
+    return ico
+
+
+def animacion(ruta: str, alto: int | None = None):
+    """
+    QMovie compartido de ``ruta`` a ``alto`` px. Crearlo no decodifica frames:
+    eso pasa recién con start(). Quien lo muestra debe arrancarlo al mostrarse
+    y detenerlo al ocultarse (es un solo objeto por proceso).
+    """
+    from PyQt5.QtGui import QMovie
+
+    clave = (ruta, alto)
+    movie = _animaciones.get(clave)
+    if movie is None:
+        archivo, listo = _origen(ruta, alto)
+        movie = QMovie(archivo)
+        movie.setCacheMode(QMovie.CacheNone)  # no retener todos los frames en memoria
+        if not listo:
+            movie.setScaledSize(tamano_imagen(archivo, alto))
+        _animaciones[clave] = movie
+    return movie
+
+
+def limpiar_cache_imagenes() -> None:
+    for movie in _animaciones.values():
+        movie.stop()
+    _pixmaps.clear()
+    _iconos.clear()
+    _animaciones.clear()
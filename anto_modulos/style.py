@@ -1,8 +1,20 @@
 # anto_modulos/style.py
 # Estilo global y utilidades de UI (PyQt5)
+#
+# Las hojas de estilo pasan por un registro: cada combinación de parámetros se
+# arma una sola vez (memoria y, con CACHE_EN_DISCO, archivo .qss por hash) y la
+# global se aplica una vez a nivel QApplication. Los widgets heredan de ahí;
+# solo se llama setStyleSheet por widget cuando pisa algo (p. ej. el popup).
+# Para variantes de un mismo widget usar propiedades dinámicas
+# (label.setProperty("secundario", True)) en lugar de hojas por widget.
 
 from __future__ import annotations
-from typing import Optional
+import hashlib
+import json
+import marshal
+import os
+import threading
+from typing import Callable, Dict, Optional
 
 from PyQt5.QtCore import Qt, QPoint
 from PyQt5.QtGui import QColor
@@ -13,6 +25,15 @@ from PyQt5.QtWidgets import (
     QGraphicsDropShadowEffect,
 )
 
+from anto_modulos.registro import obtener_logger
+from anto_modulos.resources import user_data_path
+from anto_modulos.tiempos import fase, medir
+
+log = obtener_logger(__name__)
+
+# ─── Configuración ────────────────────────────────────────────────────────────
+CACHE_EN_DISCO = False    # armar el QSS cuesta microsegundos; útil solo con builders costosos
+
 # ─────────────────────────────────────────────────────────────────────
 # Builder de hoja de estilo (parametrizable)
 # ─────────────────────────────────────────────────────────────────────
@@ -31,6 +52,9 @@ def build_style(
     button_bg_hover: str = "#a8b5cf",
     button_bg_pressed: str = "#6c7a96",
     etiqueta_color: str = "#ff1493",
+    muted_fg: str = "#8d99ae",
+    muted_font_size_px: int = 12,
+    modificado_border: str = "#f4a261",
     progress_chunk: str = "#ef233c",
     # DateEdit
     date_button_bg: str = "#3a3f58",
@@ -66,6 +90,14 @@ QLabel {{
     color: {fg};
     font-weight: 500;
 }}
+/* Texto secundario (estado, notas): label.setProperty("secundario", True) */
+QLabel[secundario="true"] {{
+    color: {muted_fg};
+    font-size: {muted_font_size_px}px;
+}}
+QLabel[chico="true"] {{
+    font-size: {muted_font_size_px}px;
+}}
 
 /* Botones base */
 QPushButton {{
@@ -107,6 +139,10 @@ QDateEdit {{
 QDateEdit:focus {{
     border: 1px solid {button_bg_hover};
 }}
+/* Campo con cambios sin guardar: widget.setProperty("modificado", True) */
+QLineEdit[modificado="true"], QComboBox[modificado="true"], QDateEdit[modificado="true"] {{
+    border: 1px solid {modificado_border};
+}}
 /* Botón de despliegue a la derecha */
 QDateEdit::drop-down {{
     subcontrol-origin: padding;
@@ -214,9 +250,97 @@ QPushButton:pressed {{
 }}
 """
 
-# Hoja de estilo por defecto (podés cambiar parámetros aquí)
-STYLE = build_style()
-POPUP_STYLE = build_popup_style()
+# ─────────────────────────────────────────────────────────────────────
+# Registro de hojas de estilo
+# ─────────────────────────────────────────────────────────────────────
+_hojas: Dict[str, str] = {}
+_lock = threading.Lock()
+_clave_aplicada: Optional[str] = None
+
+
+def clave_estilo(constructor: Callable[..., str], **params) -> str:
+    """Hash de (código del constructor, parámetros): cambia si cambia cualquiera de los dos."""
+    h = hashlib.sha1(marshal.dumps(constructor.__code__))
+    h.update(json.dumps(params, sort_keys=True, default=str).encode())
+    return f"{constructor.__name__}-{h.hexdigest()[:16]}"
+
+
+def _ruta_disco(clave: str) -> str:
+    return user_data_path("estilos", f"{clave}.qss")
+
+
+def hoja_de_estilo(constructor: Callable[..., str] = build_style, **params) -> str:
+    """QSS de ``constructor(**params)``, armado una sola vez por combinación."""
+    clave = clave_estilo(constructor, **params)
+    hoja = _hojas.get(clave)
+    if hoja is not None:
+        return hoja
+    with _lock:
+        hoja = _hojas.get(clave)
+        if hoja is None and CACHE_EN_DISCO:
+            try:
+                with open(_ruta_disco(clave), encoding="utf-8") as f:
+                    hoja = f.read()
+            except OSError:
+                hoja = None
+        if hoja is None:
+            hoja = constructor(**params)
+            if CACHE_EN_DISCO:
+                _guardar_en_disco(clave, hoja)
+        _hojas[clave] = hoja
+    return hoja
+
+
+def _guardar_en_disco(clave: str, hoja: str) -> None:
+    ruta = _ruta_disco(clave)
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    try:
+        with open(ruta + ".tmp", "w", encoding="utf-8") as f:
+            f.write(hoja)
+        os.replace(ruta + ".tmp", ruta)
+    except OSError as e:
+        log.warning("No se pudo guardar el estilo en disco: %s", e)
+
+
+def aplicar_estilo_app(app: Optional[QApplication] = None, **params) -> None:
+    """
+    Aplica build_style(**params) a toda la aplicación; no hace nada si esa misma
+    hoja ya está aplicada. El tiempo queda en el span "estilo_app" (diálogo de
+    diagnóstico); el re-polish de los widgets lo hace Qt al mostrarlos.
+    """
+    global _clave_aplicada
+    app = app or QApplication.instance()
+    clave = clave_estilo(build_style, **params)
+    if app is None or clave == _clave_aplicada:
+        return
+    with medir("estilo_app"):
+        with fase("construir"):
+            hoja = hoja_de_estilo(build_style, **params)
+        with fase("aplicar"):
+            app.setStyleSheet(hoja)
+    _clave_aplicada = clave
+
+
+def asegurar_estilo_app() -> None:
+    """Aplica el estilo por defecto solo si la aplicación todavía no tiene uno."""
+    if _clave_aplicada is None:
+        app = QApplication.instance()
+        if app is not None and not app.styleSheet():
+            aplicar_estilo_app(app)
+
+
+# Hojas por defecto: STYLE / POPUP_STYLE se arman en el primer acceso (vía el
+# registro), no al importar el módulo.
+_PREDETERMINADOS = {
+    "STYLE": build_style,
+    "POPUP_STYLE": build_popup_style,
+}
+
+
+def __getattr__(nombre: str) -> str:
+    if nombre in _PREDETERMINADOS:
+        return hoja_de_estilo(_PREDETERMINADOS[nombre])
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
 
 # ─────────────────────────────────────────────────────────────────────
 # Ventana base con bordes redondeados, arrastre y sombra opcional
@@ -240,7 +364,10 @@ class RoundedWindow(QDialog):
         else:
             self.setWindowFlags(Qt.Window)  # type: ignore
 
-        self.setStyleSheet(stylesheet or STYLE)
+        if stylesheet is not None:
+            self.setStyleSheet(stylesheet)  # solo si la ventana pisa el estilo global
+        else:
+            asegurar_estilo_app()
 
         if shadow:
             effect = QGraphicsDropShadowEffect(self)
@@ -282,7 +409,7 @@ def show_completion_popup(parent, time_elapsed: float) -> None:
     msg.setText(f"La operación finalizó en {time_elapsed:.2f} segundos.")
     msg.setStandardButtons(QMessageBox.StandardButton.Ok)
     msg.setIcon(QMessageBox.Icon.Information)
-    msg.setStyleSheet(POPUP_STYLE)
+    msg.setStyleSheet(hoja_de_estilo(build_popup_style))
     msg.exec()
 
 # ─────────────────────────────────────────────────────────────────────
@@ -292,5 +419,4 @@ def apply_app_style(
     date_arrow_icon_path: Optional[str] = None,
     etiqueta_color: str = "#ff1493",
 ) -> None:
-    style = build_style(etiqueta_color=etiqueta_color, date_arrow_icon_path=date_arrow_icon_path)
-    app.setStyleSheet(style)
+    aplicar_estilo_app(app, etiqueta_color=etiqueta_color, date_arrow_icon_path=date_arrow_icon_path)
@@ -0,0 +1,120 @@
+# anto_modulos/tareas_db.py
+# Ejecuta las llamadas a la base fuera del hilo de la GUI (QThreadPool + señales).
+#
+# Cada tarea corre en un hilo del pool y el resultado vuelve al hilo de la GUI
+# por una señal (conexión en cola). Con ``clave`` una tarea nueva reemplaza a la
+# anterior de la misma clave: si la vieja no empezó se quita de la cola, y si ya
+# está corriendo su resultado se descarta al llegar (una consulta ODBC en curso
+# no se puede abortar de forma segura).
+#
+# Las tareas con ``indicar_ocupado=False`` (p. ej. sugerencias en memoria mientras
+# se tipea) comparten el pool pero no encienden el indicador de ocupado.
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, Optional, Set
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from anto_modulos.registro import obtener_logger
+
+log = obtener_logger(__name__)
+
+MAX_HILOS = 4  # igual que POOL_MAX: más hilos solo esperarían conexión
+
+
+class _Senales(QObject):
+    terminado = pyqtSignal(object)
+    fallo = pyqtSignal(object)
+
+
+class _Tarea(QRunnable):
+    def __init__(self, fn: Callable, args: tuple, kwargs: dict) -> None:
+        super().__init__()
+        self.fn, self.args, self.kwargs = fn, args, kwargs
+        self.senales = _Senales()  # se crea en el hilo de la GUI → emite en cola hacia ella
+
+    def run(self) -> None:
+        try:
+            resultado = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            log.exception("Error en %s: %s", getattr(self.fn, "__name__", self.fn), e)
+            self.senales.fallo.emit(e)
+        else:
+            self.senales.terminado.emit(resultado)
+
+
+class EjecutorDB(QObject):
+    """Cola de tareas de base de datos con reemplazo por clave e indicador de ocupado."""
+
+    ocupado = pyqtSignal(bool)  # True al empezar la primera tarea, False al terminar la última
+
+    def __init__(self, parent: Optional[QObject] = None, max_hilos: int = MAX_HILOS) -> None:
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_hilos)
+        self._en_curso: Set[_Tarea] = set()
+        self._ocupadas: Set[_Tarea] = set()  # las de _en_curso que encienden el indicador
+        self._vigente: Dict[str, _Tarea] = {}
+
+    def ejecutar(
+        self,
+        fn: Callable,
+        *args: Any,
+        clave: Optional[str] = None,
+        al_terminar: Optional[Callable[[Any], None]] = None,
+        al_fallar: Optional[Callable[[Exception], None]] = None,
+        indicar_ocupado: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Corre ``fn(*args, **kwargs)`` en un hilo del pool. ``al_terminar`` /
+        ``al_fallar`` se llaman en el hilo de la GUI, salvo que otra tarea con
+        la misma ``clave`` la haya reemplazado. Con ``indicar_ocupado=False``
+        la tarea no emite ``ocupado``.
+        """
+        tarea = _Tarea(fn, args, kwargs)
+        tarea.setAutoDelete(False)  # la referencia la lleva _en_curso
+
+        if clave is not None:
+            anterior = self._vigente.get(clave)
+            if anterior is not None and self._pool.tryTake(anterior):
+                self._finalizar(anterior)  # nunca empezó: se descarta sin correr
+            self._vigente[clave] = tarea
+
+        def entregar(callback: Optional[Callable[[Any], None]], valor: Any) -> None:
+            vigente = clave is None or self._vigente.get(clave) is tarea
+            self._finalizar(tarea, clave)
+            if vigente and callback:
+                callback(valor)
+
+        tarea.senales.terminado.connect(lambda resultado: entregar(al_terminar, resultado))
+        tarea.senales.fallo.connect(lambda error: entregar(al_fallar, error))
+
+        self._en_curso.add(tarea)
+        if indicar_ocupado:
+            self._ocupadas.add(tarea)
+            if len(self._ocupadas) == 1:
+                self.ocupado.emit(True)
+        self._pool.start(tarea)
+
+    def _finalizar(self, tarea: _Tarea, clave: Optional[str] = None) -> None:
+        if clave is not None and self._vigente.get(clave) is tarea:
+            del self._vigente[clave]
+        self._en_curso.discard(tarea)
+        if tarea in self._ocupadas:
+            self._ocupadas.discard(tarea)
+            if not self._ocupadas:
+                self.ocupado.emit(False)
+
+    def cancelar(self, clave: str) -> None:
+        """Descarta el resultado pendiente de ``clave`` (y la quita de la cola si no empezó)."""
+        tarea = self._vigente.pop(clave, None)
+        if tarea is not None and self._pool.tryTake(tarea):
+            self._finalizar(tarea)
+
+    def en_curso(self) -> int:
+        return len(self._en_curso)
+
+    def esperar(self, timeout_ms: int = -1) -> bool:
+        """Bloquea hasta que terminen las tareas (para el cierre de la aplicación)."""
+        return self._pool.waitForDone(timeout_ms)
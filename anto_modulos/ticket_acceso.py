@@ -0,0 +1,199 @@
+# anto_modulos/ticket_acceso.py
+# Ticket local de acceso: guarda por un tiempo limitado la última decisión
+# POSITIVA de verificar_acceso para no esperar al SP en cada arranque.
+#
+# El ticket (JSON en %LOCALAPPDATA%\Proveedores\acceso) está firmado con
+# HMAC-SHA256 y atado al usuario de Windows y al nombre de la máquina: copiarlo
+# a otro equipo/usuario o editarlo lo invalida. La clave es aleatoria, se crea
+# en el primer uso y en Windows se guarda protegida con DPAPI (solo el mismo
+# usuario en el mismo equipo puede descifrarla).
+#
+# Las denegaciones nunca se guardan: una denegación borra el ticket.
+#
+# TTL configurable con TTL_TICKET_MIN o la variable de entorno
+# PROVEEDORES_ACCESO_TTL_MIN (0 desactiva el ticket).
+
+from __future__ import annotations
+import hashlib
+import hmac
+import json
+import os
+import platform
+import secrets
+import sys
+import time
+from typing import Optional
+
+from anto_modulos.registro import obtener_logger
+from anto_modulos.resources import user_data_path
+
+log = obtener_logger(__name__)
+
+# ─── Configuración ────────────────────────────────────────────────────────────
+TTL_TICKET_MIN = 240          # minutos que vale un ticket desde que se emitió
+TOLERANCIA_RELOJ_S = 300      # emitido "en el futuro" más allá de esto → inválido
+VERSION = 1
+
+ARCHIVO_TICKET = ("acceso", "ticket.json")
+ARCHIVO_CLAVE = ("acceso", "clave.bin")
+
+
+def ttl_segundos() -> int:
+    minutos = os.environ.get("PROVEEDORES_ACCESO_TTL_MIN")
+    try:
+        return max(0, int(minutos)) * 60 if minutos is not None else TTL_TICKET_MIN * 60
+    except ValueError:
+        return TTL_TICKET_MIN * 60
+
+
+def _maquina() -> str:
+    return platform.node().lower()
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Clave (DPAPI en Windows)
+# ─────────────────────────────────────────────────────────────────────
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _CRYPTPROTECT_UI_FORBIDDEN = 0x01
+
+    class _DATA_BLOB(ctypes.Structure):
+        _fields_ = [("cbData", wintypes.DWORD), ("pbData", ctypes.POINTER(ctypes.c_char))]
+
+    def _dpapi(funcion, datos: bytes) -> bytes:
+        buffer = ctypes.create_string_buffer(datos, len(datos))
+        entrada = _DATA_BLOB(len(datos), ctypes.cast(buffer, ctypes.POINTER(ctypes.c_char)))
+        salida = _DATA_BLOB()
+        if not funcion(ctypes.byref(entrada), None, None, None, None,
+                       _CRYPTPROTECT_UI_FORBIDDEN, ctypes.byref(salida)):
+            raise ctypes.WinError()
+        try:
+            return ctypes.string_at(salida.pbData, salida.cbData)
+        finally:
+            ctypes.windll.kernel32.LocalFree(salida.pbData)
+
+    def _proteger(datos: bytes) -> bytes:
+        return _dpapi(ctypes.windll.crypt32.CryptProtectData, datos)
+
+    def _desproteger(datos: bytes) -> bytes:
+        return _dpapi(ctypes.windll.crypt32.CryptUnprotectData, datos)
+
+else:
+    # Fuera de Windows la clave queda en claro, con permisos 0600
+    def _proteger(datos: bytes) -> bytes:
+        return datos
+
+    def _desproteger(datos: bytes) -> bytes:
+        return datos
+
+
+def _escribir(ruta: str, datos: bytes) -> None:
+    temporal = ruta + ".tmp"
+    fd = os.open(temporal, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(datos)
+    os.replace(temporal, ruta)
+
+
+def _clave(crear: bool) -> Optional[bytes]:
+    ruta = user_data_path(*ARCHIVO_CLAVE)
+    try:
+        with open(ruta, "rb") as f:
+            return _desproteger(f.read())
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        log.warning("Clave del ticket ilegible, se genera otra: %s", e)
+    if not crear:
+        return None
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    clave = secrets.token_bytes(32)
+    _escribir(ruta, _proteger(clave))
+    return clave
+
+
+def _firmar(clave: bytes, contenido: dict) -> str:
+    datos = json.dumps(contenido, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hmac.new(clave, datos, hashlib.sha256).hexdigest()
+
+
+# ─────────────────────────────────────────────────────────────────────
+# API
+# ─────────────────────────────────────────────────────────────────────
+
+def emitir(usuario: str, perfil: dict) -> None:
+    """Guarda un ticket para ``usuario`` (solo llamar con acceso PERMITIDO)."""
+    ttl = ttl_segundos()
+    if ttl <= 0:
+        return
+    ahora = time.time()
+    contenido = {
+        "v": VERSION,
+        "usuario": usuario.lower(),
+        "maquina": _maquina(),
+        "emitido": ahora,
+        "expira": ahora + ttl,
+        # El perfil puede traer fechas/decimales: se guarda como texto
+        "perfil": json.loads(json.dumps(perfil, default=str)),
+    }
+    try:
+        clave = _clave(crear=True)
+        ticket = {"contenido": contenido, "firma": _firmar(clave, contenido)}
+        ruta = user_data_path(*ARCHIVO_TICKET)
+        _escribir(ruta, json.dumps(ticket, ensure_ascii=False).encode("utf-8"))
+        log.debug("Ticket de acceso emitido para %s (%d min)", usuario, ttl // 60)
+    except OSError as e:
+        log.warning("No se pudo guardar el ticket de acceso: %s", e)
+
+
+def vigente(usuario: str) -> Optional[dict]:
+    """Perfil guardado si hay un ticket válido y no vencido para ``usuario``; si no, None."""
+    if ttl_segundos() <= 0:
+        return None
+    try:
+        with open(user_data_path(*ARCHIVO_TICKET), encoding="utf-8") as f:
+            ticket = json.load(f)
+        clave = _clave(crear=False)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        log.warning("Ticket de acceso ilegible: %s", e)
+        revocar()
+        return None
+
+    contenido = ticket.get("contenido") if isinstance(ticket, dict) else None
+    if clave is None or not isinstance(contenido, dict) or not hmac.compare_digest(
+        str(ticket.get("firma", "")), _firmar(clave, contenido)
+    ):
+        log.warning("Firma del ticket de acceso inválida → se descarta")
+        revocar()
+        return None
+
+    ahora = time.time()
+    if (
+        contenido.get("v") != VERSION
+        or contenido.get("usuario") != usuario.lower()
+        or contenido.get("maquina") != _maquina()
+    ):
+        log.info("Ticket de acceso de otro usuario/equipo → se descarta")
+        revocar()
+        return None
+    # Tope por el TTL actual además de "expira": bajar el TTL acorta tickets ya emitidos
+    if ahora >= min(contenido["expira"], contenido["emitido"] + ttl_segundos()) \
+            or contenido["emitido"] > ahora + TOLERANCIA_RELOJ_S:
+        log.debug("Ticket de acceso vencido")
+        return None
+    return contenido.get("perfil") or {}
+
+
+def revocar() -> None:
+    """Borra el ticket (p. ej. cuando el SP deniega el acceso)."""
+    try:
+        os.remove(user_data_path(*ARCHIVO_TICKET))
+        log.info("Ticket de acceso revocado")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        log.warning("No se pudo borrar el ticket de acceso: %s", e)
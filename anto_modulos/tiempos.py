@@ -0,0 +1,191 @@
+# anto_modulos/tiempos.py
+# Medición de tiempos de las funciones de acceso a datos.
+#
+# Cada llamada medida es un "span" con su duración total y el desglose por fase
+# (connect, execute, fetch, convert). Los spans se guardan en un buffer circular
+# en memoria (los últimos TAM_BUFFER) y de ahí salen los agregados por
+# operación: cantidad, errores, p50/p95/p99 y máximo.
+#
+#   @medido("buscar_proveedor")
+#   def buscar_proveedor(cuil):
+#       with fase("connect"):
+#           ...
+#
+# Las fases se suman a todos los spans abiertos en el hilo, así una función
+# medida que llama a otra ve también el tiempo de conexión de la interna.
+# Se consultan en el diálogo de diagnóstico (Ctrl+Shift+D) o con exportar().
+
+from __future__ import annotations
+import functools
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from anto_modulos.resources import user_data_path
+
+# ─── Configuración ────────────────────────────────────────────────────────────
+HABILITADO = True
+TAM_BUFFER = 2000             # spans que se conservan (los más viejos se descartan)
+PERCENTILES = (50, 95, 99)
+
+
+class Span:
+    __slots__ = ("nombre", "inicio", "ms", "fases", "error", "hilo")
+
+    def __init__(self, nombre: str) -> None:
+        self.nombre = nombre
+        self.inicio = time.time()
+        self.ms = 0.0
+        self.fases: Dict[str, float] = {}
+        self.error: Optional[str] = None
+        self.hilo = threading.current_thread().name
+
+    def como_dict(self) -> Dict[str, Any]:
+        return {
+            "nombre": self.nombre,
+            "inicio": datetime.fromtimestamp(self.inicio).isoformat(timespec="milliseconds"),
+            "ms": round(self.ms, 3),
+            "fases": {f: round(ms, 3) for f, ms in self.fases.items()},
+            "error": self.error,
+            "hilo": self.hilo,
+        }
+
+
+_buffer: Deque[Span] = deque(maxlen=TAM_BUFFER)
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def _abiertos() -> List[Span]:
+    pila = getattr(_local, "pila", None)
+    if pila is None:
+        pila = _local.pila = []
+    return pila
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Registro de spans
+# ─────────────────────────────────────────────────────────────────────
+@contextmanager
+def medir(nombre: str) -> Iterator[Optional[Span]]:
+    """Mide el bloque como un span ``nombre`` (None si la medición está deshabilitada)."""
+    if not HABILITADO:
+        yield None
+        return
+    span = Span(nombre)
+    pila = _abiertos()
+    pila.append(span)
+    t0 = time.perf_counter()
+    try:
+        yield span
+    except BaseException as e:
+        span.error = span.error or type(e).__name__
+        raise
+    finally:
+        span.ms = (time.perf_counter() - t0) * 1000
+        pila.pop()
+        with _lock:
+            _buffer.append(span)
+
+
+def medido(nombre: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Decorador: cada llamada a la función es un span."""
+    def decorador(fn: Callable) -> Callable:
+        etiqueta = nombre or fn.__name__
+
+        @functools.wraps(fn)
+        def envoltura(*args, **kwargs):
+            with medir(etiqueta):
+                return fn(*args, **kwargs)
+        return envoltura
+    return decorador
+
+
+@contextmanager
+def fase(nombre: str) -> Iterator[None]:
+    """Suma la duración del bloque a la fase ``nombre`` de los spans abiertos del hilo."""
+    pila = getattr(_local, "pila", None)
+    if not pila:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        ms = (time.perf_counter() - t0) * 1000
+        for span in pila:
+            span.fases[nombre] = span.fases.get(nombre, 0.0) + ms
+
+
+def marcar_error(error: BaseException) -> None:
+    """Para funciones que atrapan el error y devuelven False/None: lo anota en el span actual."""
+    pila = getattr(_local, "pila", None)
+    if pila:
+        pila[-1].error = type(error).__name__
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Consulta
+# ─────────────────────────────────────────────────────────────────────
+def spans() -> List[Span]:
+    with _lock:
+        return list(_buffer)
+
+
+def limpiar() -> None:
+    with _lock:
+        _buffer.clear()
+
+
+def _percentil(ordenados: List[float], p: float) -> float:
+    """Percentil por rango más cercano (``ordenados`` no vacío)."""
+    return ordenados[max(0, math.ceil(p / 100 * len(ordenados)) - 1)]
+
+
+def _resumir(valores: List[float]) -> Dict[str, float]:
+    ordenados = sorted(valores)
+    resumen = {f"p{p}": round(_percentil(ordenados, p), 3) for p in PERCENTILES}
+    resumen["max"] = round(ordenados[-1], 3)
+    return resumen
+
+
+def agregados() -> Dict[str, Dict[str, Any]]:
+    """Por operación: n, errores, p50/p95/p99/max del total y de cada fase (ms)."""
+    por_nombre: Dict[str, List[Span]] = {}
+    for span in spans():
+        por_nombre.setdefault(span.nombre, []).append(span)
+    resultado: Dict[str, Dict[str, Any]] = {}
+    for nombre, lista in sorted(por_nombre.items()):
+        fases: Dict[str, List[float]] = {}
+        for span in lista:
+            for f, ms in span.fases.items():
+                fases.setdefault(f, []).append(ms)
+        resultado[nombre] = {
+            "n": len(lista),
+            "errores": sum(1 for s in lista if s.error),
+            **_resumir([s.ms for s in lista]),
+            "fases": {f: _resumir(v) for f, v in fases.items()},
+        }
+    return resultado
+
+
+def exportar(ruta: Optional[str] = None, incluir_spans: bool = True) -> str:
+    """Escribe agregados (y los spans del buffer) a JSON. Devuelve la ruta."""
+    if ruta is None:
+        ruta = user_data_path("diagnostico", f"tiempos-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    datos: Dict[str, Any] = {
+        "generado": datetime.now().isoformat(timespec="seconds"),
+        "agregados": agregados(),
+    }
+    if incluir_spans:
+        datos["spans"] = [s.como_dict() for s in spans()]
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump(datos, f, indent=2, ensure_ascii=False)
+    return ruta
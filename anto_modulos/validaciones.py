@@ -0,0 +1,76 @@
+# anto_modulos/validaciones.py
+# Reglas de validación de un proveedor, compartidas por el formulario y la importación masiva.
+
+from __future__ import annotations
+import re
+from typing import Mapping, Optional
+
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Largo máximo de cada campo según los parámetros de AntoInsert/AntoUpdate_Proveedores
+LONGITUDES_MAXIMAS = {
+    "razon_social": 200,
+    "provincia": 50,
+    "localidad": 50,
+    "calle": 50,
+    "calle_nro": 6,
+    "dpto": 50,
+    "piso": 50,
+    "email": 50,
+    "condicion_cta": 30,
+    "condicion_afip": 30,
+    "condicion_dgr": 30,
+    "condicion_gcia": 30,
+    "condicion_empleador": 30,
+    "forma_juridica": 80,
+}
+
+
+def not_empty(text: Optional[str]) -> bool:
+    return bool(text and text.strip())
+
+
+def cuil_valido(cuil: Optional[str]) -> bool:
+    """11 dígitos con dígito verificador correcto (módulo 11)."""
+    cuil = (cuil or "").strip()
+    if len(cuil) != 11 or not cuil.isdigit():
+        return False
+    suma = sum(int(d) * p for d, p in zip(cuil[:10], (5, 4, 3, 2, 7, 6, 5, 4, 3, 2)))
+    verificador = 11 - suma % 11
+    verificador = {11: 0, 10: 9}.get(verificador, verificador)
+    return verificador == int(cuil[10])
+
+
+def email_valido(email: Optional[str]) -> bool:
+    return not email or bool(EMAIL_RE.match(email))
+
+
+def validar_proveedor(
+    datos: Mapping[str, Optional[str]],
+    *,
+    controlar_longitudes: bool = False,
+    parcial: bool = False,
+) -> Optional[str]:
+    """
+    Valida los campos de un proveedor (claves como en COLUMNAS_PROVEEDOR + "cuil").
+    Con ``parcial=True`` solo se validan los campos presentes (el CUIL siempre).
+    Devuelve el mensaje de error o None si es válido.
+    """
+    cuil = (datos.get("cuil") or "").strip()
+    if len(cuil) != 11 or not cuil.isdigit():
+        return "El CUIL debe tener exactamente 11 dígitos numéricos."
+    for clave, mensaje in (
+        ("razon_social", "La Razón Social no puede estar vacía."),
+        ("localidad", "La Localidad no puede estar vacía."),
+        ("calle", "La Calle no puede estar vacía."),
+    ):
+        if (not parcial or clave in datos) and not not_empty(datos.get(clave)):
+            return mensaje
+    if not email_valido((datos.get("email") or "").strip()):
+        return "El Email no es válido."
+    if controlar_longitudes:
+        for clave, maximo in LONGITUDES_MAXIMAS.items():
+            valor = datos.get(clave)
+            if valor and len(valor) > maximo:
+                return f"El campo {clave} supera los {maximo} caracteres."
+    return None
@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+# Benchmarks offline sobre un pyodbc simulado (ver correr.py y pyodbc_falso.py).
@@ -0,0 +1,380 @@
+# benchmarks/correr.py
+# Suite de benchmarks offline: corre la capa de datos y el formulario reales
+# contra pyodbc_falso (SQLite en memoria + latencia inyectada), sin SQL Server.
+#
+# Escenarios:
+#   busqueda      latencia de buscar_proveedor() yendo siempre a la base
+#   cache         accesos con distribución sesgada: ratio de hits y latencia hit/miss
+#   alta          insertar_nuevo_registro() (operaciones/s)
+#   actualizacion actualizar_registro() y actualizar_campos() (operaciones/s)
+#   importacion   importar_archivo() y fusionar_archivo() sobre un CSV (filas/s)
+#   formulario    construcción de VentanaNuevo y mostrar_datos() (Qt offscreen)
+#   acceso        evaluar_permisos() con las tres condiciones en un lote
+#
+# Los resultados se guardan en JSON (benchmarks/resultados/) con el commit
+# actual; --comparar muestra la diferencia contra otro JSON y marca regresiones.
+#
+# Uso:
+#   python -m benchmarks.correr
+#   python -m benchmarks.correr --latencia-ms 2 --filas 50000 --solo busqueda cache
+#   python -m benchmarks.correr --comparar benchmarks/resultados/base.json --fallar-si-empeora
+
+from __future__ import annotations
+import argparse
+import csv
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from benchmarks import pyodbc_falso
+
+# La app importa pyodbc al cargar sus módulos: instalar el simulado antes.
+sys.modules["pyodbc"] = pyodbc_falso
+os.environ["LOCALAPPDATA"] = tempfile.mkdtemp(prefix="proveedores-bench-")  # cache de drivers, logs
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from anto_modulos import anto_conexion  # noqa: E402
+from anto_modulos.importacion import fusionar_archivo, importar_archivo  # noqa: E402
+
+# ─── Configuración ────────────────────────────────────────────────────────────
+CARPETA_RESULTADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resultados")
+FILAS_BASE = 20000        # proveedores precargados
+SEMILLA = 1234
+UMBRAL_REGRESION = 0.15   # 15 %: por debajo se considera ruido
+
+PROVINCIAS = ("Chaco", "Corrientes", "Formosa", "Misiones", "Santa Fe", "Buenos Aires")
+VALORES = {
+    "CONDICION_CTA": ("Activo", "Baja"),
+    "CONDICION_EN_AFIP": ("Monotributista", "Responsable Inscripto", "Exento", "No Informado"),
+    "CONDICION_DGR": ("Inscripto", "No Inscripto", "Convenio Multilateral"),
+    "CONDICION_GCIA": ("Inscripto", "No Inscripto", "Monotributista"),
+    "CONDICION_EMPLEADOR": ("Empleador", "No Empleador", "No Informado"),
+    "FORMA_JURIDICA": ("Sociedad Anónima", "Responsabilidad Limitada", "Unipersonal", "Cooperativa"),
+}
+
+Escenario = Callable[["Contexto"], Dict[str, Any]]
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Datos sintéticos
+# ─────────────────────────────────────────────────────────────────────
+def cuil_con_verificador(prefijo: int, dni: int) -> str:
+    base = f"{prefijo:02d}{dni:08d}"
+    suma = sum(int(d) * p for d, p in zip(base, (5, 4, 3, 2, 7, 6, 5, 4, 3, 2)))
+    verificador = {11: 0, 10: 9}.get(11 - suma % 11, 11 - suma % 11)
+    return base + str(verificador)
+
+
+class Contexto:
+    """Datos compartidos por los escenarios: CUIL cargados y generador de proveedores."""
+
+    def __init__(self, filas: int, semilla: int) -> None:
+        self.rng = random.Random(semilla)
+        self._proximo_dni = 10_000_000
+        self.carpeta = tempfile.mkdtemp(prefix="proveedores-bench-datos-")
+        pyodbc_falso.reiniciar()
+        self.cuils: List[str] = []
+        lote = [self.fila() for _ in range(filas)]
+        pyodbc_falso.cargar(lote)
+        self.cuils = [f[0] for f in lote]
+
+    def nuevo_cuil(self) -> str:
+        self._proximo_dni += self.rng.randint(1, 50)
+        return cuil_con_verificador(self.rng.choice((20, 23, 27, 30)), self._proximo_dni)
+
+    def fila(self, cuil: Optional[str] = None) -> tuple:
+        """Fila completa en el orden de pyodbc_falso.COLUMNAS."""
+        r = self.rng
+        cuil = cuil or self.nuevo_cuil()
+        return (
+            cuil, f"PROVEEDOR {cuil[2:10]} S.A.", r.choice(PROVINCIAS), f"Localidad {r.randint(1, 300)}",
+            f"Calle {r.randint(1, 900)}", str(r.randint(1, 9999)), "", "",
+            f"contacto{cuil[-4:]}@ejemplo.com",
+            *(r.choice(VALORES[c]) for c in (
+                "CONDICION_CTA", "CONDICION_EN_AFIP", "CONDICION_DGR", "CONDICION_GCIA",
+                "CONDICION_EMPLEADOR", "FORMA_JURIDICA",
+            )),
+            datetime(2024, r.randint(1, 12), r.randint(1, 28)) if r.random() < 0.7 else None,
+            None,
+        )
+
+    def argumentos(self, fila: tuple) -> List[Any]:
+        """Fila → argumentos posicionales de insertar_nuevo_registro/actualizar_registro."""
+        fecha = fila[15].strftime("%Y-%m-%d") if fila[15] else None
+        return [fila[0], *fila[1:15], fecha]
+
+
+def _percentiles(valores_ms: Sequence[float], prefijo: str = "") -> Dict[str, float]:
+    ordenados = sorted(valores_ms)
+    if not ordenados:
+        return {}
+    rango = lambda p: ordenados[max(0, -(-p * len(ordenados) // 100) - 1)]  # noqa: E731
+    return {
+        f"{prefijo}p50_ms": round(rango(50), 4),
+        f"{prefijo}p95_ms": round(rango(95), 4),
+        f"{prefijo}p99_ms": round(rango(99), 4),
+    }
+
+
+def _cronometrar(fn: Callable, *args) -> float:
+    t0 = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - t0) * 1000
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Escenarios
+# ─────────────────────────────────────────────────────────────────────
+def busqueda(ctx: Contexto, n: int = 300) -> Dict[str, Any]:
+    muestra = ctx.rng.sample(ctx.cuils, n)
+    inexistentes = [ctx.nuevo_cuil() for _ in range(n // 4)]
+    t0 = time.perf_counter()
+    latencias = [_cronometrar(anto_conexion.buscar_proveedor, c, True) for c in muestra]
+    total = time.perf_counter() - t0
+    latencias_no = [_cronometrar(anto_conexion.buscar_proveedor, c, True) for c in inexistentes]
+    return {
+        "n": n,
+        **_percentiles(latencias),
+        **_percentiles(latencias_no, "inexistente_"),
+        "ops_por_s": round(n / total, 1),
+    }
+
+
+def cache(ctx: Contexto, accesos: int = 3000, distintos: int = 400) -> Dict[str, Any]:
+    anto_conexion.invalidar_cache()
+    universo = ctx.rng.sample(ctx.cuils, distintos)
+    pesos = [1 / (i + 1) for i in range(distintos)]  # Zipf: pocos CUIL muy consultados
+    hits_ms, misses_ms = [], []
+    for cuil in ctx.rng.choices(universo, weights=pesos, k=accesos):
+        antes = anto_conexion.estadisticas_cache()["hits"]
+        ms = _cronometrar(anto_conexion.buscar_proveedor, cuil)
+        (hits_ms if anto_conexion.estadisticas_cache()["hits"] > antes else misses_ms).append(ms)
+    stats = anto_conexion.estadisticas_cache()
+    return {
+        "accesos": accesos,
+        "distintos": distintos,
+        "ratio_hits": round(stats["ratio_hits"], 4),
+        "desalojadas": stats["desalojadas"],
+        **_percentiles(hits_ms, "hit_"),
+        **_percentiles(misses_ms, "miss_"),
+    }
+
+
+def alta(ctx: Contexto, n: int = 200) -> Dict[str, Any]:
+    filas = [ctx.fila() for _ in range(n)]
+    t0 = time.perf_counter()
+    latencias = [_cronometrar(anto_conexion.insertar_nuevo_registro, *ctx.argumentos(f), None) for f in filas]
+    total = time.perf_counter() - t0
+    ctx.cuils.extend(f[0] for f in filas)
+    return {"n": n, **_percentiles(latencias), "ops_por_s": round(n / total, 1)}
+
+
+def actualizacion(ctx: Contexto, n: int = 200) -> Dict[str, Any]:
+    filas = [ctx.fila(cuil) for cuil in ctx.rng.sample(ctx.cuils, n)]
+    t0 = time.perf_counter()
+    latencias = [_cronometrar(anto_conexion.actualizar_registro, *ctx.argumentos(f)) for f in filas]
+    total = time.perf_counter() - t0
+
+    # Parcial: lo que manda el formulario al editar dos campos
+    t0 = time.perf_counter()
+    parciales = [
+        _cronometrar(anto_conexion.actualizar_campos, f[0], {"provincia": f[2], "email": f[8]}) for f in filas
+    ]
+    total_parcial = time.perf_counter() - t0
+    return {
+        "n": n, **_percentiles(latencias), "ops_por_s": round(n / total, 1),
+        **_percentiles(parciales, "parcial_"), "parcial_ops_por_s": round(n / total_parcial, 1),
+    }
+
+
+def importacion(ctx: Contexto, filas: int = 10000, lote: int = 1000) -> Dict[str, Any]:
+    # Alta: 85 % nuevos, 10 % ya existentes, 5 % inválidos
+    ruta = os.path.join(ctx.carpeta, "alta.csv")
+    with open(ruta, "w", newline="", encoding="utf-8-sig") as f:
+        escritor = csv.writer(f, delimiter=";")
+        escritor.writerow(pyodbc_falso.COLUMNAS[:16])
+        for i in range(filas):
+            azar = ctx.rng.random()
+            fila = list(ctx.fila(ctx.rng.choice(ctx.cuils) if azar < 0.10 else None)[:16])
+            if azar > 0.95:
+                fila[1] = ""  # sin razón social → rechazo
+            fila[15] = fila[15].strftime("%d/%m/%Y") if fila[15] else ""
+            escritor.writerow(fila)
+    resumen = importar_archivo(ruta, lote=lote, ruta_rechazos=os.path.join(ctx.carpeta, "alta.rechazos.csv"))
+
+    # Fusión: CUIL existentes, la mitad con cambios en dos columnas
+    ruta_fusion = os.path.join(ctx.carpeta, "fusion.csv")
+    with open(ruta_fusion, "w", newline="", encoding="utf-8-sig") as f:
+        escritor = csv.writer(f, delimiter=";")
+        escritor.writerow(["CUIL", "LOCALIDAD", "CONDICION_CTA"])
+        for cuil in ctx.rng.sample(ctx.cuils, min(filas, len(ctx.cuils))):
+            if ctx.rng.random() < 0.5:
+                escritor.writerow([cuil, f"Localidad {ctx.rng.randint(301, 600)}", "Baja"])
+            else:
+                escritor.writerow([cuil, "", ""])  # vacío = sin cambio
+    fusion = fusionar_archivo(ruta_fusion, lote=lote, ruta_rechazos=os.path.join(ctx.carpeta, "fusion.rechazos.csv"))
+    return {
+        "filas": filas,
+        "lote": lote,
+        "insertadas": resumen.insertadas,
+        "rechazadas": resumen.rechazadas,
+        "alta_segundos": round(resumen.segundos, 3),
+        "alta_filas_por_s": round(resumen.filas_por_s, 1),
+        "fusion_actualizadas": fusion.actualizadas,
+        "fusion_segundos": round(fusion.segundos, 3),
+        "fusion_filas_por_s": round(fusion.filas_por_s, 1),
+    }
+
+
+def acceso(ctx: Contexto, n: int = 100) -> Dict[str, Any]:
+    from anto_modulos.acceso import evaluar_permisos
+
+    condiciones = ("grupo", "area", "perfil")
+    antes = pyodbc_falso.contadores["idas_vueltas"]
+    decisiones = []
+    latencias = [_cronometrar(lambda: decisiones.append(evaluar_permisos(condiciones))) for _ in range(n)]
+    return {
+        "n": n,
+        "permitido": all(d.permitido for d in decisiones),
+        "idas_vueltas_por_decision": round((pyodbc_falso.contadores["idas_vueltas"] - antes) / n, 2),
+        **_percentiles(latencias),
+    }
+
+
+def formulario(ctx: Contexto, n: int = 200) -> Dict[str, Any]:
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    import main  # noqa: F401  (VentanaNuevo vive en main.py)
+
+    construccion = [_cronometrar(lambda: main.VentanaNuevo().deleteLater()) for _ in range(20)]
+    app.processEvents()
+    ventana = main.VentanaNuevo()
+    datos = [(c, anto_conexion.buscar_proveedor(c)) for c in ctx.rng.sample(ctx.cuils, n)]
+    poblar = [_cronometrar(ventana.mostrar_datos, cuil, d) for cuil, d in datos]
+    ventana.deleteLater()
+    app.processEvents()
+    return {"n": n, **_percentiles(construccion, "construccion_"), **_percentiles(poblar, "poblar_")}
+
+
+ESCENARIOS: Dict[str, Escenario] = {
+    "busqueda": busqueda,
+    "cache": cache,
+    "alta": alta,
+    "actualizacion": actualizacion,
+    "importacion": importacion,
+    "formulario": formulario,
+    "acceso": acceso,
+}
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Resultados y comparación
+# ─────────────────────────────────────────────────────────────────────
+def _commit() -> Dict[str, Any]:
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        sha = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=raiz,
+                             capture_output=True, text=True, check=True).stdout.strip()
+        sucio = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=raiz,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "sucio": None}
+    return {"commit": sha, "sucio": sucio}
+
+
+def _mejor_si(metrica: str) -> Optional[str]:
+    """'menor' / 'mayor' según el tipo de métrica; None si es informativa."""
+    if metrica.endswith("_ms") or metrica.endswith("segundos"):
+        return "menor"
+    if metrica.endswith("_por_s") or metrica == "ratio_hits":
+        return "mayor"
+    return None
+
+
+def comparar(actual: Dict[str, Any], base: Dict[str, Any], umbral: float) -> List[str]:
+    """Imprime las diferencias y devuelve las métricas que empeoraron más que ``umbral``."""
+    regresiones = []
+    print(f"\nComparación contra {base.get('commit') or '?'} ({base.get('fecha', '?')}):")
+    if base.get("parametros") != actual["parametros"]:
+        print(f"  Atención: parámetros distintos ({base.get('parametros')} vs {actual['parametros']})")
+    for escenario, metricas in actual["resultados"].items():
+        previas = base.get("resultados", {}).get(escenario, {})
+        for metrica, valor in metricas.items():
+            sentido, previo = _mejor_si(metrica), previas.get(metrica)
+            if sentido is None or not isinstance(previo, (int, float)) or not previo:
+                continue
+            cambio = (valor - previo) / previo
+            empeora = cambio > umbral if sentido == "menor" else cambio < -umbral
+            marca = "  ← REGRESIÓN" if empeora else ""
+            print(f"  {escenario}.{metrica}: {previo} → {valor} ({cambio:+.1%}){marca}")
+            if empeora:
+                regresiones.append(f"{escenario}.{metrica}")
+    return regresiones
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks offline de la capa de datos y el formulario.")
+    parser.add_argument("--solo", nargs="+", choices=list(ESCENARIOS), help="escenarios a correr")
+    parser.add_argument("--filas", type=int, default=FILAS_BASE, help="proveedores precargados")
+    parser.add_argument("--latencia-ms", type=float, default=pyodbc_falso.LATENCIA_MS,
+                        help="latencia por ida y vuelta a la base")
+    parser.add_argument("--latencia-conexion-ms", type=float, default=pyodbc_falso.LATENCIA_CONEXION_MS,
+                        help="latencia de abrir una conexión")
+    parser.add_argument("--semilla", type=int, default=SEMILLA)
+    parser.add_argument("--salida", help="JSON de resultados (por defecto en benchmarks/resultados/)")
+    parser.add_argument("--comparar", metavar="JSON", help="resultados anteriores contra los que comparar")
+    parser.add_argument("--umbral", type=float, default=UMBRAL_REGRESION, help="cambio tolerado (0.15 = 15 %%)")
+    parser.add_argument("--fallar-si-empeora", action="store_true", help="código de salida 1 si hay regresiones")
+    args = parser.parse_args(argv)
+
+    logging.getLogger("proveedores").setLevel(logging.ERROR)
+    pyodbc_falso.configurar(args.latencia_ms, args.latencia_conexion_ms)
+    ctx = Contexto(args.filas, args.semilla)
+    anto_conexion.calentar_pool()
+
+    resultados: Dict[str, Dict[str, Any]] = {}
+    for nombre in args.solo or list(ESCENARIOS):
+        t0 = time.perf_counter()
+        resultados[nombre] = ESCENARIOS[nombre](ctx)
+        print(f"[benchmarks] {nombre} ({time.perf_counter() - t0:.1f}s): {resultados[nombre]}")
+
+    salida = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        **_commit(),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "parametros": {
+            "filas": args.filas, "latencia_ms": args.latencia_ms,
+            "latencia_conexion_ms": args.latencia_conexion_ms, "semilla": args.semilla,
+        },
+        "pool": anto_conexion.estadisticas_pool(),
+        "idas_vueltas": dict(pyodbc_falso.contadores),
+        "resultados": resultados,
+    }
+    ruta = args.salida or os.path.join(
+        CARPETA_RESULTADOS, f"{datetime.now():%Y%m%d-%H%M%S}-{salida['commit'] or 'sin-git'}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump(salida, f, indent=2, ensure_ascii=False)
+    print(f"[benchmarks] Resultados en {ruta}")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            regresiones = comparar(salida, json.load(f), args.umbral)
+        if regresiones and args.fallar_si_empeora:
+            print(f"[benchmarks] Regresiones: {', '.join(regresiones)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
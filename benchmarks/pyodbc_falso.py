@@ -0,0 +1,383 @@
+# benchmarks/pyodbc_falso.py
+# Reemplazo de pyodbc para correr los benchmarks sin SQL Server.
+#
+# Implementa la parte de la API de pyodbc que usa la aplicación (connect,
+# drivers, Error, Connection y Cursor con fast_executemany) sobre una base
+# SQLite en memoria, con latencia inyectada por ida y vuelta al "servidor":
+#
+#   LATENCIA_CONEXION_MS  cada connect() (handshake + login Trusted_Connection)
+#   LATENCIA_MS           cada execute/executemany/commit/rollback
+#
+# Las sentencias T-SQL que usa la app se traducen a SQLite; los procedimientos
+# almacenados (AntoInsert/AntoUpdate/AntoPage y los de permisos) se emulan
+# en Python con la misma semántica que los .sql de la carpeta sql/. Un lote de
+# varios EXEC devuelve un conjunto de resultados por EXEC (ver nextset()).
+#
+# Uso (antes de importar anto_modulos):
+#   from benchmarks import pyodbc_falso
+#   sys.modules["pyodbc"] = pyodbc_falso
+
+from __future__ import annotations
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# ─── Configuración ────────────────────────────────────────────────────────────
+LATENCIA_MS = 1.0
+LATENCIA_CONEXION_MS = 20.0
+DRIVERS = ["ODBC Driver 17 for SQL Server", "SQL Server"]
+PERFIL = {"usuario": "benchmark", "nombre": "Usuario de benchmark", "area": 720002}
+GRUPOS = {"Gestion"}
+AREAS = [{"cod_nomen": "720002", "DescNom": "Mesa de Entradas y Salidas"}]
+
+COLUMNAS = (
+    "CUIL", "RAZON_SOCIAL", "PROVINCIA", "LOCALIDAD", "CALLE", "CALLE_NRO", "DPTO", "PISO",
+    "EMAIL", "CONDICION_CTA", "CONDICION_EN_AFIP", "CONDICION_DGR", "CONDICION_GCIA",
+    "CONDICION_EMPLEADOR", "FORMA_JURIDICA", "FECHA_ULT_LIB_DEUDA", "DNI_DESDE_CUIT",
+)
+
+# Contadores para los benchmarks (idas y vueltas simuladas)
+contadores: Dict[str, int] = {"conexiones": 0, "idas_vueltas": 0}
+
+
+class Error(Exception):
+    pass
+
+
+class DatabaseError(Error):
+    pass
+
+
+class ProgrammingError(DatabaseError):
+    pass
+
+
+def configurar(latencia_ms: Optional[float] = None, latencia_conexion_ms: Optional[float] = None) -> None:
+    global LATENCIA_MS, LATENCIA_CONEXION_MS
+    if latencia_ms is not None:
+        LATENCIA_MS = latencia_ms
+    if latencia_conexion_ms is not None:
+        LATENCIA_CONEXION_MS = latencia_conexion_ms
+
+
+def _esperar(ms: float) -> None:
+    contadores["idas_vueltas"] += 1
+    if ms > 0:
+        time.sleep(ms / 1000)
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Base SQLite compartida
+# ─────────────────────────────────────────────────────────────────────
+def _charindex(buscado: Any, texto: Any) -> int:
+    if buscado is None or texto is None:
+        return 0
+    return str(texto).find(str(buscado)) + 1
+
+
+sqlite3.register_adapter(datetime, lambda d: d.isoformat(" "))
+sqlite3.register_converter("DATETIME", lambda b: datetime.fromisoformat(b.decode()))
+
+_lock = threading.RLock()
+_db = sqlite3.connect(":memory:", check_same_thread=False, detect_types=sqlite3.PARSE_DECLTYPES)
+_db.create_function("CHARINDEX", 2, _charindex, deterministic=True)
+_db.create_function("ISNULL", 2, lambda v, d: d if v is None else v, deterministic=True)
+
+
+def reiniciar() -> None:
+    """Crea la tabla PROVEEDORES vacía (borra la anterior)."""
+    with _lock:
+        _db.execute("DROP TABLE IF EXISTS PROVEEDORES")
+        definicion = ", ".join(
+            f"{col} {'DATETIME' if col == 'FECHA_ULT_LIB_DEUDA' else 'TEXT'}"
+            + (" PRIMARY KEY" if col == "CUIL" else "")
+            for col in COLUMNAS
+        )
+        _db.execute(f"CREATE TABLE PROVEEDORES ({definicion})")
+        _db.commit()
+        for clave in contadores:
+            contadores[clave] = 0
+
+
+def cargar(filas: Sequence[Sequence[Any]]) -> None:
+    """Inserta filas con todas las columnas de COLUMNAS, sin latencia."""
+    with _lock:
+        _db.executemany(
+            f"INSERT INTO PROVEEDORES ({', '.join(COLUMNAS)}) VALUES ({', '.join('?' for _ in COLUMNAS)})",
+            filas,
+        )
+        _db.commit()
+
+
+def cantidad() -> int:
+    with _lock:
+        return _db.execute("SELECT COUNT(*) FROM PROVEEDORES").fetchone()[0]
+
+
+def drivers() -> List[str]:
+    return list(DRIVERS)
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Traducción T-SQL → SQLite
+# ─────────────────────────────────────────────────────────────────────
+_RE_DROP_TEMP = re.compile(r"IF OBJECT_ID\('tempdb\.\.#(\w+)'\) IS NOT NULL DROP TABLE #\w+;", re.I)
+_RE_SELECT_INTO = re.compile(r"SELECT (?P<columnas>.*?)\s+INTO #(?P<tabla>\w+)\s+(?P<resto>FROM .*)", re.I | re.S)
+_RE_UPDATE_FROM = re.compile(
+    r"UPDATE (?P<alias>\w+) SET (?P<asignaciones>.*?)\s+FROM (?P<tabla>\w+) (?P=alias)\s+"
+    r"JOIN (?P<origen>\S+ \w+) ON (?P<condicion>.*?)\s+(?P<joins>(?:JOIN .*?)?)WHERE (?P<where>.*)",
+    re.I | re.S,
+)
+_RE_EXEC = re.compile(r"^\s*EXEC\s+(?:dbo\.)?(\w+)(.*)$", re.I | re.S)
+_RE_PARAMETRO = re.compile(r"@(\w+)\s*=\s*(\?|NULL)", re.I)
+
+
+def _traducir(sql: str) -> List[str]:
+    """Una sentencia T-SQL de la app → sentencias SQLite."""
+    sql = _RE_DROP_TEMP.sub(lambda m: f"DROP TABLE IF EXISTS temp.{m.group(1)};", sql)
+    sql = re.sub(r"COLLATE DATABASE_DEFAULT", "", sql)
+    sql = re.sub(r"COLLATE Latin1_General_BIN2", "COLLATE BINARY", sql)
+    sql = re.sub(r"TRUNCATE TABLE", "DELETE FROM", sql, flags=re.I)
+    sql = re.sub(r"CREATE TABLE #", "CREATE TEMP TABLE ", sql, flags=re.I)
+    sentencias = []
+    for parte in (p.strip() for p in sql.split(";")):
+        if not parte:
+            continue
+        m = _RE_SELECT_INTO.match(parte)
+        if m:
+            parte = f"CREATE TEMP TABLE {m.group('tabla')} AS SELECT {m.group('columnas')} {m.group('resto')}"
+        m = _RE_UPDATE_FROM.match(parte)
+        if m:
+            alias = m.group("alias")
+            asignaciones = re.sub(rf"\b{alias}\.(\w+)\s*=", r"\1 =", m.group("asignaciones"))
+            parte = (
+                f"UPDATE {m.group('tabla')} AS {alias} SET {asignaciones} "
+                f"FROM {m.group('origen')} {m.group('joins')}"
+                f"WHERE ({m.group('condicion')}) AND ({m.group('where')})"
+            )
+        sentencias.append(parte.replace("#", ""))
+    return sentencias
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Procedimientos almacenados emulados
+# ─────────────────────────────────────────────────────────────────────
+Resultado = Tuple[List[tuple], Optional[list], int]  # (filas, description, rowcount)
+
+
+def _sp_insert(p: Dict[str, Any]) -> Resultado:
+    if _db.execute("SELECT 1 FROM PROVEEDORES WHERE CUIL = ?", (p["CUIL"],)).fetchone():
+        return [], None, -1  # PRINT + RETURN: no inserta (SET NOCOUNT ON)
+    columnas = [c for c in COLUMNAS if c in p]
+    _db.execute(
+        f"INSERT INTO PROVEEDORES ({', '.join(columnas)}) VALUES ({', '.join('?' for _ in columnas)})",
+        [p[c] for c in columnas],
+    )
+    return [], None, 1
+
+
+def _sp_update(p: Dict[str, Any]) -> Resultado:
+    columnas = [c for c in COLUMNAS if c in p and c not in ("CUIL", "DNI_DESDE_CUIT")]
+    cursor = _db.execute(
+        f"UPDATE PROVEEDORES SET {', '.join(f'{c} = ?' for c in columnas)} WHERE CUIL = ?",
+        [p[c] for c in columnas] + [p["CUIL"]],
+    )
+    return [], None, cursor.rowcount
+
+
+def _sp_update_parcial(p: Dict[str, Any]) -> Resultado:
+    # Igual que el SP: solo las columnas de la lista blanca nombradas en @COLUMNAS
+    columnas = [c for c in COLUMNAS[1:16] if f"|{c}|" in (p.get("COLUMNAS") or "")]
+    if columnas:
+        _db.execute(
+            f"UPDATE PROVEEDORES SET {', '.join(f'{c} = ?' for c in columnas)} WHERE CUIL = ?",
+            [p.get(c) for c in columnas] + [p["CUIL"]],
+        )
+    return [], None, -1  # SET NOCOUNT ON
+
+
+def _sp_pagina(p: Dict[str, Any]) -> Resultado:
+    condiciones, valores = ["(? IS NULL OR CUIL > ?)"], [p.get("DESDE_CUIL")] * 2
+    for nombre, lista in p.items():
+        if nombre.startswith("FILTRO_") and lista is not None:
+            columna = nombre[len("FILTRO_"):]
+            condiciones.append(f"CHARINDEX('|' || TRIM(IFNULL({columna}, '')) || '|', ?) > 0")
+            valores.append(lista)
+    cursor = _db.execute(
+        "SELECT CUIL, RAZON_SOCIAL, LOCALIDAD, PROVINCIA, CONDICION_CTA, CONDICION_EN_AFIP "
+        f"FROM PROVEEDORES WHERE {' AND '.join(condiciones)} ORDER BY CUIL LIMIT ?",
+        valores + [p.get("LOTE", 200)],
+    )
+    return cursor.fetchall(), cursor.description, -1
+
+
+def _description(columnas) -> list:
+    return [(c, None, None, None, None, None, None) for c in columnas]
+
+
+def _sp_perfil(_p: Dict[str, Any]) -> Resultado:
+    return [tuple(PERFIL.values())], _description(PERFIL), -1
+
+
+def _sp_tiene_permiso(p: Dict[str, Any]) -> Resultado:
+    return [(1 if p.get("GRUPONT") in GRUPOS else 0,)], _description(["puede"]), -1
+
+
+def _sp_tiene_nomen(_p: Dict[str, Any]) -> Resultado:
+    columnas = list(AREAS[0]) if AREAS else ["cod_nomen", "DescNom"]
+    return [tuple(a[c] for c in columnas) for a in AREAS], _description(columnas), -1
+
+
+PROCEDIMIENTOS: Dict[str, Callable[[Dict[str, Any]], Resultado]] = {
+    "antoinsert_proveedores_by_cuil": _sp_insert,
+    "antoupdate_proveedores": _sp_update,
+    "antoupdateparcial_proveedores": _sp_update_parcial,
+    "antopage_proveedores": _sp_pagina,
+    "perfil_usuario_new": _sp_perfil,
+    "tiene_permiso": _sp_tiene_permiso,
+    "tienenomen": _sp_tiene_nomen,
+}
+
+
+def _parametros_exec(texto: str, valores: Sequence[Any]) -> Dict[str, Any]:
+    resultado, restantes = {}, list(valores)
+    for nombre, marca in _RE_PARAMETRO.findall(texto):
+        resultado[nombre.upper()] = restantes.pop(0) if marca == "?" else None
+    return resultado
+
+
+# ─────────────────────────────────────────────────────────────────────
+# API DB-API / pyodbc
+# ─────────────────────────────────────────────────────────────────────
+class Cursor:
+    def __init__(self, conexion: "Connection") -> None:
+        self.connection = conexion
+        self.fast_executemany = False
+        self.description: Optional[list] = None
+        self.rowcount = -1
+        self._filas: List[tuple] = []
+        self._pos = 0
+        self._pendientes: List[Resultado] = []
+
+    def _cargar(self, resultado: Resultado) -> None:
+        filas, self.description, self.rowcount = resultado
+        self._filas, self._pos = list(filas), 0
+
+    def _ejecutar(self, sql: str, parametros: Sequence[Any]) -> None:
+        execs = [
+            p.strip() for p in sql.split(";")
+            if p.strip() and not re.match(r"SET NOCOUNT ", p.strip(), re.I)
+        ]
+        self._pendientes = []
+        try:
+            with _lock:
+                if execs and all(_RE_EXEC.match(e) for e in execs):
+                    restantes = list(parametros)
+                    for sentencia in execs:
+                        m = _RE_EXEC.match(sentencia)
+                        procedimiento = PROCEDIMIENTOS.get(m.group(1).lower())
+                        if procedimiento is None:
+                            raise ProgrammingError(f"Procedimiento no emulado: {m.group(1)}")
+                        n = m.group(2).count("?")
+                        propios, restantes = restantes[:n], restantes[n:]
+                        self._pendientes.append(procedimiento(_parametros_exec(m.group(2), propios)))
+                    self._cargar(self._pendientes.pop(0))
+                    return
+                sentencias = _traducir(sql)
+                self.description, self.rowcount, self._filas, self._pos = None, -1, [], 0
+                for i, sentencia in enumerate(sentencias):
+                    cursor = _db.execute(sentencia, parametros if i == len(sentencias) - 1 else ())
+                    if cursor.description:
+                        self.description = list(cursor.description)
+                        self._filas = cursor.fetchall()
+                    else:
+                        self.rowcount = cursor.rowcount
+        except sqlite3.Error as e:
+            raise ProgrammingError(f"{e} [{sql.strip()[:120]}]") from e
+
+    def execute(self, sql: str, *parametros: Any) -> "Cursor":
+        if len(parametros) == 1 and isinstance(parametros[0], (list, tuple)):
+            parametros = tuple(parametros[0])
+        _esperar(LATENCIA_MS)
+        self._ejecutar(sql, parametros)
+        return self
+
+    def executemany(self, sql: str, filas: Sequence[Sequence[Any]]) -> None:
+        if self.fast_executemany:
+            _esperar(LATENCIA_MS)  # un solo envío con todos los parámetros
+            try:
+                with _lock:
+                    _db.executemany(_traducir(sql)[-1], filas)
+            except sqlite3.Error as e:
+                raise ProgrammingError(str(e)) from e
+        else:
+            for fila in filas:
+                self.execute(sql, fila)
+
+    def fetchone(self) -> Optional[tuple]:
+        if self._pos >= len(self._filas):
+            return None
+        self._pos += 1
+        return self._filas[self._pos - 1]
+
+    def fetchmany(self, n: int = 1) -> List[tuple]:
+        filas = self._filas[self._pos:self._pos + n]
+        self._pos += len(filas)
+        return filas
+
+    def fetchall(self) -> List[tuple]:
+        filas = self._filas[self._pos:]
+        self._pos = len(self._filas)
+        return filas
+
+    def nextset(self) -> bool:
+        if not self._pendientes:
+            self.description, self._filas = None, []
+            return False
+        self._cargar(self._pendientes.pop(0))
+        return True
+
+    def close(self) -> None:
+        self._filas = []
+
+
+class Connection:
+    def __init__(self) -> None:
+        self.autocommit = False
+        self.closed = False
+
+    def cursor(self) -> Cursor:
+        if self.closed:
+            raise ProgrammingError("Conexión cerrada")
+        return Cursor(self)
+
+    def execute(self, sql: str, *parametros: Any) -> Cursor:
+        return self.cursor().execute(sql, *parametros)
+
+    def commit(self) -> None:
+        _esperar(LATENCIA_MS)
+        with _lock:
+            _db.commit()
+
+    def rollback(self) -> None:
+        _esperar(LATENCIA_MS)
+        with _lock:
+            _db.rollback()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def connect(cadena: str, **_kwargs: Any) -> Connection:
+    driver = re.search(r"DRIVER=\{([^}]*)\}", cadena)
+    if driver and driver.group(1) not in DRIVERS:
+        raise Error(f"Driver no instalado: {driver.group(1)}")
+    _esperar(LATENCIA_CONEXION_MS)
+    contadores["conexiones"] += 1
+    return Connection()
+
+
+reiniciar()
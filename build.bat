@@ -5,7 +5,7 @@ set APP_NAME=main
 set DIST_DIR=dist
 set BUILD_DIR=build
 
-echo [1/3] Limpiando version anterior...
+echo [1/4] Limpiando version anterior...
 if exist "%DIST_DIR%\%APP_NAME%" (
     rmdir /s /q "%DIST_DIR%\%APP_NAME%"
     echo      Eliminado: %DIST_DIR%\%APP_NAME%
@@ -15,12 +15,19 @@ if exist "%BUILD_DIR%\%APP_NAME%" (
     echo      Eliminado: %BUILD_DIR%\%APP_NAME%
 )
 
-echo [2/3] Compilando con PyInstaller...
+echo [2/4] Pre-escalando imagenes (Source\escalados)...
+python preescalar_assets.py
+if errorlevel 1 (
+    echo      [AVISO] Faltan variantes: se escalaran en tiempo de ejecucion.
+)
+
+echo [3/4] Compilando con PyInstaller...
 pyinstaller --onedir --noconsole ^
   --optimize 2 ^
   --icon "Source/icon.ico" ^
   --add-data "Source;Source" ^
   --add-data "anto_modulos;anto_modulos" ^
+  --hidden-import pyodbc ^
   --name "%APP_NAME%" ^
   main.py
 
@@ -31,6 +38,6 @@ if errorlevel 1 (
     exit /b 1
 )
 
-echo [3/3] Listo. Ejecutable en: %DIST_DIR%\%APP_NAME%\%APP_NAME%.exe
+echo [4/4] Listo. Ejecutable en: %DIST_DIR%\%APP_NAME%\%APP_NAME%.exe
 echo.
 pause
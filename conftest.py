@@ -0,0 +1,6 @@
+# conftest.py
+# Las pruebas automáticas están en tests/ y corren contra benchmarks/pyodbc_falso.
+# test_permisos.py y test_perfil_usuario.py son diagnósticos manuales contra SQL01
+# (python test_permisos.py): pytest no los recolecta.
+
+collect_ignore = ["test_permisos.py", "test_perfil_usuario.py"]
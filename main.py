@@ -3,55 +3,77 @@
 # main.py
 
 import sys
-import re
+import time
+_INICIO = time.perf_counter()  # referencia para medir el tiempo hasta interactivo
+
+# --profile-startup: medir importaciones desde acá (ver anto_modulos/perfil_arranque.py)
+from anto_modulos import perfil_arranque
+if perfil_arranque.solicitado():
+    perfil_arranque.iniciar(_INICIO)
+
+import logging
 from datetime import datetime
 from typing import Optional, Dict, Any
 
-from PyQt5.QtCore import Qt, QDate, QRegExp, pyqtSignal
-from PyQt5.QtGui import QIcon, QRegExpValidator
+from PyQt5.QtCore import Qt, QDate, QRegExp, QStringListModel, QTimer, pyqtSignal
+from PyQt5.QtGui import QKeySequence, QRegExpValidator
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLineEdit, QPushButton, QLabel, QMessageBox,
-    QFormLayout, QComboBox, QHBoxLayout, QDateEdit, QCheckBox, QScrollArea, QFrame
+    QFormLayout, QComboBox, QHBoxLayout, QDateEdit, QCheckBox, QScrollArea, QFrame, QCompleter,
+    QProgressBar, QTabWidget, QShortcut
 )
 
 from anto_modulos.anto_conexion import (
-    ejecutar_procedimiento_almacenado,
+    buscar_proveedor,
     insertar_nuevo_registro,
-    obtener_datos_por_cuil,
-    actualizar_registro,
+    actualizar_campos,
+    COLUMNAS_PROVEEDOR,
+    conexion,
+    configurar_replica,
+    calentar_pool,
+    estadisticas_cache,
+    estadisticas_pool,
 )
-from anto_modulos.style import STYLE
+from anto_modulos.replica_local import REPLICA_HABILITADA, ReplicaProveedores
+from anto_modulos.indice_cuil import IndiceCUIL, MIN_DIGITOS_PREFIJO
+from anto_modulos.indice_nombres import IndiceNombres
+from anto_modulos import catalogos
+from anto_modulos.tareas_db import EjecutorDB
+from anto_modulos.grilla_proveedores import GrillaProveedores
+from anto_modulos.validaciones import cuil_valido, validar_proveedor
+from anto_modulos.style import aplicar_estilo_app
 from anto_modulos.centrar_ventana import center_on_screen
-from anto_modulos.resources import ICON_MAIN, DATE_ARROW_DOWN
-from anto_modulos.acceso import verificar_acceso
-from anto_modulos.acceso_denegado_dialog import AccesoDenegadoDialog
+from anto_modulos.resources import ICON_MAIN, DATE_ARROW_DOWN, icono
+from anto_modulos.acceso import refresco_pendiente, verificar_acceso
+from anto_modulos.arranque import Arranque
+from anto_modulos.registro import configurar_registro, obtener_logger
+
+perfil_arranque.marcar("importaciones")
 
 # ──────────────────────────────
 # Configuración/Constantes
 # ──────────────────────────────
 DATE_FMT_DB = "yyyy-MM-dd"
+BUSQUEDA_AUTO_MS = 250  # espera tras la última tecla antes de buscar un CUIL completo
+SUGERENCIA_NOMBRE_MS = 150  # espera tras la última tecla antes de buscar por razón social
 DATE_FMT_UI = "dd-MM-yyyy"
-PROVINCIAS = [
-    "Buenos Aires","Catamarca","Chaco","Chubut","Córdoba","Corrientes","Entre Ríos","Formosa","Jujuy",
-    "La Pampa","La Rioja","Mendoza","Misiones","Neuquén","Río Negro","Salta","San Juan","San Luis",
-    "Santa Cruz","Santa Fe","Santiago del Estero","Tierra del Fuego","Tucumán","Ciudad Autónoma de Buenos Aires",
-]
-EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
 # ──────────────────────────────
-# Helpers debug/log
+# Helpers
 # ──────────────────────────────
-def debug(msg: str, data: Any = None) -> None:
-    print(f"[DEBUG] {msg}" + (f" -> {repr(data)}" if data is not None else ""))
-
-def warn(msg: str) -> None:
-    print(f"[WARN] {msg}")
+log = obtener_logger(__name__)
 
 def to_qdate(value: datetime) -> QDate:
     return QDate(value.year, value.month, value.day)
 
-def not_empty(text: str) -> bool:
-    return bool(text and text.strip())
+def texto_antiguedad(segundos: float) -> str:
+    if segundos < 60:
+        return "hace instantes"
+    if segundos < 3600:
+        return f"hace {int(segundos // 60)} min"
+    if segundos < 86400:
+        return f"hace {int(segundos // 3600)} h"
+    return f"hace {int(segundos // 86400)} días"
 
 def keys_of(obj: Any):
     try:
@@ -67,13 +89,18 @@ def keys_of(obj: Any):
 # ──────────────────────────────
 class VentanaNuevo(QWidget):
     guardado = pyqtSignal()  # emitido tras un guardado exitoso
+    registro_guardado = pyqtSignal(str, str)  # (cuil, razón social) del registro guardado
 
-    def __init__(self, parent: Optional[QWidget] = None):
+    def __init__(self, parent: Optional[QWidget] = None, ejecutor: Optional[EjecutorDB] = None):
         super().__init__(parent)
 
+        self.ejecutor = ejecutor or EjecutorDB(self)
         self.datos: Dict = {}
         self._cuil_inicial: str = ""
         self._modo: Optional[str] = None  # "nuevo" | "editar"
+        self._catalogos: Dict[str, catalogos.Catalogo] = {}  # catálogo con el que se llenó cada combo
+        self._fuera_de_catalogo: Dict[str, Dict[str, int]] = {}  # valores de la BD agregados al combo
+        self._originales: Optional[Dict[str, Optional[str]]] = None  # valores al entrar en edición
 
         layout = QFormLayout(self)
 
@@ -89,7 +116,7 @@ class VentanaNuevo(QWidget):
         layout.addRow("CUIL:", self.cuil)
 
         # Provincia
-        self.provincia = QComboBox(self); self.provincia.addItems(PROVINCIAS)
+        self.provincia = self._combo_catalogo("provincia")
         layout.addRow("Provincia:", self.provincia)
 
         # Localidad
@@ -116,38 +143,23 @@ class VentanaNuevo(QWidget):
         self.email = QLineEdit(self); self.email.setPlaceholderText("Ingrese el email")
         layout.addRow("Email:", self.email)
 
-        # Combos de condición
-        self.condicion_cta = QComboBox(self); self.condicion_cta.addItems(["Activo", "Baja"])
+        # Combos de condición (valores desde anto_modulos/catalogos.py)
+        self.condicion_cta = self._combo_catalogo("condicion_cta")
         layout.addRow("Condición CTA:", self.condicion_cta)
 
-        self.condicion_afip = QComboBox(self); self.condicion_afip.addItems([
-            "Monotributista", "No Informado", "Condición B", "Exento",
-            "Responsable Inscripto", "Responsable No Inscripto", "Código Invalido", "Null"
-        ])
+        self.condicion_afip = self._combo_catalogo("condicion_afip")
         layout.addRow("Condición en AFIP:", self.condicion_afip)
 
-        self.condicion_dgr = QComboBox(self); self.condicion_dgr.addItems([
-            "Inscripto", "No Inscripto", "No Informado", "Exento",
-            "No Sujeto a Retención", "Convenio Multilateral", "Condición C", "Null"
-        ])
+        self.condicion_dgr = self._combo_catalogo("condicion_dgr")
         layout.addRow("Condición DGR:", self.condicion_dgr)
 
-        self.condicion_gcia = QComboBox(self); self.condicion_gcia.addItems([
-            "Inscripto", "No Inscripto", "No Informado", "Exento",
-            "Monotributista", "No Sujeto a Retención", "Convenio Multilateral",
-            "Condición D", "Código Inválido", "Null"
-        ])
+        self.condicion_gcia = self._combo_catalogo("condicion_gcia")
         layout.addRow("Condición GCIA:", self.condicion_gcia)
 
-        self.condicion_empleador = QComboBox(self); self.condicion_empleador.addItems(["Empleador", "No Empleador", "No Informado"])
+        self.condicion_empleador = self._combo_catalogo("condicion_empleador")
         layout.addRow("Condición Empleador:", self.condicion_empleador)
 
-        self.forma_juridica = QComboBox(self); self.forma_juridica.addItems([
-            "Persona Jurídica","Colectiva","Responsabilidad Limitada","Sociedad Anónima","Mutual",
-            "Asociación","No Informado","Asociación Civil","Cooperativa","En Formación",
-            "Empresa del Estado","Sociedad de Derecho","No Empleador","Organismo Público",
-            "Agrupación de Colaboración Empresaria","Fundación","Unipersonal","Otros"
-        ])
+        self.forma_juridica = self._combo_catalogo("forma_juridica")
         layout.addRow("Forma Jurídica:", self.forma_juridica)
 
         # Fecha Libre Deuda (opcional — puede enviarse como NULL)
@@ -177,6 +189,19 @@ class VentanaNuevo(QWidget):
         btn_layout.addWidget(self.btn_cancelar)
         layout.addRow(btn_layout)
 
+        # Campos que se marcan como modificados en edición (mismas claves que COLUMNAS_PROVEEDOR)
+        self._widget_de: Dict[str, QWidget] = {
+            clave: getattr(self, clave) for clave, _ in COLUMNAS_PROVEEDOR
+        }
+        for widget in self._widget_de.values():
+            if isinstance(widget, QLineEdit):
+                widget.textChanged.connect(self._actualizar_modificados)
+            elif isinstance(widget, QComboBox):
+                widget.currentIndexChanged.connect(self._actualizar_modificados)
+            else:
+                widget.dateChanged.connect(self._actualizar_modificados)
+        self.chk_sin_fecha.toggled.connect(self._actualizar_modificados)
+
         # Inicia deshabilitado hasta que se busque un CUIL
         self.setEnabled(False)
 
@@ -189,10 +214,11 @@ class VentanaNuevo(QWidget):
         self.cuil.setText(self._cuil_inicial)
         self.datos = datos or {}
         self._modo = None
+        self._dejar_de_seguir_cambios()
         if datos:
             self.cargar_datos(datos)
         self.setEnabled(False)
-        debug("Formulario mostrando datos (bloqueado)", self._cuil_inicial)
+        log.debug("Formulario mostrando datos (bloqueado): %r", self._cuil_inicial)
 
     def activar_nuevo(self, cuil: str) -> None:
         self._limpiar_campos()
@@ -200,27 +226,35 @@ class VentanaNuevo(QWidget):
         self.cuil.setText(self._cuil_inicial)
         self.datos = {}
         self._modo = "nuevo"
+        self._dejar_de_seguir_cambios()
         self.setEnabled(True)
         self._toggle_fecha(self.chk_sin_fecha.isChecked())
-        debug("Formulario activado en modo NUEVO para CUIL", self._cuil_inicial)
+        log.debug("Formulario activado en modo NUEVO para CUIL: %r", self._cuil_inicial)
 
     def activar_editar(self, cuil: str, datos: Dict) -> None:
-        # El panel ya tiene los datos cargados desde mostrar_datos(); solo habilitarlo
+        # Normalmente el panel ya tiene los datos cargados desde mostrar_datos()
         self._cuil_inicial = cuil.strip()
+        cargar = datos is not self.datos
+        if cargar:
+            self._limpiar_campos()
         self.cuil.setText(self._cuil_inicial)
+        if cargar:
+            self.cargar_datos(datos)
         self.datos = datos
         self._modo = "editar"
         self.setEnabled(True)
         self._toggle_fecha(self.chk_sin_fecha.isChecked())
-        debug("Formulario habilitado en modo EDITAR para CUIL", self._cuil_inicial)
+        self._originales = self._valores()  # base para detectar campos modificados
+        log.debug("Formulario habilitado en modo EDITAR para CUIL: %r", self._cuil_inicial)
 
     def desactivar(self) -> None:
         self.setEnabled(False)
+        self._dejar_de_seguir_cambios()
         self._limpiar_campos()
         self._modo = None
         self.datos = {}
         self._cuil_inicial = ""
-        debug("Formulario desactivado")
+        log.debug("Formulario desactivado")
 
     def _limpiar_campos(self) -> None:
         self.razon_social.clear()
@@ -252,27 +286,62 @@ class VentanaNuevo(QWidget):
             self.fecha_ult_lib_deuda.setDate(restaurar)
             self.fecha_ult_lib_deuda.setEnabled(True)
 
+    def _combo_catalogo(self, nombre: str) -> QComboBox:
+        combo = QComboBox(self)
+        combo.setObjectName(nombre)
+        self._llenar_combo(combo)
+        return combo
+
+    def _llenar_combo(self, combo: QComboBox) -> None:
+        nombre = combo.objectName()
+        self._catalogos[nombre] = catalogos.obtener(nombre)
+        self._fuera_de_catalogo[nombre] = {}
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItems(self._catalogos[nombre].valores)
+        combo.blockSignals(False)
+
+    def aplicar_catalogos(self) -> None:
+        """Vuelve a llenar los combos con los catálogos actuales, conservando lo elegido."""
+        for combo in self.findChildren(QComboBox):
+            if combo.objectName() in self._catalogos:
+                elegido = combo.currentText()
+                self._llenar_combo(combo)
+                if elegido:
+                    self.set_combobox_value(combo, elegido)
+
     def set_combobox_value(self, combobox: QComboBox, value: str) -> None:
-        value_norm = (value or "").strip().lower()
-        items_norm = [combobox.itemText(i).strip().lower() for i in range(combobox.count())]
-        if value_norm in items_norm:
-            combobox.setCurrentIndex(items_norm.index(value_norm))
-        else:
-            warn(f"Valor '{value}' no coincide con opciones de ComboBox '{combobox.objectName() or combobox.__class__.__name__}'")
+        nombre = combobox.objectName()
+        indice = self._catalogos[nombre].indice(value)
+        if indice is None:
+            extras = self._fuera_de_catalogo[nombre]
+            indice = extras.get(catalogos.normalizar(value))
+        if indice is None:
+            if not catalogos.normalizar(value):
+                log.warning("Valor vacío para ComboBox %r", nombre)
+                return
+            # Valor de la BD que no está en el catálogo: se agrega para no perderlo al guardar
+            log.warning("Valor %r fuera del catálogo %r: se agrega al combo", value, nombre)
+            combobox.addItem(str(value).strip())
+            indice = combobox.count() - 1
+            extras[catalogos.normalizar(value)] = indice
+        combobox.setCurrentIndex(indice)
 
     def cargar_datos(self, datos: Dict) -> None:
-        debug("cargar_datos() – claves", keys_of(datos))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("cargar_datos() – claves: %r", keys_of(datos))
 
         # No forzar CUIL desde datos si no existe; mantener el del constructor
         cuil_value = (datos.get("cuil") or "").strip() if hasattr(datos, "get") else ""
         if cuil_value:
             if cuil_value != self._cuil_inicial:
-                warn(f"CUIL provisto en datos difiere del buscado: datos={cuil_value} vs buscado={self._cuil_inicial}")
+                log.warning("CUIL provisto en datos difiere del buscado: datos=%s vs buscado=%s",
+                            cuil_value, self._cuil_inicial)
             self.cuil.setText(cuil_value)
         else:
             # La query no devuelve CUIL; usar el valor buscado
             self.cuil.setText(self._cuil_inicial)
-            debug("cargar_datos(): CUIL tomado del buscador", self._cuil_inicial)
+            log.debug("cargar_datos(): CUIL tomado del buscador: %r", self._cuil_inicial)
 
         # Campos texto
         for label, widget, key in [
@@ -286,7 +355,7 @@ class VentanaNuevo(QWidget):
         ]:
             val = (datos.get(key) if hasattr(datos, "get") else None) or ""
             widget.setText(str(val))
-            debug(f"Set campo {label}", val)
+            log.debug("Set campo %s: %r", label, val)
 
         # Combos
         for (combo, key) in [
@@ -300,7 +369,7 @@ class VentanaNuevo(QWidget):
         ]:
             val = (datos.get(key) if hasattr(datos, "get") else None) or ""
             self.set_combobox_value(combo, val)
-            debug(f"Set combo {key}", val)
+            log.debug("Set combo %s: %r", key, val)
 
         # Fecha
         fecha = (datos.get("fecha_ult_lib_deuda") if hasattr(datos, "get") else None)
@@ -308,40 +377,84 @@ class VentanaNuevo(QWidget):
             self._fecha_db = to_qdate(fecha)
             self.chk_sin_fecha.setChecked(False)
             self.fecha_ult_lib_deuda.setDate(self._fecha_db)
-            debug("Set fecha desde datetime", fecha)
+            log.debug("Set fecha desde datetime: %r", fecha)
         elif isinstance(fecha, str):
             qd = QDate.fromString(fecha, DATE_FMT_DB)
             if qd.isValid():
                 self._fecha_db = qd
                 self.chk_sin_fecha.setChecked(False)
                 self.fecha_ult_lib_deuda.setDate(self._fecha_db)
-                debug("Set fecha desde str", fecha)
+                log.debug("Set fecha desde str: %r", fecha)
             else:
                 self._fecha_db = None
                 self.chk_sin_fecha.setChecked(True)
-                warn("Formato de fecha no válido recibido desde DB.")
+                log.warning("Formato de fecha no válido recibido desde DB: %r", fecha)
         else:
             # fecha es None en la DB → marcar "Sin fecha"
             self._fecha_db = None
             self.chk_sin_fecha.setChecked(True)
-            debug("Fecha NULL en DB, sin fecha cargada", None)
+            log.debug("Fecha NULL en DB, sin fecha cargada")
+
+    # ── Campos modificados ──
+
+    def _valores(self) -> Dict[str, Optional[str]]:
+        """Valores a guardar, por clave de COLUMNAS_PROVEEDOR y en ese orden."""
+        valores: Dict[str, Optional[str]] = {}
+        for clave, widget in self._widget_de.items():
+            if isinstance(widget, QLineEdit):
+                valores[clave] = widget.text().strip()
+            elif isinstance(widget, QComboBox):
+                valores[clave] = widget.currentText().strip()
+        if self.chk_sin_fecha.isChecked():
+            if self.datos:  # EDICIÓN: preservar el valor original de la BD
+                fecha_orig = self.datos.get("fecha_ult_lib_deuda") if hasattr(self.datos, "get") else None
+                if isinstance(fecha_orig, datetime):
+                    fecha = fecha_orig.strftime("%Y-%m-%d")
+                elif isinstance(fecha_orig, str) and fecha_orig:
+                    fecha = fecha_orig
+                else:
+                    fecha = None
+            else:  # INSERCIÓN: enviar NULL
+                fecha = None
+        else:
+            fecha = self.fecha_ult_lib_deuda.date().toString(DATE_FMT_DB)
+        valores["fecha_ult_lib_deuda"] = fecha
+        return valores
+
+    def modificados(self) -> Dict[str, Optional[str]]:
+        """Campos cuyo valor difiere del que tenían al entrar en edición."""
+        if self._originales is None:
+            return {}
+        return {clave: valor for clave, valor in self._valores().items() if valor != self._originales.get(clave)}
+
+    def _marcar(self, widget: QWidget, modificado: bool) -> None:
+        if bool(widget.property("modificado")) != modificado:
+            widget.setProperty("modificado", modificado)
+            # La hoja global tiene la regla [modificado="true"]: re-aplicarla a este widget
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+
+    def _actualizar_modificados(self, *_args) -> None:
+        if self._originales is None:
+            return
+        cambios = self.modificados()
+        for clave, widget in self._widget_de.items():
+            self._marcar(widget, clave in cambios)
 
-    def _email_valido(self, email: str) -> bool:
-        return not email or bool(EMAIL_RE.match(email))
+    def _dejar_de_seguir_cambios(self) -> None:
+        self._originales = None
+        for widget in self._widget_de.values():
+            self._marcar(widget, False)
 
     def _validar_formulario(self) -> Optional[str]:
-        cuil = self.cuil.text().strip()
-        if len(cuil) != 11 or not cuil.isdigit():
-            return "El CUIL debe tener exactamente 11 dígitos numéricos."
-        if not not_empty(self.razon_social.text()):
-            return "La Razón Social no puede estar vacía."
-        if not not_empty(self.localidad.text()):
-            return "La Localidad no puede estar vacía."
-        if not not_empty(self.calle.text()):
-            return "La Calle no puede estar vacía."
-        if not self._email_valido(self.email.text().strip()):
-            return "El Email no es válido."
-        return None
+        # Mismas reglas que la importación masiva (anto_modulos/validaciones.py)
+        return validar_proveedor({
+            "cuil": self.cuil.text(),
+            "razon_social": self.razon_social.text(),
+            "localidad": self.localidad.text(),
+            "calle": self.calle.text(),
+            "email": self.email.text(),
+        })
 
     def guardar_nuevo_registro(self) -> None:
         # Validación previa
@@ -350,101 +463,151 @@ class VentanaNuevo(QWidget):
             QMessageBox.critical(self, "Error", msg_error)
             return
 
-        # Recolectar valores
         cuil = self.cuil.text().strip()
-        razon_social = self.razon_social.text().strip()
-        provincia = self.provincia.currentText().strip()
-        localidad = self.localidad.text().strip()
-        calle = self.calle.text().strip()
-        calle_nro = self.calle_nro.text().strip()
-        dpto = self.dpto.text().strip()
-        piso = self.piso.text().strip()
-        email = self.email.text().strip()
-        condicion_cta = self.condicion_cta.currentText().strip()
-        condicion_afip = self.condicion_afip.currentText().strip()
-        condicion_dgr = self.condicion_dgr.currentText().strip()
-        condicion_gcia = self.condicion_gcia.currentText().strip()
-        condicion_empleador = self.condicion_empleador.currentText().strip()
-        forma_juridica = self.forma_juridica.currentText().strip()
-        if self.chk_sin_fecha.isChecked():
-            if self.datos:  # EDICIÓN: preservar el valor original de la BD
-                fecha_orig = self.datos.get("fecha_ult_lib_deuda") if hasattr(self.datos, "get") else None
-                if isinstance(fecha_orig, datetime):
-                    fecha_ult_lib_deuda = fecha_orig.strftime("%Y-%m-%d")
-                elif isinstance(fecha_orig, str) and fecha_orig:
-                    fecha_ult_lib_deuda = fecha_orig
-                else:
-                    fecha_ult_lib_deuda = None
-                debug("Sin fecha marcado en edición, preservando valor original", fecha_ult_lib_deuda)
-            else:  # INSERCIÓN: enviar NULL
-                fecha_ult_lib_deuda = None
+        valores = self._valores()
+        razon_social = valores["razon_social"]
+
+        if self._modo == "editar":
+            cambios = self.modificados()
+            if not cambios:
+                # Nada que enviar: se evita la ida y vuelta (y los triggers del UPDATE)
+                log.info("Guardar sin cambios para %s: no se envía nada", cuil)
+                QMessageBox.information(self, "Sin cambios", "No hay cambios para guardar.")
+                self.mostrar_datos(cuil, self.datos)
+                return
+            funcion, argumentos = actualizar_campos, (cuil, cambios)
         else:
-            fecha_ult_lib_deuda = self.fecha_ult_lib_deuda.date().toString(DATE_FMT_DB)
-
-        print("[DEBUG] Guardar -> modo:", self._modo)
-        print("[DEBUG] Payload:", cuil, razon_social, provincia, localidad, calle, calle_nro,
-              dpto, piso, email, condicion_cta, condicion_afip, condicion_dgr, condicion_gcia,
-              condicion_empleador, forma_juridica, fecha_ult_lib_deuda)
-
-        try:
-            if self._modo == "editar":
-                exito = actualizar_registro(
-                    cuil, razon_social, provincia, localidad, calle, calle_nro, dpto, piso, email,
-                    condicion_cta, condicion_afip, condicion_dgr, condicion_gcia,
-                    condicion_empleador, forma_juridica, fecha_ult_lib_deuda
-                )
-            else:
-                exito = insertar_nuevo_registro(
-                    cuil, razon_social, provincia, localidad, calle, calle_nro, dpto, piso, email,
-                    condicion_cta, condicion_afip, condicion_dgr, condicion_gcia,
-                    condicion_empleador, forma_juridica, fecha_ult_lib_deuda, None
-                )
-        except TypeError as te:
-            print("[ERROR] Firma de función no compatible:", te)
-            QMessageBox.critical(self, "Error", f"Parámetros inválidos al guardar: {te}")
-            return
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Ocurrió un error al guardar: {e}")
-            return
-
+            funcion, argumentos = insertar_nuevo_registro, (cuil, *valores.values(), None)
+        log.debug("Guardar (modo %s): %r", self._modo, argumentos)
+
+        # El guardado corre en un hilo del pool; el panel queda bloqueado hasta la respuesta
+        self.btn_guardar.setEnabled(False)
+        self.btn_cancelar.setEnabled(False)
+        self.ejecutor.ejecutar(
+            funcion, *argumentos,
+            al_terminar=lambda exito: self._guardado_terminado(exito, cuil, razon_social),
+            al_fallar=self._guardado_fallido,
+        )
+
+    def _restaurar_botones(self) -> None:
+        self.btn_guardar.setEnabled(True)
+        self.btn_cancelar.setEnabled(True)
+
+    def _guardado_terminado(self, exito: bool, cuil: str, razon_social: str) -> None:
+        self._restaurar_botones()
         if exito:
             QMessageBox.information(self, "Éxito", "Registro guardado con éxito.")
+            self.registro_guardado.emit(cuil, razon_social)
             self.desactivar()
             self.guardado.emit()
         else:
             QMessageBox.critical(self, "Error", "No se pudo guardar el registro.")
 
+    def _guardado_fallido(self, error: Exception) -> None:
+        self._restaurar_botones()
+        if isinstance(error, TypeError):
+            log.error("Firma de función no compatible: %s", error)
+            QMessageBox.critical(self, "Error", f"Parámetros inválidos al guardar: {error}")
+        else:
+            QMessageBox.critical(self, "Error", f"Ocurrió un error al guardar: {error}")
+
 # ──────────────────────────────
 # Ventana principal
 # ──────────────────────────────
 class CUILSearchApp(QWidget):
-    def __init__(self):
+    def __init__(self, replica: Optional[ReplicaProveedores] = None):
         super().__init__()
+        self.replica = replica
+        self.ejecutor = EjecutorDB(self)  # toda llamada a la base pasa por acá
+        self.indice_cuil = IndiceCUIL(conexion)  # se carga en la primera tecla
+        self.indice_nombres = IndiceNombres(conexion, replica=replica)
         self.init_ui()
 
     def init_ui(self) -> None:
         self.setWindowTitle("Gestión de Proveedores")
         self.setMinimumSize(480, 800)
 
-        root_layout = QVBoxLayout(self)
+        # ── Pestañas: búsqueda/edición y grilla del padrón ──
+        outer_layout = QVBoxLayout(self)
+        outer_layout.setContentsMargins(0, 0, 0, 0)
+        self.tabs = QTabWidget(self)
+        outer_layout.addWidget(self.tabs)
+
+        self.tab_busqueda = QWidget(self)
+        root_layout = QVBoxLayout(self.tab_busqueda)
         root_layout.setSpacing(8)
         root_layout.setContentsMargins(12, 12, 12, 12)
+        self.tabs.addTab(self.tab_busqueda, "Búsqueda")
 
         # ── Búsqueda ──
         search_layout = QHBoxLayout()
         self.cuil_input = QLineEdit(self)
-        self.cuil_input.setPlaceholderText("Ingrese el CUIL (11 dígitos)")
+        self.cuil_input.setPlaceholderText("Ingrese el CUIL (11 dígitos), su inicio o el DNI")
         self.cuil_input.setValidator(QRegExpValidator(QRegExp(r"\d{0,11}"), self))
+        # Sugerencias por prefijo de CUIL / DNI desde el índice en memoria
+        self._sugerencias = QStringListModel(self)
+        self._completer = QCompleter(self._sugerencias, self)
+        self._completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self._completer.setMaxVisibleItems(12)
+        self._completer.activated[str].connect(self._elegir_sugerencia)
+        self.cuil_input.setCompleter(self._completer)
+        self.cuil_input.textEdited.connect(self._sugerir_cuil)
+        # Búsqueda automática al completar 11 dígitos (con antirrebote)
+        self._cuil_mostrado: Optional[str] = None   # CUIL cuyo resultado está en pantalla
+        self._cuil_en_curso: Optional[str] = None   # CUIL con búsqueda pendiente
+        self._busqueda_auto = QTimer(self)
+        self._busqueda_auto.setSingleShot(True)
+        self._busqueda_auto.setInterval(BUSQUEDA_AUTO_MS)
+        self._busqueda_auto.timeout.connect(self._buscar_auto)
+        self.cuil_input.textChanged.connect(self._programar_busqueda)
         search_layout.addWidget(self.cuil_input)
+        # Búsqueda por razón social (índice de trigramas, ver indice_nombres.py)
+        self.nombre_input = QLineEdit(self)
+        self.nombre_input.setPlaceholderText("…o buscar por razón social")
+        self._sugerencias_nombre = QStringListModel(self)
+        self._cuil_de_sugerencia: Dict[str, str] = {}
+        self._completer_nombre = QCompleter(self._sugerencias_nombre, self)
+        self._completer_nombre.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self._completer_nombre.setMaxVisibleItems(12)
+        self._completer_nombre.activated[str].connect(self._elegir_nombre)
+        self.nombre_input.setCompleter(self._completer_nombre)
+        self._sugerencia_nombre = QTimer(self)  # antirrebote: una búsqueda por pausa al tipear
+        self._sugerencia_nombre.setSingleShot(True)
+        self._sugerencia_nombre.setInterval(SUGERENCIA_NOMBRE_MS)
+        self._sugerencia_nombre.timeout.connect(self._sugerir_nombre)
+        self.nombre_input.textEdited.connect(self._sugerencia_nombre.start)
+        search_layout.addWidget(self.nombre_input)
         self.search_button = QPushButton("Buscar", self)
+        self.search_button.setToolTip("Mayús+clic o F5: volver a consultar la base")
         self.search_button.clicked.connect(self.buscar_cuil)
         search_layout.addWidget(self.search_button)
+        QShortcut(QKeySequence("F5"), self, activated=self.recargar_cuil)
         root_layout.addLayout(search_layout)
 
         # ── Resultado y acciones ──
         self.result_label = QLabel("", self)
         root_layout.addWidget(self.result_label)
 
+        # Indicador de actividad mientras haya consultas en curso
+        self.progreso = QProgressBar(self)
+        self.progreso.setRange(0, 0)  # modo indeterminado
+        self.progreso.setMaximumHeight(4)
+        self.progreso.setTextVisible(False)
+        self.progreso.setVisible(False)
+        self.ejecutor.ocupado.connect(self.progreso.setVisible)
+        root_layout.addWidget(self.progreso)
+
+        # ── Antigüedad de la réplica local (solo si está habilitada) ──
+        self.replica_label = QLabel("", self)
+        self.replica_label.setProperty("secundario", True)
+        self.replica_label.setVisible(self.replica is not None)
+        root_layout.addWidget(self.replica_label)
+        if self.replica is not None:
+            self._replica_timer = QTimer(self)
+            self._replica_timer.timeout.connect(self._actualizar_estado_replica)
+            self._replica_timer.start(30_000)
+            self._actualizar_estado_replica()
+
         btn_layout = QHBoxLayout()
         self.nuevo_button = QPushButton("Nuevo", self)
         self.nuevo_button.setObjectName("btnNuevo")
@@ -459,46 +622,166 @@ class CUILSearchApp(QWidget):
         root_layout.addLayout(btn_layout)
 
         # ── Formulario embebido (siempre visible, inicia deshabilitado) ──
-        self.form_panel = VentanaNuevo(parent=self)
+        self.form_panel = VentanaNuevo(parent=self, ejecutor=self.ejecutor)
         self.form_panel.guardado.connect(self._on_guardado)
+        self.form_panel.registro_guardado.connect(self._actualizar_indices)
         scroll = QScrollArea(self)
         scroll.setWidget(self.form_panel)
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
         root_layout.addWidget(scroll)
 
+        # ── Grilla del padrón (carga diferida, se llena al mostrarse) ──
+        self.grilla = GrillaProveedores(self.ejecutor, replica=self.replica, parent=self)
+        self.grilla.cuil_elegido.connect(self._abrir_desde_grilla)
+        self.tabs.addTab(self.grilla, "Padrón")
+
+        # Diagnóstico oculto: tiempos de acceso a datos, pool y cache
+        self._diagnostico = None  # DiagnosticoDialog, se crea al abrirlo
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self, activated=self._abrir_diagnostico)
+
     def showEvent(self, e) -> None:
         super().showEvent(e)
         center_on_screen(self)
 
+    def _abrir_diagnostico(self) -> None:
+        if self._diagnostico is None:
+            from anto_modulos.diagnostico_dialog import DiagnosticoDialog
+            self._diagnostico = DiagnosticoDialog(
+                {"Pool": estadisticas_pool, "Cache": estadisticas_cache}, parent=self
+            )
+        self._diagnostico.actualizar()
+        self._diagnostico.show()
+        self._diagnostico.raise_()
+
+    def actualizar_catalogos(self) -> None:
+        """Consulta la versión de los catálogos en segundo plano; si cambió, rellena los combos."""
+        self.ejecutor.ejecutar(
+            catalogos.actualizar, conexion, clave="catalogos",
+            al_terminar=lambda cambiaron: cambiaron and self.form_panel.aplicar_catalogos(),
+            al_fallar=lambda e: log.warning("No se pudieron actualizar los catálogos: %s", e),
+        )
+
+    def _actualizar_estado_replica(self) -> None:
+        estado = self.replica.estado()
+        if not estado["carga_inicial_completa"]:
+            texto = f"Réplica local: cargando… ({estado['filas']} filas)"
+        else:
+            texto = f"Réplica local: actualizada {texto_antiguedad(estado['antiguedad_s'] or 0)}"
+        if estado["ultimo_error"]:
+            texto += " — sin conexión para sincronizar"
+        self.replica_label.setText(texto)
+
+    def _sugerir_cuil(self, texto: str) -> None:
+        self.indice_cuil.cargar_en_segundo_plano()  # carga diferida / refresco si está vencido
+        if len(texto) < MIN_DIGITOS_PREFIJO or len(texto) == 11 or not self.indice_cuil.listo:
+            self._sugerencias.setStringList([])
+            return
+        self._sugerencias.setStringList(self.indice_cuil.buscar(texto))
+        self._completer.complete()
+
+    def _elegir_sugerencia(self, cuil: str) -> None:
+        self.cuil_input.setText(cuil)
+        self.buscar_cuil()
+
+    def _sugerir_nombre(self) -> None:
+        self.indice_nombres.cargar_en_segundo_plano()
+        # En un hilo: con nombres muy comunes la búsqueda puede superar un frame.
+        # Es en memoria, así que no enciende la barra de "consultando la base".
+        self.ejecutor.ejecutar(
+            self.indice_nombres.buscar, self.nombre_input.text(), clave="nombre",
+            al_terminar=self._mostrar_sugerencias_nombre, indicar_ocupado=False,
+        )
+
+    def _mostrar_sugerencias_nombre(self, resultados) -> None:
+        self._cuil_de_sugerencia = {f"{nombre} — {cuil}": cuil for cuil, nombre, _ in resultados}
+        self._sugerencias_nombre.setStringList(list(self._cuil_de_sugerencia))
+        if resultados:
+            self._completer_nombre.complete()
+
+    def _elegir_nombre(self, sugerencia: str) -> None:
+        cuil = self._cuil_de_sugerencia.get(sugerencia)
+        if cuil:
+            self.cuil_input.setText(cuil)
+            self.buscar_cuil()
+
+    def _programar_busqueda(self, texto: str) -> None:
+        cuil = texto.strip()
+        if len(cuil) == 11 and cuil_valido(cuil):
+            self._busqueda_auto.start()  # reinicia la espera si sigue llegando texto
+            return
+        self._busqueda_auto.stop()
+        if self._cuil_en_curso is not None:
+            # El CUIL cambió: el resultado pendiente ya no sirve
+            self.ejecutor.cancelar("buscar")
+            self._cuil_en_curso = None
+            self.result_label.setText("")
+
+    def _buscar_auto(self) -> None:
+        cuil = self.cuil_input.text().strip()
+        if cuil in (self._cuil_mostrado, self._cuil_en_curso) and not self.form_panel.isEnabled():
+            return  # ya está en pantalla (o por llegar): no repetir la consulta al tipear
+        self._consultar_cuil(refrescar=False)
+
     def buscar_cuil(self) -> None:
+        """
+        Búsqueda pedida por el operador (botón Buscar o sugerencia elegida). Si el
+        CUIL ya está en pantalla o por llegar se reutiliza ese resultado;
+        Mayús+clic fuerza la consulta (igual que recargar_cuil).
+        """
+        self._consultar_cuil(refrescar=bool(QApplication.keyboardModifiers() & Qt.ShiftModifier))
+
+    def recargar_cuil(self) -> None:
+        """Vuelve a consultar SQL01 sin cache (F5), p. ej. tras cambios de otro usuario."""
+        self._consultar_cuil(refrescar=True)
+
+    def _consultar_cuil(self, refrescar: bool) -> None:
+        self._busqueda_auto.stop()
         cuil = self.cuil_input.text().strip()
-        debug("Buscar CUIL", cuil)
         if len(cuil) != 11:
             QMessageBox.critical(self, "Error", "El CUIL debe tener 11 dígitos.")
             return
+        if not refrescar:
+            if cuil == self._cuil_en_curso:
+                return  # la búsqueda automática ya lo está trayendo
+            if cuil == self._cuil_mostrado:
+                # Ya se trajo: mostrarlo otra vez sin ir a la base
+                if self.form_panel.isEnabled():
+                    self.form_panel.desactivar()
+                self._mostrar_resultado(cuil, getattr(self, "_datos_cache", None))
+                return
+        log.debug("Buscar CUIL: %r%s", cuil, " (refrescar)" if refrescar else "")
 
         # Desactivar formulario si estaba activo
         if self.form_panel.isEnabled():
             self.form_panel.desactivar()
 
-        try:
-            resultado = ejecutar_procedimiento_almacenado(cuil)
-            debug("Resultado SP existe?", resultado)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error al consultar: {e}")
-            return
+        self.result_label.setText(f"Buscando CUIL {cuil}…")
+        self.nuevo_button.setEnabled(False)
+        self.editar_button.setEnabled(False)
+        self._cuil_mostrado = None
+        self._cuil_en_curso = cuil
+        # Una búsqueda nueva reemplaza a la anterior si todavía no respondió
+        self.ejecutor.ejecutar(
+            buscar_proveedor, cuil, refrescar, clave="buscar",  # una sola consulta: registro completo o None
+            al_terminar=lambda datos: self._mostrar_resultado(cuil, datos),
+            al_fallar=self._busqueda_fallida,
+        )
+
+    def _busqueda_fallida(self, error: Exception) -> None:
+        self._cuil_en_curso = None
+        self.result_label.setText("")
+        QMessageBox.critical(self, "Error", f"Error al consultar: {error}")
 
-        if resultado == 1:
+    def _mostrar_resultado(self, cuil: str, datos: Optional[Dict]) -> None:
+        log.debug("Resultado búsqueda encontrado?: %r", datos is not None)
+        self._cuil_en_curso = None
+        self._cuil_mostrado = cuil
+        if datos:
             self.result_label.setText(f"CUIL {cuil} encontrado en la base de datos.")
             self.editar_button.setEnabled(True)
             self.nuevo_button.setEnabled(False)
             # Cargar datos en el panel (deshabilitado, solo lectura visual)
-            try:
-                datos = obtener_datos_por_cuil(cuil)
-            except Exception as e:
-                datos = None
-                warn(f"No se pudieron precargar datos: {e}")
             self.form_panel.mostrar_datos(cuil, datos)
             self._datos_cache = datos  # guardar para no re-consultar al editar
         else:
@@ -510,28 +793,42 @@ class CUILSearchApp(QWidget):
 
     def _activar_nuevo(self) -> None:
         cuil = self.cuil_input.text().strip()
-        debug("Activar NUEVO para CUIL", cuil)
+        log.debug("Activar NUEVO para CUIL: %r", cuil)
         self.form_panel.activar_nuevo(cuil)
 
     def _activar_editar(self) -> None:
         cuil = self.cuil_input.text().strip()
         datos = getattr(self, "_datos_cache", None)
-        if datos:
+        if datos and cuil == self._cuil_mostrado:
             self.form_panel.activar_editar(cuil, datos)
         else:
             # Fallback: re-consultar si el cache no está
-            debug("Cache vacío, re-consultando datos para CUIL", cuil)
-            try:
-                datos = obtener_datos_por_cuil(cuil)
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error al obtener datos: {e}")
-                return
-            if datos:
-                self.form_panel.activar_editar(cuil, datos)
-            else:
-                QMessageBox.critical(self, "Error", "No se pudieron cargar los datos para editar.")
+            log.debug("Cache vacío, re-consultando datos para CUIL: %r", cuil)
+            self.ejecutor.ejecutar(
+                buscar_proveedor, cuil, clave="buscar",
+                al_terminar=lambda datos: self._editar_con_datos(cuil, datos),
+                al_fallar=lambda e: QMessageBox.critical(self, "Error", f"Error al obtener datos: {e}"),
+            )
+
+    def _editar_con_datos(self, cuil: str, datos: Optional[Dict]) -> None:
+        if datos:
+            self.form_panel.activar_editar(cuil, datos)
+        else:
+            QMessageBox.critical(self, "Error", "No se pudieron cargar los datos para editar.")
+
+    def _actualizar_indices(self, cuil: str, razon_social: str) -> None:
+        self.indice_cuil.agregar(cuil)  # no-op si ya estaba
+        self.indice_nombres.actualizar(cuil, razon_social)
+
+    def _abrir_desde_grilla(self, cuil: str) -> None:
+        self.tabs.setCurrentWidget(self.tab_busqueda)
+        if self.form_panel.isEnabled():
+            self.form_panel.desactivar()
+        self.cuil_input.setText(cuil)
+        self.buscar_cuil()
 
     def _on_guardado(self) -> None:
+        self._cuil_mostrado = None
         self.nuevo_button.setEnabled(False)
         self.editar_button.setEnabled(False)
         self.result_label.setText("")
@@ -541,20 +838,46 @@ class CUILSearchApp(QWidget):
 # Main
 # ──────────────────────────────
 if __name__ == "__main__":
+    configurar_registro()
     app = QApplication(sys.argv)
-    app.setStyleSheet(STYLE)
-
-    # ── Control de acceso ──────────────────────────────────────
-    acceso, usuario, perfil = verificar_acceso()
-    if not acceso:
+    perfil_arranque.marcar("qapplication")
+    aplicar_estilo_app(app)
+    perfil_arranque.marcar("estilo")
+
+    def construir_ventana() -> CUILSearchApp:
+        replica = None
+        if REPLICA_HABILITADA:
+            replica = ReplicaProveedores(conexion)
+            configurar_replica(replica)
+        win = CUILSearchApp(replica=replica)
+        win.setWindowIcon(icono(ICON_MAIN))
+        return win
+
+    def reportar_perfil() -> None:
+        if perfil_arranque.activo():
+            perfil_arranque.marcar("interactivo")
+            log.info("Perfil de arranque en %s", perfil_arranque.escribir_reporte(arranque.fases))
+
+    def acceso_permitido(win: CUILSearchApp) -> None:
+        reportar_perfil()
+        if win.replica is not None:
+            win.replica.iniciar()  # sincroniza con SQL01 solo si el usuario tiene acceso
+        win.actualizar_catalogos()
+
+    def acceso_denegado(usuario: str, perfil: dict) -> None:
+        reportar_perfil()
+        # Diferido: el diálogo (y QMovie para el GIF) solo se cargan si se deniega el acceso
+        from anto_modulos.acceso_denegado_dialog import AccesoDenegadoDialog
         dlg = AccesoDenegadoDialog(usuario=usuario, perfil=perfil)
         center_on_screen(dlg)
         dlg.exec_()
-        sys.exit(0)
-    # ───────────────────────────────────────────────────────────
 
-    win = CUILSearchApp()
-    win.setWindowIcon(QIcon(ICON_MAIN))
-    win.show()
+    # Splash inmediato; acceso y pool en paralelo con la construcción de la ventana.
+    # Solo mostrarla espera la decisión de acceso (ver anto_modulos/arranque.py).
+    arranque = Arranque(
+        app, construir_ventana, verificar_acceso,
+        calentar=calentar_pool, al_denegar=acceso_denegado, al_permitir=acceso_permitido,
+        inicio=_INICIO, refresco=refresco_pendiente,
+    )
+    arranque.iniciar()
     sys.exit(app.exec_())
-
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# coding: utf-8
+# preescalar_assets.py — Genera las variantes pre-escaladas de Source/ que usa
+# la aplicación (resources.ESCALADOS) en Source/escalados.
+#
+# Se corre al compilar (build.bat), antes de PyInstaller. Con las variantes en
+# disco el diálogo de acceso denegado no reescala cada frame del GIF en tiempo
+# de ejecución y decodifica frames chicos.
+#
+# Los GIF animados requieren Pillow (pip install pillow); las imágenes fijas se
+# escalan con Qt si Pillow no está. Si falta algo, la app escala en ejecución.
+#
+# Uso: python preescalar_assets.py [--forzar]
+
+import argparse
+import os
+import sys
+
+from anto_modulos.resources import ESCALADOS, resource_path, ruta_escalada
+
+try:
+    from PIL import Image, ImageSequence
+except ImportError:  # opcional: solo hace falta para los GIF animados
+    Image = None
+
+_app = None  # QGuiApplication para escalar con Qt si no hay Pillow
+
+
+def _tamano(ancho: int, alto: int, alto_destino: int) -> tuple:
+    return max(1, round(ancho * alto_destino / alto)), alto_destino
+
+
+def _escalar_pillow(origen: str, destino: str, alto: int) -> None:
+    with Image.open(origen) as imagen:
+        tamano = _tamano(*imagen.size, alto)
+        if getattr(imagen, "is_animated", False):
+            frames, duraciones = [], []
+            for frame in ImageSequence.Iterator(imagen):
+                frames.append(frame.convert("RGBA").resize(tamano, Image.LANCZOS))
+                duraciones.append(frame.info.get("duration", imagen.info.get("duration", 100)))
+            frames[0].save(
+                destino, save_all=True, append_images=frames[1:], duration=duraciones,
+                loop=imagen.info.get("loop", 0), disposal=2, optimize=True,
+            )
+        else:
+            imagen.resize(tamano, Image.LANCZOS).save(destino, optimize=True)
+
+
+def _escalar_qt(origen: str, destino: str, alto: int) -> bool:
+    from PyQt5.QtCore import QSize
+    from PyQt5.QtGui import QGuiApplication, QImageReader
+
+    global _app
+    _app = QGuiApplication.instance() or QGuiApplication(["preescalar_assets", "-platform", "offscreen"])
+    lector = QImageReader(origen)
+    if lector.supportsAnimation() and lector.imageCount() > 1:
+        return False
+    tamano = lector.size()
+    lector.setScaledSize(QSize(*_tamano(tamano.width(), tamano.height(), alto)))
+    return lector.read().save(destino)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Genera las variantes pre-escaladas de Source/.")
+    parser.add_argument("--forzar", action="store_true", help="regenerar aunque estén al día")
+    args = parser.parse_args()
+
+    os.makedirs(resource_path("Source", "escalados"), exist_ok=True)
+    faltantes = 0
+    for origen, altos in ESCALADOS.items():
+        if not os.path.isfile(origen):
+            print(f"  [AVISO] No existe {origen}")
+            continue
+        for alto in altos:
+            destino = ruta_escalada(origen, alto)
+            if not args.forzar and os.path.isfile(destino) \
+                    and os.path.getmtime(destino) >= os.path.getmtime(origen):
+                print(f"  al día     {os.path.basename(destino)}")
+                continue
+            if Image is not None:
+                _escalar_pillow(origen, destino, alto)
+            elif not _escalar_qt(origen, destino, alto):
+                print(f"  [AVISO] {os.path.basename(origen)} es animado: instalar Pillow para pre-escalarlo")
+                faltantes += 1
+                continue
+            print(f"  generado   {os.path.basename(destino)}  ({os.path.getsize(destino) / 1024:.0f} KB)")
+    return 1 if faltantes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
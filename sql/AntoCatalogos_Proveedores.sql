@@ -0,0 +1,137 @@
+USE [Gestion]
+GO
+/****** Catálogos de los combos: tabla de referencia + SP con versión ******/
+SET ANSI_NULLS ON
+GO
+SET QUOTED_IDENTIFIER ON
+GO
+
+-- Un registro por valor de combo. CATALOGO = clave usada en anto_modulos/catalogos.py.
+-- ROW_VER cambia en cada INSERT/UPDATE: junto con la cantidad de filas forma la
+-- versión que la aplicación guarda en su cache local.
+IF OBJECT_ID('dbo.PROVEEDORES_CATALOGOS', 'U') IS NULL
+    CREATE TABLE dbo.PROVEEDORES_CATALOGOS (
+        CATALOGO VARCHAR(40)   NOT NULL,
+        VALOR    NVARCHAR(100) NOT NULL,
+        ORDEN    INT           NOT NULL CONSTRAINT DF_PROVEEDORES_CATALOGOS_ORDEN DEFAULT 0,
+        ACTIVO   BIT           NOT NULL CONSTRAINT DF_PROVEEDORES_CATALOGOS_ACTIVO DEFAULT 1,
+        ROW_VER  ROWVERSION,
+        CONSTRAINT PK_PROVEEDORES_CATALOGOS PRIMARY KEY (CATALOGO, VALOR)
+    );
+GO
+
+-- Valores iniciales (los mismos que CATALOGOS_PREDETERMINADOS); no pisa los existentes
+INSERT INTO dbo.PROVEEDORES_CATALOGOS (CATALOGO, VALOR, ORDEN)
+SELECT v.CATALOGO, v.VALOR, v.ORDEN
+FROM (VALUES
+    ('provincia', N'Buenos Aires', 1),
+    ('provincia', N'Catamarca', 2),
+    ('provincia', N'Chaco', 3),
+    ('provincia', N'Chubut', 4),
+    ('provincia', N'Córdoba', 5),
+    ('provincia', N'Corrientes', 6),
+    ('provincia', N'Entre Ríos', 7),
+    ('provincia', N'Formosa', 8),
+    ('provincia', N'Jujuy', 9),
+    ('provincia', N'La Pampa', 10),
+    ('provincia', N'La Rioja', 11),
+    ('provincia', N'Mendoza', 12),
+    ('provincia', N'Misiones', 13),
+    ('provincia', N'Neuquén', 14),
+    ('provincia', N'Río Negro', 15),
+    ('provincia', N'Salta', 16),
+    ('provincia', N'San Juan', 17),
+    ('provincia', N'San Luis', 18),
+    ('provincia', N'Santa Cruz', 19),
+    ('provincia', N'Santa Fe', 20),
+    ('provincia', N'Santiago del Estero', 21),
+    ('provincia', N'Tierra del Fuego', 22),
+    ('provincia', N'Tucumán', 23),
+    ('provincia', N'Ciudad Autónoma de Buenos Aires', 24),
+    ('condicion_cta', N'Activo', 1),
+    ('condicion_cta', N'Baja', 2),
+    ('condicion_afip', N'Monotributista', 1),
+    ('condicion_afip', N'No Informado', 2),
+    ('condicion_afip', N'Condición B', 3),
+    ('condicion_afip', N'Exento', 4),
+    ('condicion_afip', N'Responsable Inscripto', 5),
+    ('condicion_afip', N'Responsable No Inscripto', 6),
+    ('condicion_afip', N'Código Invalido', 7),
+    ('condicion_afip', N'Null', 8),
+    ('condicion_dgr', N'Inscripto', 1),
+    ('condicion_dgr', N'No Inscripto', 2),
+    ('condicion_dgr', N'No Informado', 3),
+    ('condicion_dgr', N'Exento', 4),
+    ('condicion_dgr', N'No Sujeto a Retención', 5),
+    ('condicion_dgr', N'Convenio Multilateral', 6),
+    ('condicion_dgr', N'Condición C', 7),
+    ('condicion_dgr', N'Null', 8),
+    ('condicion_gcia', N'Inscripto', 1),
+    ('condicion_gcia', N'No Inscripto', 2),
+    ('condicion_gcia', N'No Informado', 3),
+    ('condicion_gcia', N'Exento', 4),
+    ('condicion_gcia', N'Monotributista', 5),
+    ('condicion_gcia', N'No Sujeto a Retención', 6),
+    ('condicion_gcia', N'Convenio Multilateral', 7),
+    ('condicion_gcia', N'Condición D', 8),
+    ('condicion_gcia', N'Código Inválido', 9),
+    ('condicion_gcia', N'Null', 10),
+    ('condicion_empleador', N'Empleador', 1),
+    ('condicion_empleador', N'No Empleador', 2),
+    ('condicion_empleador', N'No Informado', 3),
+    ('forma_juridica', N'Persona Jurídica', 1),
+    ('forma_juridica', N'Colectiva', 2),
+    ('forma_juridica', N'Responsabilidad Limitada', 3),
+    ('forma_juridica', N'Sociedad Anónima', 4),
+    ('forma_juridica', N'Mutual', 5),
+    ('forma_juridica', N'Asociación', 6),
+    ('forma_juridica', N'No Informado', 7),
+    ('forma_juridica', N'Asociación Civil', 8),
+    ('forma_juridica', N'Cooperativa', 9),
+    ('forma_juridica', N'En Formación', 10),
+    ('forma_juridica', N'Empresa del Estado', 11),
+    ('forma_juridica', N'Sociedad de Derecho', 12),
+    ('forma_juridica', N'No Empleador', 13),
+    ('forma_juridica', N'Organismo Público', 14),
+    ('forma_juridica', N'Agrupación de Colaboración Empresaria', 15),
+    ('forma_juridica', N'Fundación', 16),
+    ('forma_juridica', N'Unipersonal', 17),
+    ('forma_juridica', N'Otros', 18)
+) AS v (CATALOGO, VALOR, ORDEN)
+WHERE NOT EXISTS (SELECT 1 FROM dbo.PROVEEDORES_CATALOGOS c
+                  WHERE c.CATALOGO = v.CATALOGO AND c.VALOR = v.VALOR);
+GO
+
+IF OBJECT_ID('dbo.AntoCatalogos_Proveedores', 'P') IS NULL
+    EXEC('CREATE PROCEDURE dbo.AntoCatalogos_Proveedores AS RETURN 0');
+GO
+
+-- Primer resultado: VERSION actual de los catálogos.
+-- Segundo resultado (solo si @VERSION difiere): CATALOGO, VALOR activos, en orden.
+-- Así la verificación de "sin cambios" cuesta una fila y una ida y vuelta.
+-- Para dar de baja un valor: ACTIVO = 0 (también cambia la versión).
+ALTER PROCEDURE [dbo].[AntoCatalogos_Proveedores]
+    @VERSION VARCHAR(40) = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    DECLARE @ACTUAL VARCHAR(40);
+    SELECT @ACTUAL = ISNULL(CONVERT(VARCHAR(16), CAST(MAX(ROW_VER) AS BINARY(8)), 2), '0')
+                     + '-' + CAST(COUNT(*) AS VARCHAR(10))
+    FROM dbo.PROVEEDORES_CATALOGOS;
+
+    SELECT @ACTUAL AS VERSION;
+
+    IF @VERSION IS NULL OR @VERSION <> @ACTUAL
+        SELECT CATALOGO, VALOR
+        FROM dbo.PROVEEDORES_CATALOGOS
+        WHERE ACTIVO = 1
+        ORDER BY CATALOGO, ORDEN, VALOR;
+END
+GO
+
+/*
+EXEC dbo.AntoCatalogos_Proveedores;
+EXEC dbo.AntoCatalogos_Proveedores @VERSION = '00000000000007D1-84';
+*/
@@ -0,0 +1,68 @@
+USE [Gestion]
+GO
+/****** Grilla del padrón: paginado por clave (keyset) sobre CUIL ******/
+SET ANSI_NULLS ON
+GO
+SET QUOTED_IDENTIFIER ON
+GO
+
+IF OBJECT_ID('dbo.AntoPage_Proveedores', 'P') IS NULL
+    EXEC('CREATE PROCEDURE dbo.AntoPage_Proveedores AS RETURN 0');
+GO
+
+-- Devuelve hasta @LOTE proveedores con CUIL > @DESDE_CUIL, ordenados por CUIL.
+-- La página siguiente se pide con el último CUIL recibido: el costo es un seek
+-- sobre el índice de CUIL sin importar la profundidad (nunca OFFSET).
+-- @DESDE_CUIL = NULL → primera página.
+--
+-- Filtros por faceta (panel de la grilla): NULL = sin filtro; si no, lista de
+-- valores delimitada por pipes, p. ej. '|Chaco|Corrientes|'. Un valor vacío
+-- ('||') selecciona NULL/vacío. SQL Server 2014 no tiene STRING_SPLIT: se busca
+-- '|valor|' dentro de la lista con CHARINDEX (sin comodines, a diferencia de LIKE).
+ALTER PROCEDURE [dbo].[AntoPage_Proveedores]
+    @DESDE_CUIL                 VARCHAR(11) = NULL,
+    @LOTE                       INT = 200,
+    @FILTRO_PROVINCIA           VARCHAR(MAX) = NULL,
+    @FILTRO_CONDICION_CTA       VARCHAR(MAX) = NULL,
+    @FILTRO_CONDICION_EN_AFIP   VARCHAR(MAX) = NULL,
+    @FILTRO_CONDICION_DGR       VARCHAR(MAX) = NULL,
+    @FILTRO_CONDICION_GCIA      VARCHAR(MAX) = NULL,
+    @FILTRO_CONDICION_EMPLEADOR VARCHAR(MAX) = NULL,
+    @FILTRO_FORMA_JURIDICA      VARCHAR(MAX) = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    SELECT TOP (@LOTE)
+        CUIL,
+        RAZON_SOCIAL,
+        LOCALIDAD,
+        PROVINCIA,
+        CONDICION_CTA,
+        CONDICION_EN_AFIP
+    FROM PROVEEDORES
+    WHERE (@DESDE_CUIL IS NULL OR CUIL > @DESDE_CUIL)
+      AND (@FILTRO_PROVINCIA IS NULL
+           OR CHARINDEX('|' + LTRIM(RTRIM(ISNULL(PROVINCIA, ''))) + '|', @FILTRO_PROVINCIA) > 0)
+      AND (@FILTRO_CONDICION_CTA IS NULL
+           OR CHARINDEX('|' + LTRIM(RTRIM(ISNULL(CONDICION_CTA, ''))) + '|', @FILTRO_CONDICION_CTA) > 0)
+      AND (@FILTRO_CONDICION_EN_AFIP IS NULL
+           OR CHARINDEX('|' + LTRIM(RTRIM(ISNULL(CONDICION_EN_AFIP, ''))) + '|', @FILTRO_CONDICION_EN_AFIP) > 0)
+      AND (@FILTRO_CONDICION_DGR IS NULL
+           OR CHARINDEX('|' + LTRIM(RTRIM(ISNULL(CONDICION_DGR, ''))) + '|', @FILTRO_CONDICION_DGR) > 0)
+      AND (@FILTRO_CONDICION_GCIA IS NULL
+           OR CHARINDEX('|' + LTRIM(RTRIM(ISNULL(CONDICION_GCIA, ''))) + '|', @FILTRO_CONDICION_GCIA) > 0)
+      AND (@FILTRO_CONDICION_EMPLEADOR IS NULL
+           OR CHARINDEX('|' + LTRIM(RTRIM(ISNULL(CONDICION_EMPLEADOR, ''))) + '|', @FILTRO_CONDICION_EMPLEADOR) > 0)
+      AND (@FILTRO_FORMA_JURIDICA IS NULL
+           OR CHARINDEX('|' + LTRIM(RTRIM(ISNULL(FORMA_JURIDICA, ''))) + '|', @FILTRO_FORMA_JURIDICA) > 0)
+    ORDER BY CUIL
+    OPTION (RECOMPILE);  -- plan según qué filtros vienen informados
+END
+GO
+
+/*
+EXEC dbo.AntoPage_Proveedores @DESDE_CUIL = NULL, @LOTE = 10;
+EXEC dbo.AntoPage_Proveedores @DESDE_CUIL = '20123456786', @LOTE = 10;
+EXEC dbo.AntoPage_Proveedores @LOTE = 10, @FILTRO_PROVINCIA = '|Chaco|', @FILTRO_CONDICION_CTA = '|Baja|';
+*/
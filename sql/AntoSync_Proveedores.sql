@@ -0,0 +1,60 @@
+USE [Gestion]
+GO
+/****** Réplica local: marca de agua ROW_VER + SP de sincronización incremental ******/
+SET ANSI_NULLS ON
+GO
+SET QUOTED_IDENTIFIER ON
+GO
+
+-- Columna rowversion: SQL Server la incrementa sola en cada INSERT/UPDATE
+IF COL_LENGTH('dbo.PROVEEDORES', 'ROW_VER') IS NULL
+    ALTER TABLE dbo.PROVEEDORES ADD ROW_VER ROWVERSION;
+GO
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes
+               WHERE name = 'IX_PROVEEDORES_ROW_VER' AND object_id = OBJECT_ID('dbo.PROVEEDORES'))
+    CREATE NONCLUSTERED INDEX IX_PROVEEDORES_ROW_VER ON dbo.PROVEEDORES (ROW_VER);
+GO
+
+IF OBJECT_ID('dbo.AntoSync_Proveedores', 'P') IS NULL
+    EXEC('CREATE PROCEDURE dbo.AntoSync_Proveedores AS RETURN 0');
+GO
+
+-- Devuelve hasta @LOTE filas modificadas después de @DESDE, ordenadas por ROW_VER.
+-- El tope MIN_ACTIVE_ROWVERSION() evita saltear filas de transacciones aún abiertas
+-- (que ya tienen ROW_VER asignado pero todavía no son visibles).
+ALTER PROCEDURE [dbo].[AntoSync_Proveedores]
+    @DESDE BINARY(8),
+    @LOTE  INT = 5000
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    SELECT TOP (@LOTE)
+        CUIL,
+        RAZON_SOCIAL,
+        PROVINCIA,
+        LOCALIDAD,
+        CALLE,
+        CALLE_NRO,
+        DPTO,
+        PISO,
+        EMAIL,
+        CONDICION_CTA,
+        CONDICION_EN_AFIP,
+        CONDICION_DGR,
+        CONDICION_GCIA,
+        CONDICION_EMPLEADOR,
+        FORMA_JURIDICA,
+        FECHA_ULT_LIB_DEUDA,
+        CAST(ROW_VER AS BINARY(8)) AS ROW_VER
+    FROM PROVEEDORES
+    WHERE ROW_VER > @DESDE
+      AND ROW_VER < MIN_ACTIVE_ROWVERSION()
+    ORDER BY ROW_VER;
+END
+GO
+
+/*
+EXEC dbo.AntoSync_Proveedores @DESDE = 0x0000000000000000, @LOTE = 10;
+*/
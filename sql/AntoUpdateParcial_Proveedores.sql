@@ -0,0 +1,111 @@
+USE [Gestion]
+GO
+/****** Actualización parcial: solo las columnas que el operador modificó ******/
+SET ANSI_NULLS ON
+GO
+SET QUOTED_IDENTIFIER ON
+GO
+
+IF OBJECT_ID('dbo.AntoUpdateParcial_Proveedores', 'P') IS NULL
+    EXEC('CREATE PROCEDURE dbo.AntoUpdateParcial_Proveedores AS RETURN 0');
+GO
+
+-- @COLUMNAS: lista delimitada por pipes con las columnas a actualizar, p. ej.
+-- '|PROVINCIA|EMAIL|'. Solo se arma el SET con esas columnas (el resto de la fila
+-- no se reescribe y UPDATE() en los triggers es verdadero solo para ellas).
+--
+-- Lista blanca: los nombres de columna salen de la tabla de valores de abajo,
+-- nunca de @COLUMNAS; un nombre desconocido en @COLUMNAS se ignora. Los valores
+-- viajan como parámetros de sp_executesql (sin concatenar).
+ALTER PROCEDURE [dbo].[AntoUpdateParcial_Proveedores]
+    @CUIL                CHAR(11),
+    @COLUMNAS            VARCHAR(400),
+    @RAZON_SOCIAL        VARCHAR(200) = NULL,
+    @PROVINCIA           VARCHAR(50) = NULL,
+    @LOCALIDAD           VARCHAR(50) = NULL,
+    @CALLE               VARCHAR(50) = NULL,
+    @CALLE_NRO           CHAR(6) = NULL,
+    @DPTO                VARCHAR(50) = NULL,
+    @PISO                VARCHAR(50) = NULL,
+    @EMAIL               VARCHAR(50) = NULL,
+    @CONDICION_CTA       VARCHAR(30) = NULL,
+    @CONDICION_EN_AFIP   VARCHAR(30) = NULL,
+    @CONDICION_DGR       VARCHAR(30) = NULL,
+    @CONDICION_GCIA      VARCHAR(30) = NULL,
+    @CONDICION_EMPLEADOR VARCHAR(30) = NULL,
+    @FORMA_JURIDICA      VARCHAR(80) = NULL,
+    @FECHA_ULT_LIB_DEUDA DATETIME = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    DECLARE @SET NVARCHAR(MAX) = N'';
+    SELECT @SET = @SET + N', ' + QUOTENAME(c.COLUMNA) + N' = @' + c.COLUMNA
+    FROM (VALUES
+            ('RAZON_SOCIAL'),
+            ('PROVINCIA'),
+            ('LOCALIDAD'),
+            ('CALLE'),
+            ('CALLE_NRO'),
+            ('DPTO'),
+            ('PISO'),
+            ('EMAIL'),
+            ('CONDICION_CTA'),
+            ('CONDICION_EN_AFIP'),
+            ('CONDICION_DGR'),
+            ('CONDICION_GCIA'),
+            ('CONDICION_EMPLEADOR'),
+            ('FORMA_JURIDICA'),
+            ('FECHA_ULT_LIB_DEUDA')
+         ) AS c (COLUMNA)
+    WHERE CHARINDEX('|' + c.COLUMNA + '|', @COLUMNAS) > 0;
+
+    IF @SET = N''
+        RETURN 0;
+
+    DECLARE @SQL NVARCHAR(MAX) =
+        N'UPDATE dbo.PROVEEDORES SET ' + STUFF(@SET, 1, 2, N'') + N' WHERE CUIL = @CUIL;';
+    DECLARE @PARAMETROS NVARCHAR(MAX) = N'@CUIL CHAR(11)'
+          + N', @RAZON_SOCIAL VARCHAR(200)'
+          + N', @PROVINCIA VARCHAR(50)'
+          + N', @LOCALIDAD VARCHAR(50)'
+          + N', @CALLE VARCHAR(50)'
+          + N', @CALLE_NRO CHAR(6)'
+          + N', @DPTO VARCHAR(50)'
+          + N', @PISO VARCHAR(50)'
+          + N', @EMAIL VARCHAR(50)'
+          + N', @CONDICION_CTA VARCHAR(30)'
+          + N', @CONDICION_EN_AFIP VARCHAR(30)'
+          + N', @CONDICION_DGR VARCHAR(30)'
+          + N', @CONDICION_GCIA VARCHAR(30)'
+          + N', @CONDICION_EMPLEADOR VARCHAR(30)'
+          + N', @FORMA_JURIDICA VARCHAR(80)'
+          + N', @FECHA_ULT_LIB_DEUDA DATETIME';
+
+    EXEC sp_executesql @SQL, @PARAMETROS,
+        @CUIL = @CUIL,
+        @RAZON_SOCIAL = @RAZON_SOCIAL,
+        @PROVINCIA = @PROVINCIA,
+        @LOCALIDAD = @LOCALIDAD,
+        @CALLE = @CALLE,
+        @CALLE_NRO = @CALLE_NRO,
+        @DPTO = @DPTO,
+        @PISO = @PISO,
+        @EMAIL = @EMAIL,
+        @CONDICION_CTA = @CONDICION_CTA,
+        @CONDICION_EN_AFIP = @CONDICION_EN_AFIP,
+        @CONDICION_DGR = @CONDICION_DGR,
+        @CONDICION_GCIA = @CONDICION_GCIA,
+        @CONDICION_EMPLEADOR = @CONDICION_EMPLEADOR,
+        @FORMA_JURIDICA = @FORMA_JURIDICA,
+        @FECHA_ULT_LIB_DEUDA = @FECHA_ULT_LIB_DEUDA;
+END
+GO
+
+/*
+EXEC dbo.AntoUpdateParcial_Proveedores
+    @CUIL = '20327462561',
+    @COLUMNAS = '|PROVINCIA|EMAIL|',
+    @PROVINCIA = 'Chaco',
+    @EMAIL = 'contacto@ejemplo.com';
+*/
@@ -12,12 +12,9 @@ Columna clave: "area"
 import sys
 import pyodbc
 
+from anto_modulos.odbc_drivers import DRIVERS_PREFERIDOS
+
 # ── Conexión ─────────────────────────────────────────────────────────────────
-DRIVERS_PREFERIDOS = [
-    "SQL Server Native Client 11.0",
-    "SQL Server Native Client 10.0",
-    "SQL Server",
-]
 
 SERVIDOR  = "SQL01"
 BASE      = "Gestion"
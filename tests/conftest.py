@@ -0,0 +1,29 @@
+# tests/conftest.py
+# Fixtures comunes: pyodbc_falso (SQLite en memoria) en lugar del driver real,
+# sin latencia inyectada, y estado de anto_conexion (pool, cache) limpio por prueba.
+
+from __future__ import annotations
+import os
+import sys
+import tempfile
+from typing import Any, Iterator
+
+import pytest
+
+from benchmarks import pyodbc_falso
+
+# La app importa pyodbc al usarlo: instalar el simulado antes de cargar sus módulos.
+sys.modules["pyodbc"] = pyodbc_falso
+os.environ["LOCALAPPDATA"] = tempfile.mkdtemp(prefix="proveedores-tests-")  # cache de drivers, logs
+
+from anto_modulos import anto_conexion  # noqa: E402
+
+
+@pytest.fixture
+def base() -> Iterator[Any]:
+    """Tabla PROVEEDORES vacía; al terminar cierra el pool y vacía el cache."""
+    pyodbc_falso.configurar(latencia_ms=0, latencia_conexion_ms=0)
+    pyodbc_falso.reiniciar()
+    yield pyodbc_falso
+    anto_conexion.cerrar_pool()
+    anto_conexion.invalidar_cache()
@@ -0,0 +1,49 @@
+# tests/datos.py
+# Datos de prueba: CUIL válidos, filas de PROVEEDORES y archivos CSV de importación.
+
+from __future__ import annotations
+import csv
+from typing import Any, List, Optional, Sequence
+
+from benchmarks import pyodbc_falso
+
+
+def cuil(dni: int, prefijo: int = 20) -> str:
+    """CUIL con dígito verificador válido."""
+    base = f"{prefijo:02d}{dni:08d}"
+    suma = sum(int(d) * p for d, p in zip(base, (5, 4, 3, 2, 7, 6, 5, 4, 3, 2)))
+    verificador = {11: 0, 10: 9}.get(11 - suma % 11, 11 - suma % 11)
+    return base + str(verificador)
+
+
+def fila(cuil_: str, **valores: Any) -> tuple:
+    """Fila completa en el orden de pyodbc_falso.COLUMNAS; ``valores`` pisa columnas."""
+    defecto = {
+        "CUIL": cuil_, "RAZON_SOCIAL": f"PROVEEDOR {cuil_[2:10]} S.A.", "PROVINCIA": "Chaco",
+        "LOCALIDAD": "Resistencia", "CALLE": "Av. Sarmiento", "CALLE_NRO": "100",
+        "EMAIL": f"contacto{cuil_[-4:]}@ejemplo.com", "CONDICION_CTA": "Activo",
+        "CONDICION_EN_AFIP": "Monotributista", "CONDICION_DGR": "Inscripto",
+        "CONDICION_GCIA": "Inscripto", "CONDICION_EMPLEADOR": "No",
+        "FORMA_JURIDICA": "Sociedad Anónima",
+    }
+    defecto.update(valores)
+    return tuple(defecto.get(col) for col in pyodbc_falso.COLUMNAS)
+
+
+def escribir_csv(ruta: str, encabezados: Sequence[str], filas: Sequence[Sequence[Any]]) -> str:
+    with open(ruta, "w", newline="", encoding="utf-8-sig") as f:
+        escritor = csv.writer(f, delimiter=";")
+        escritor.writerow(encabezados)
+        escritor.writerows(["" if v is None else v for v in fila_] for fila_ in filas)
+    return ruta
+
+
+def leer_csv(ruta: str) -> List[List[str]]:
+    with open(ruta, newline="", encoding="utf-8-sig") as f:
+        return list(csv.reader(f, delimiter=";"))[1:]
+
+
+def consultar(sql: str, parametros: Optional[Sequence[Any]] = None) -> List[tuple]:
+    """Lee directo de la base simulada, sin pasar por el pool."""
+    with pyodbc_falso._lock:
+        return pyodbc_falso._db.execute(sql, parametros or ()).fetchall()
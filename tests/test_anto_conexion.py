@@ -0,0 +1,44 @@
+# tests/test_anto_conexion.py
+# Capa de datos: búsqueda con cache y actualización parcial de campos.
+
+from datetime import datetime
+
+import pytest
+
+from anto_modulos import anto_conexion
+from tests.datos import consultar, cuil, fila
+
+
+def test_buscar_proveedor_usa_el_cache(base):
+    c = cuil(1)
+    base.cargar([fila(c)])
+    primero = anto_conexion.buscar_proveedor(c)
+    idas = base.contadores["idas_vueltas"]
+    assert anto_conexion.buscar_proveedor(c) == primero
+    assert base.contadores["idas_vueltas"] == idas
+    assert primero["razon_social"] == fila(c)[1]
+
+
+def test_actualizar_campos_toca_solo_las_columnas_pedidas(base):
+    c = cuil(1)
+    base.cargar([fila(c)])
+    anto_conexion.buscar_proveedor(c)  # queda en cache
+
+    assert anto_conexion.actualizar_campos(c, {"localidad": "Fontana", "fecha_ult_lib_deuda": "2024-05-31"})
+
+    localidad, email, fecha = consultar(
+        "SELECT LOCALIDAD, EMAIL, FECHA_ULT_LIB_DEUDA FROM PROVEEDORES WHERE CUIL = ?", (c,)
+    )[0]
+    assert (localidad, email) == ("Fontana", fila(c)[8])
+    assert fecha == datetime(2024, 5, 31)
+    assert anto_conexion.buscar_proveedor(c)["localidad"] == "Fontana"  # el cache se invalidó
+
+
+def test_actualizar_campos_sin_cambios_no_va_a_la_base(base):
+    assert anto_conexion.actualizar_campos(cuil(1), {}) is True
+    assert base.contadores == {"conexiones": 0, "idas_vueltas": 0}
+
+
+def test_actualizar_campos_rechaza_columnas_desconocidas(base):
+    with pytest.raises(ValueError):
+        anto_conexion.actualizar_campos(cuil(1), {"cuil": "20000000001"})
@@ -0,0 +1,56 @@
+# tests/test_cache_lru.py
+# CacheLRU: desalojo LRU, TTL e invalidación por versión/época.
+
+from anto_modulos.cache_lru import CacheLRU
+
+
+def test_desaloja_la_menos_usada():
+    cache = CacheLRU(max_entradas=2, ttl_s=None)
+    cache.guardar("a", 1)
+    cache.guardar("b", 2)
+    cache.obtener("a")
+    cache.guardar("c", 3)
+    assert cache.obtener("b") is None
+    assert (cache.obtener("a"), cache.obtener("c")) == (1, 3)
+    assert cache.estadisticas()["desalojadas"] == 1
+
+
+def test_ttl_vencido_cuenta_como_ausente():
+    cache = CacheLRU(ttl_s=0)
+    cache.guardar("a", 1)
+    assert cache.obtener("a", "nada") == "nada"
+    assert cache.estadisticas()["expiradas"] == 1
+
+
+def test_no_guarda_lectura_anterior_a_una_invalidacion():
+    cache = CacheLRU()
+    version = cache.version("a")
+    cache.invalidar("a")  # una escritura confirmó mientras se leía
+    assert cache.guardar("a", "viejo", version) is False
+    assert cache.obtener("a") is None
+    assert cache.guardar("a", "nuevo", cache.version("a")) is True
+    assert cache.estadisticas()["descartadas"] == 1
+
+
+def test_invalidar_otra_clave_no_afecta():
+    cache = CacheLRU()
+    version = cache.version("a")
+    cache.invalidar("b")
+    assert cache.guardar("a", 1, version) is True
+
+
+def test_limpiar_cambia_de_epoca():
+    cache = CacheLRU()
+    version = cache.version("a")
+    cache.limpiar()
+    assert cache.guardar("a", 1, version) is False
+
+
+def test_versiones_acotadas_invalidan_lecturas_en_curso():
+    cache = CacheLRU(max_entradas=2)
+    version = cache.version("a")
+    for i in range(4 * cache.max_entradas + 1):
+        cache.invalidar(i)
+    assert len(cache._versiones) <= 4 * cache.max_entradas
+    assert cache.guardar("a", 1, version) is False
+    assert cache.guardar("a", 1, cache.version("a")) is True
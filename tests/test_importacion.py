@@ -0,0 +1,96 @@
+# tests/test_importacion.py
+# Importación masiva (alta) y fusión: duplicados, rechazos, tablas temporales y
+# la máscara de columnas cambiadas.
+
+import pytest
+
+from anto_modulos.importacion import fusionar_archivo, importar_archivo, sql_actualizar_mascara
+from benchmarks import pyodbc_falso
+from tests.datos import consultar, cuil, escribir_csv, fila, leer_csv
+
+COLUMNAS_ALTA = pyodbc_falso.COLUMNAS[:16]
+
+
+def _tablas_temporales():
+    return consultar("SELECT name FROM sqlite_temp_master WHERE type = 'table'")
+
+
+def _csv_alta(tmp_path, cuils):
+    return escribir_csv(str(tmp_path / "alta.csv"), COLUMNAS_ALTA, [fila(c)[:16] for c in cuils])
+
+
+@pytest.mark.parametrize("lote", [100, 2])  # mismo lote / lotes distintos
+def test_alta_rechaza_cuil_duplicado_en_el_archivo(base, tmp_path, lote):
+    a, b, c = cuil(1), cuil(2), cuil(3)
+    resumen = importar_archivo(_csv_alta(tmp_path, [a, b, c, a, c]), lote=lote)
+
+    assert (resumen.leidas, resumen.insertadas, resumen.existentes, resumen.rechazadas) == (5, 3, 0, 2)
+    assert leer_csv(resumen.ruta_rechazos) == [
+        ["5", a, "CUIL duplicado en el archivo (ver fila 2)"],
+        ["6", c, "CUIL duplicado en el archivo (ver fila 4)"],
+    ]
+    assert base.cantidad() == 3
+
+
+def test_alta_saltea_existentes_y_rechaza_invalidas(base, tmp_path):
+    existente, nuevo = cuil(1), cuil(2)
+    base.cargar([fila(existente)])
+    invalida = list(fila(cuil(3))[:16])
+    invalida[1] = ""  # sin razón social
+    ruta = escribir_csv(str(tmp_path / "alta.csv"), COLUMNAS_ALTA,
+                        [fila(existente)[:16], fila(nuevo)[:16], invalida, ["123"] + invalida[1:]])
+    rechazos = str(tmp_path / "rechazos.csv")
+
+    resumen = importar_archivo(ruta, ruta_rechazos=rechazos)
+
+    assert (resumen.insertadas, resumen.existentes, resumen.rechazadas) == (1, 1, 2)
+    assert resumen.ruta_rechazos == rechazos
+    filas = leer_csv(rechazos)
+    assert [f[:2] for f in filas] == [["4", cuil(3)], ["5", "123"]]
+    assert all(f[2] for f in filas)
+
+
+def test_alta_borra_la_tabla_temporal(base, tmp_path):
+    importar_archivo(_csv_alta(tmp_path, [cuil(1), cuil(2)]))
+    assert _tablas_temporales() == []
+
+
+def test_alta_borra_la_tabla_temporal_si_falla(base, tmp_path):
+    def progreso(_resumen):
+        raise RuntimeError("cancelado")
+
+    with pytest.raises(RuntimeError):
+        importar_archivo(_csv_alta(tmp_path, [cuil(1), cuil(2), cuil(3)]), lote=1, progreso=progreso)
+    assert _tablas_temporales() == []
+
+
+def test_fusion_actualiza_solo_filas_y_columnas_cambiadas(base, tmp_path):
+    solo_localidad, ambas, igual, vacia, mayusculas = (cuil(i) for i in range(1, 6))
+    base.cargar([fila(c) for c in (solo_localidad, ambas, igual, vacia, mayusculas)])
+    ruta = escribir_csv(str(tmp_path / "fusion.csv"), ["CUIL", "LOCALIDAD", "EMAIL"], [
+        [solo_localidad, "Barranqueras", ""],
+        [ambas, "Fontana", "nuevo@ejemplo.com"],
+        [igual, "Resistencia", fila(igual)[8]],
+        [vacia, "", ""],                            # vacío = sin cambio
+        [mayusculas, "RESISTENCIA", ""],            # solo cambia mayúsculas: también es cambio
+        [cuil(9), "Corrientes", ""],                # no existe
+        [ambas, "Otra", ""],                        # duplicado en el archivo
+    ])
+
+    resumen = fusionar_archivo(ruta, lote=2)
+
+    assert (resumen.actualizadas, resumen.sin_cambios, resumen.inexistentes, resumen.rechazadas) == (3, 2, 1, 1)
+    assert resumen.cambios_por_columna == {"LOCALIDAD": 3, "EMAIL": 1}
+    datos = dict(consultar("SELECT CUIL, LOCALIDAD || '|' || EMAIL FROM PROVEEDORES"))
+    assert datos[solo_localidad] == "Barranqueras|" + fila(solo_localidad)[8]
+    assert datos[ambas] == "Fontana|nuevo@ejemplo.com"
+    assert datos[vacia] == "Resistencia|" + fila(vacia)[8]
+    assert datos[mayusculas].startswith("RESISTENCIA|")
+    assert base.cantidad() == 5
+    assert _tablas_temporales() == []
+
+
+def test_sql_actualizar_mascara_asigna_solo_los_bits_encendidos():
+    sql = sql_actualizar_mascara(["LOCALIDAD", "EMAIL", "PROVINCIA"], 0b101)
+    assert "p.LOCALIDAD = s.LOCALIDAD" in sql and "p.PROVINCIA = s.PROVINCIA" in sql
+    assert "EMAIL" not in sql
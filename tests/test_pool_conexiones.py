@@ -0,0 +1,118 @@
+# tests/test_pool_conexiones.py
+# Pool de conexiones: reutilización, agotamiento, cierre y rollback al devolver.
+
+import threading
+
+import pytest
+
+from anto_modulos.pool_conexiones import PoolAgotadoError, PoolConexiones, es_lectura
+from benchmarks import pyodbc_falso
+
+
+class ConexionContada:
+    """Conexión simulada que cuenta rollbacks y si se cerró."""
+
+    def __init__(self) -> None:
+        self.rollbacks = 0
+        self.cerrada = False
+
+    def cursor(self):
+        return pyodbc_falso.connect("").cursor()
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+    def close(self) -> None:
+        self.cerrada = True
+
+
+@pytest.fixture
+def abiertas():
+    return []
+
+
+@pytest.fixture
+def pool(base, abiertas):
+    def fabrica():
+        conexion = ConexionContada()
+        abiertas.append(conexion)
+        return conexion
+
+    pool = PoolConexiones(fabrica, min_size=0, max_size=2, timeout_s=0.2,
+                          procedimientos_lectura=("TieneNomen",))
+    yield pool
+    pool.cerrar()
+
+
+def test_reutiliza_la_conexion_devuelta(pool, abiertas):
+    with pool.conexion():
+        pass
+    with pool.conexion():
+        pass
+    stats = pool.estadisticas()
+    assert len(abiertas) == 1
+    assert (stats["creadas"], stats["hits"], stats["misses"]) == (1, 1, 1)
+
+
+def test_agotado_espera_y_falla(pool):
+    a, b = pool.obtener(), pool.obtener()
+    with pytest.raises(PoolAgotadoError):
+        pool.obtener(timeout_s=0.05)
+    a.close()
+    b.close()
+
+
+def test_agotado_despierta_al_devolver(pool):
+    a, b = pool.obtener(), pool.obtener()
+    threading.Timer(0.05, a.close).start()
+    c = pool.obtener(timeout_s=2)
+    assert pool.estadisticas()["esperas"] >= 1
+    c.close()
+    b.close()
+
+
+def test_cerrar_descarta_las_prestadas_al_devolverse(pool, abiertas):
+    libre = pool.obtener()
+    prestada = pool.obtener()
+    libre.close()
+    pool.cerrar()
+    assert abiertas[0].cerrada and not abiertas[1].cerrada
+
+    prestada.close()
+    assert abiertas[1].cerrada
+    stats = pool.estadisticas()
+    assert (stats["libres"], stats["total"]) == (0, 0)
+    with pytest.raises(PoolAgotadoError):
+        pool.obtener()
+
+
+def test_rollback_solo_si_hubo_escrituras(pool, abiertas):
+    with pool.conexion() as conn:
+        conn.cursor().execute("SELECT COUNT(*) FROM PROVEEDORES").fetchone()
+        conn.cursor().execute("EXEC dbo.TieneNomen")
+    assert abiertas[0].rollbacks == 0
+
+    with pool.conexion() as conn:
+        conn.cursor().execute("DELETE FROM PROVEEDORES WHERE CUIL = ?", ("1",))
+        conn.commit()
+    assert abiertas[0].rollbacks == 0
+
+    with pool.conexion() as conn:
+        conn.cursor().execute("DELETE FROM PROVEEDORES WHERE CUIL = ?", ("1",))
+    assert abiertas[0].rollbacks == 1
+
+
+@pytest.mark.parametrize("sql, lectura", [
+    ("SELECT 1", True),
+    ("  WITH x AS (SELECT 1) SELECT * FROM x", True),
+    ("SET NOCOUNT ON;\nEXEC dbo.TieneNomen;", True),
+    ("EXEC [dbo].[TieneNomen] @X = ?", True),
+    ("EXEC dbo.AntoUpdate_Proveedores @CUIL = ?", False),
+    ("SELECT 1; DELETE FROM PROVEEDORES", False),
+    ("INSERT INTO PROVEEDORES (CUIL) VALUES (?)", False),
+])
+def test_es_lectura(sql, lectura):
+    assert es_lectura(sql, frozenset({"tienenomen"})) is lectura